@@ -22,6 +22,7 @@ from app.domain.article.model import Article, ArticleTag
 from app.domain.broadcast.model import Broadcast, BroadcastTag
 from app.domain.tag.model import Tag
 from app.domain.subscriber.model import Subscriber
+from app.domain.search.model import SearchDocument
 from app.database.connection import Base
 
 # this is the Alembic Config object, which provides
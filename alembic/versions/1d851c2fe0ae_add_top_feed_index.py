@@ -0,0 +1,38 @@
+"""add top feed index
+
+Revision ID: 1d851c2fe0ae
+Revises: 389038a6f13f
+Create Date: 2026-10-17 05:48:02.917355
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1d851c2fe0ae'
+down_revision: Union[str, Sequence[str], None] = '389038a6f13f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_products_status_top',
+        'products',
+        [
+            'status',
+            sa.text('vote_count DESC'),
+            sa.text('coalesce(approved_at, created_at) DESC'),
+            sa.text('id DESC'),
+        ],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_products_status_top', table_name='products')
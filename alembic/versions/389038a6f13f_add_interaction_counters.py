@@ -0,0 +1,49 @@
+"""add interaction counters to products and papers
+
+Revision ID: 389038a6f13f
+Revises: df9e766e3ea8
+Create Date: 2026-10-17 05:12:31.204118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '389038a6f13f'
+down_revision: Union[str, Sequence[str], None] = 'df9e766e3ea8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_PRODUCT_COUNTERS = {
+    'vote_count': 'product_votes',
+    'bookmark_count': 'product_bookmarks',
+    'investor_interest_count': 'product_investor_interests',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column, table in _PRODUCT_COUNTERS.items():
+        op.add_column('products', sa.Column(column, sa.Integer(), server_default='0', nullable=False))
+        # updated_at is left alone: backfilling a count isn't an edit of the product.
+        op.execute(
+            f"UPDATE products p SET {column} = c.cnt "
+            f"FROM (SELECT product_id, count(*) AS cnt FROM {table} GROUP BY product_id) c "
+            f"WHERE c.product_id = p.id"
+        )
+    op.add_column('papers', sa.Column('vote_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        "UPDATE papers p SET vote_count = c.cnt "
+        "FROM (SELECT paper_id, count(*) AS cnt FROM paper_votes GROUP BY paper_id) c "
+        "WHERE c.paper_id = p.id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('papers', 'vote_count')
+    for column in reversed(list(_PRODUCT_COUNTERS)):
+        op.drop_column('products', column)
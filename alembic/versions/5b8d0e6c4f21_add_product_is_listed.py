@@ -0,0 +1,50 @@
+"""add product is_listed flag and listed feed index
+
+Revision ID: 5b8d0e6c4f21
+Revises: 7c3f2a91b0d4
+Create Date: 2026-10-17 07:41:53.206417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8d0e6c4f21'
+down_revision: Union[str, Sequence[str], None] = '7c3f2a91b0d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('products', sa.Column('is_listed', sa.Boolean(), server_default='true', nullable=False))
+    op.execute("""
+        UPDATE products SET is_listed = false
+        WHERE EXISTS (
+            SELECT 1 FROM product_category
+            JOIN categories ON categories.id = product_category.category_id
+            WHERE product_category.product_id = products.id AND categories.is_hidden_from_all
+        )
+    """)
+    # The search backfill ran before the flag existed; drop the documents of products it just hid.
+    op.execute("""
+        DELETE FROM search_documents
+        WHERE entity_type = 'product'
+          AND entity_id IN (SELECT id FROM products WHERE NOT is_listed)
+    """)
+    op.create_index(
+        'ix_products_listed_feed',
+        'products',
+        [sa.text('coalesce(approved_at, created_at) DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text("status = 'approved' AND deleted_at IS NULL AND is_listed"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_products_listed_feed', table_name='products')
+    op.drop_column('products', 'is_listed')
@@ -0,0 +1,71 @@
+"""add search documents
+
+Revision ID: 7c3f2a91b0d4
+Revises: e468abd4a5eb
+Create Date: 2026-10-17 07:02:15.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3f2a91b0d4'
+down_revision: Union[str, Sequence[str], None] = 'e468abd4a5eb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+search_entity_type = postgresql.ENUM('product', 'article', 'broadcast', 'paper', name='search_entity_type')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'search_documents',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('entity_type', search_entity_type, nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('slug', sa.String(length=255), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('body', sa.Text(), nullable=True),
+        sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', title), 'A') || "
+                "setweight(to_tsvector('english', coalesce(body, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('entity_type', 'entity_id', name='uq_search_documents_entity'),
+    )
+    op.create_index('ix_search_documents_vector', 'search_documents', ['search_vector'], unique=False, postgresql_using='gin')
+
+    # Backfill with the visibility rules of SearchRepository._source().
+    op.execute("""
+        INSERT INTO search_documents (entity_type, entity_id, slug, title, body, published_at)
+        SELECT 'product', id, slug, name, left(concat_ws(E'\\n', short_desc, "desc"), 10000), approved_at
+        FROM products WHERE status = 'approved' AND deleted_at IS NULL
+        UNION ALL
+        SELECT 'article', id, slug, title, left(content, 10000), published_at
+        FROM articles WHERE status = 'published' AND deleted_at IS NULL
+        UNION ALL
+        SELECT 'broadcast', id, slug, title, left(description, 10000), published_at
+        FROM broadcasts WHERE status = 'published' AND deleted_at IS NULL
+        UNION ALL
+        SELECT 'paper', id, slug, title, left(abstract, 10000), published_at
+        FROM papers WHERE verification_status = 'approved'
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_search_documents_vector', table_name='search_documents')
+    op.drop_table('search_documents')
+    op.execute("DROP TYPE IF EXISTS search_entity_type")
@@ -0,0 +1,82 @@
+"""add product launch_at and rebuild feed indexes on it
+
+Revision ID: 9e41c7d2a6b3
+Revises: 5b8d0e6c4f21
+Create Date: 2026-10-17 08:14:27.650981
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e41c7d2a6b3'
+down_revision: Union[str, Sequence[str], None] = '5b8d0e6c4f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_LISTED = "status = 'approved' AND deleted_at IS NULL AND is_listed"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Postgres fills a stored generated column while adding it (one table rewrite), so existing
+    # rows need no separate backfill.
+    op.add_column('products', sa.Column(
+        'launch_at',
+        sa.DateTime(timezone=True),
+        sa.Computed('coalesce(approved_at, created_at)', persisted=True),
+        nullable=False,
+    ))
+    op.drop_index('ix_products_status_top', table_name='products')
+    op.drop_index('ix_products_listed_feed', table_name='products')
+    op.create_index(
+        'ix_products_status_launch',
+        'products',
+        ['status', sa.text('launch_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'ix_products_status_top',
+        'products',
+        ['status', sa.text('vote_count DESC'), sa.text('launch_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_products_listed_feed',
+        'products',
+        [sa.text('launch_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text(_LISTED),
+    )
+    op.create_index('ix_product_category_category', 'product_category', ['category_id', 'product_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_product_category_category', table_name='product_category')
+    op.drop_index('ix_products_listed_feed', table_name='products')
+    op.drop_index('ix_products_status_top', table_name='products')
+    op.drop_index('ix_products_status_launch', table_name='products')
+    op.create_index(
+        'ix_products_listed_feed',
+        'products',
+        [sa.text('coalesce(approved_at, created_at) DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text(_LISTED),
+    )
+    op.create_index(
+        'ix_products_status_top',
+        'products',
+        [
+            'status',
+            sa.text('vote_count DESC'),
+            sa.text('coalesce(approved_at, created_at) DESC'),
+            sa.text('id DESC'),
+        ],
+        unique=False,
+    )
+    op.drop_column('products', 'launch_at')
@@ -7,7 +7,7 @@ from .auth import (
     verify_internal_key,
     get_system_user,
 )
-from .db import get_db
+from .db import get_db, get_read_db
 from .services import (
     get_user_service,
     get_email_service,
@@ -20,6 +20,7 @@ from .services import (
     get_broadcast_service,
     get_subscriber_service,
     get_logo_dev_service,
+    get_search_service,
 )
 
 __all__ = [
@@ -31,6 +32,7 @@ __all__ = [
     "verify_internal_key",
     "get_system_user",
     "get_db",
+    "get_read_db",
     "get_user_service",
     "get_email_service",
     "get_university_service",
@@ -42,4 +44,5 @@ __all__ = [
     "get_broadcast_service",
     "get_subscriber_service",
     "get_logo_dev_service",
+    "get_search_service",
 ]
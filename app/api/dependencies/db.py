@@ -1,6 +1,8 @@
 import asyncio
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.connection import db_manager
+from app.middleware.recent_write import recently_wrote
 
 
 async def get_db():
@@ -9,3 +11,14 @@ async def get_db():
     """
     async with db_manager.session_scope() as session:
         yield session
+
+
+async def get_read_db(request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    FastAPI dependency for read-only endpoints: a session served by a read replica when one is
+    healthy, falling back to the primary for clients that just wrote (see RecentWriteMiddleware)
+    and after anything in this request commits on `db`. Cache fills made through it still read the
+    primary (see reads_on_primary), since their result outlives the request.
+    """
+    async with db_manager.read_session_scope(db, use_primary=recently_wrote(request)) as session:
+        yield session
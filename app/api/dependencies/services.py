@@ -32,6 +32,8 @@ from app.domain.broadcast.service import BroadcastService
 from app.domain.tag.repository import TagRepository
 from app.domain.subscriber.repository import SubscriberRepository
 from app.domain.subscriber.service import SubscriberService
+from app.domain.search.repository import SearchRepository
+from app.domain.search.service import SearchService
 from app.common.storage import R2StorageService
 
 
@@ -126,6 +128,10 @@ def get_tag_repo() -> TagRepository:
     return TagRepository()
 
 
+def get_search_repo() -> SearchRepository:
+    return SearchRepository()
+
+
 # -------------------------
 # Services
 # -------------------------
@@ -137,6 +143,8 @@ def get_user_service(
     sponsor_profile_repo: SponsorProfileRepository = Depends(get_sponsor_profile_repo),
     user_category_repo: UserCategoryRepository = Depends(get_user_category_repo),
     category_repo: CategoryRepository = Depends(get_category_repo),
+    product_repo: ProductRepository = Depends(get_product_repo),
+    paper_repo: PaperRepository = Depends(get_paper_repo),
 ) -> UserService:
     return UserService(
         repo=repo,
@@ -146,6 +154,8 @@ def get_user_service(
         sponsor_profile_repo=sponsor_profile_repo,
         user_category_repo=user_category_repo,
         category_repo=category_repo,
+        product_repo=product_repo,
+        paper_repo=paper_repo,
     )
 
 
@@ -157,9 +167,11 @@ def get_university_service(
 
 def get_category_service(
     repo: CategoryRepository = Depends(get_category_repo),
+    product_repo: ProductRepository = Depends(get_product_repo),
+    search_repo: SearchRepository = Depends(get_search_repo),
     redis: RedisClient = Depends(get_redis_client),
 ) -> CategoryService:
-    return CategoryService(repo=repo, redis=redis)
+    return CategoryService(repo=repo, product_repo=product_repo, search_repo=search_repo, redis=redis)
 
 
 def get_lab_service(
@@ -173,8 +185,10 @@ def get_lab_service(
 def get_paper_service(
     repo: PaperRepository = Depends(get_paper_repo),
     category_repo: CategoryRepository = Depends(get_category_repo),
+    search_repo: SearchRepository = Depends(get_search_repo),
+    redis: RedisClient = Depends(get_redis_client),
 ) -> PaperService:
-    return PaperService(repo=repo, category_repo=category_repo)
+    return PaperService(repo=repo, category_repo=category_repo, search_repo=search_repo, redis=redis)
 
 
 def get_storage_service() -> R2StorageService:
@@ -190,9 +204,13 @@ def get_article_service(
     tag_repo: TagRepository = Depends(get_tag_repo),
     user_repo: UserRepository = Depends(get_user_repo),
     broadcast_repo: BroadcastRepository = Depends(get_broadcast_repo),
+    search_repo: SearchRepository = Depends(get_search_repo),
     redis: RedisClient = Depends(get_redis_client),
 ) -> ArticleService:
-    return ArticleService(repo=repo, tag_repo=tag_repo, user_repo=user_repo, broadcast_repo=broadcast_repo, redis=redis)
+    return ArticleService(
+        repo=repo, tag_repo=tag_repo, user_repo=user_repo, broadcast_repo=broadcast_repo,
+        search_repo=search_repo, redis=redis,
+    )
 
 
 def get_broadcast_service(
@@ -200,9 +218,13 @@ def get_broadcast_service(
     tag_repo: TagRepository = Depends(get_tag_repo),
     user_repo: UserRepository = Depends(get_user_repo),
     article_repo: ArticleRepository = Depends(get_article_repo),
+    search_repo: SearchRepository = Depends(get_search_repo),
     redis: RedisClient = Depends(get_redis_client),
 ) -> BroadcastService:
-    return BroadcastService(repo=repo, tag_repo=tag_repo, user_repo=user_repo, article_repo=article_repo, redis=redis)
+    return BroadcastService(
+        repo=repo, tag_repo=tag_repo, user_repo=user_repo, article_repo=article_repo,
+        search_repo=search_repo, redis=redis,
+    )
 
 
 def get_subscriber_repo() -> SubscriberRepository:
@@ -229,6 +251,7 @@ def get_product_service(
     bounty_repo: BountyRepository = Depends(get_bounty_repo),
     email_service: EmailService = Depends(get_email_service),
     logo_dev_service: LogoDevService = Depends(get_logo_dev_service),
+    search_repo: SearchRepository = Depends(get_search_repo),
     redis: RedisClient = Depends(get_redis_client),
 ) -> ProductService:
     return ProductService(
@@ -244,5 +267,12 @@ def get_product_service(
         bounty_repo=bounty_repo,
         email_service=email_service,
         logo_dev_service=logo_dev_service,
+        search_repo=search_repo,
         redis=redis,
     )
+
+
+def get_search_service(
+    repo: SearchRepository = Depends(get_search_repo),
+) -> SearchService:
+    return SearchService(repo=repo)
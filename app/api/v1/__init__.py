@@ -12,6 +12,7 @@ from .article import router as article_router
 from .broadcast import router as broadcast_router
 from .internal import router as internal_router
 from .subscriber import router as subscriber_router
+from .search import router as search_router
 
 router = APIRouter(
     prefix=settings.api.v1.prefix,
@@ -27,5 +28,6 @@ router.include_router(article_router)
 router.include_router(broadcast_router)
 router.include_router(internal_router)
 router.include_router(subscriber_router)
+router.include_router(search_router)
 
 __all__ = ["router"]
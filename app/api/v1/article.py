@@ -1,15 +1,16 @@
 from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_article_service, get_db, require_admin_user
+from app.api.dependencies import get_article_service, get_db, get_read_db, require_admin_user
 from app.common.permissions import is_admin
 from app.api.dependencies.auth import get_optional_user
 from app.api.dependencies.integrations import get_redis_client
 from app.infrastructure.redis.client import RedisClient
-from app.common.cache_keys import ARTICLE_DETAIL_PREFIX, ARTICLE_DETAIL_TTL, ARTICLE_LIST_PREFIX, ARTICLE_LIST_TTL
-from app.common.cache_utils import cached_detail
+from app.common.cache_keys import ARTICLE_DETAIL_PREFIX, ARTICLE_DETAIL_SOFT_TTL, ARTICLE_DETAIL_TTL, ARTICLE_LIST_PREFIX, ARTICLE_LIST_TTL
+from app.common.cache_utils import PUBLIC_CACHE_CONTROL, cached_response, versioned_key
 from app.common.schema import PaginatedSchema
 from app.core.config import settings
+from app.database.connection import db_manager
 from app.domain.article.schema import ArticleCreateSchema, ArticleOutSchema, ArticleSummarySchema, ArticleUpdateSchema
 from app.domain.article.service import ArticleService
 from app.domain.user.schema import UserOutSchema
@@ -38,23 +39,26 @@ async def list_articles(
     request: Request,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     status: ArticleStatus | None = None,
     article_type: ArticleType | None = Query(default=None, alias="articleType"),
     tag: str | None = Query(default=None),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: UserOutSchema | None = Depends(get_optional_user),
     service: ArticleService = Depends(get_article_service),
     redis: RedisClient = Depends(get_redis_client),
 ):
     if current_user is None or not is_admin(current_user):
-        return await cached_detail(
+        return await cached_response(
             redis,
-            key=f"{ARTICLE_LIST_PREFIX}:{article_type}:{tag}:{limit}:{offset}",
+            key=await versioned_key(redis, ARTICLE_LIST_PREFIX, f"{article_type}:{tag}:{limit}:{offset}:{cursor}"),
             ttl=ARTICLE_LIST_TTL,
-            schema_class=PaginatedSchema[ArticleSummarySchema],
-            fetch_fn=lambda: service.list_articles(db, limit=limit, offset=offset, status=status, article_type=article_type, tag=tag, current_user=current_user),
+            response_type=PaginatedSchema[ArticleSummarySchema],
+            fetch_fn=lambda: service.list_articles(db, limit=limit, offset=offset, status=status, article_type=article_type, tag=tag, current_user=current_user, cursor=cursor),
+            request=request,
+            cache_control=PUBLIC_CACHE_CONTROL,
         )
-    return await service.list_articles(db, limit=limit, offset=offset, status=status, article_type=article_type, tag=tag, current_user=current_user)
+    return await service.list_articles(db, limit=limit, offset=offset, status=status, article_type=article_type, tag=tag, current_user=current_user, cursor=cursor)
 
 
 @router.get("/slug/{slug}", response_model=ArticleOutSchema)
@@ -62,18 +66,24 @@ async def list_articles(
 async def get_article_by_slug(
     request: Request,
     slug: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: UserOutSchema | None = Depends(get_optional_user),
     service: ArticleService = Depends(get_article_service),
     redis: RedisClient = Depends(get_redis_client),
 ):
     if current_user is None or not is_admin(current_user):
-        return await cached_detail(
+        return await cached_response(
             redis,
             key=f"{ARTICLE_DETAIL_PREFIX}:{slug}",
             ttl=ARTICLE_DETAIL_TTL,
-            schema_class=ArticleOutSchema,
+            soft_ttl=ARTICLE_DETAIL_SOFT_TTL,
+            refresh_fn=lambda: db_manager.run_in_session(
+                lambda session: service.get_by_slug(session, slug=slug, current_user=current_user)
+            ),
+            response_type=ArticleOutSchema,
             fetch_fn=lambda: service.get_by_slug(db, slug=slug, current_user=current_user),
+            request=request,
+            cache_control=PUBLIC_CACHE_CONTROL,
         )
     return await service.get_by_slug(db, slug=slug, current_user=current_user)
 
@@ -83,7 +93,7 @@ async def get_article_by_slug(
 async def get_article(
     request: Request,
     article_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: UserOutSchema | None = Depends(get_optional_user),
     service: ArticleService = Depends(get_article_service),
 ):
@@ -1,15 +1,16 @@
 from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db, require_admin_user
+from app.api.dependencies import get_db, get_read_db, require_admin_user
 from app.common.permissions import is_admin
 from app.api.dependencies.auth import get_optional_user
 from app.api.dependencies.integrations import get_redis_client
 from app.api.dependencies.services import get_broadcast_service
-from app.common.cache_keys import BROADCAST_DETAIL_PREFIX, BROADCAST_DETAIL_TTL, BROADCAST_LIST_PREFIX, BROADCAST_LIST_TTL
-from app.common.cache_utils import cached_detail
+from app.common.cache_keys import BROADCAST_DETAIL_PREFIX, BROADCAST_DETAIL_SOFT_TTL, BROADCAST_DETAIL_TTL, BROADCAST_LIST_PREFIX, BROADCAST_LIST_TTL
+from app.common.cache_utils import PUBLIC_CACHE_CONTROL, cached_response, versioned_key
 from app.common.schema import PaginatedSchema
 from app.core.config import settings
+from app.database.connection import db_manager
 from app.domain.broadcast.schema import (
     BroadcastCreateSchema,
     BroadcastOutSchema,
@@ -43,25 +44,28 @@ async def list_broadcasts(
     request: Request,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     status: BroadcastStatus | None = None,
     broadcast_type: BroadcastType | None = Query(default=None, alias="broadcastType"),
     tag: str | None = Query(default=None),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: UserOutSchema | None = Depends(get_optional_user),
     service: BroadcastService = Depends(get_broadcast_service),
     redis: RedisClient = Depends(get_redis_client),
 ):
     if current_user is None or not is_admin(current_user):
-        return await cached_detail(
+        return await cached_response(
             redis,
-            key=f"{BROADCAST_LIST_PREFIX}:{broadcast_type}:{tag}:{limit}:{offset}",
+            key=await versioned_key(redis, BROADCAST_LIST_PREFIX, f"{broadcast_type}:{tag}:{limit}:{offset}:{cursor}"),
             ttl=BROADCAST_LIST_TTL,
-            schema_class=PaginatedSchema[BroadcastSummarySchema],
-            fetch_fn=lambda: service.list_broadcasts(db, limit=limit, offset=offset, status=status, broadcast_type=broadcast_type, tag=tag, current_user=current_user),
+            response_type=PaginatedSchema[BroadcastSummarySchema],
+            fetch_fn=lambda: service.list_broadcasts(db, limit=limit, offset=offset, status=status, broadcast_type=broadcast_type, tag=tag, current_user=current_user, cursor=cursor),
+            request=request,
+            cache_control=PUBLIC_CACHE_CONTROL,
         )
     return await service.list_broadcasts(
         db, limit=limit, offset=offset, status=status,
-        broadcast_type=broadcast_type, tag=tag, current_user=current_user,
+        broadcast_type=broadcast_type, tag=tag, current_user=current_user, cursor=cursor,
     )
 
 
@@ -70,18 +74,24 @@ async def list_broadcasts(
 async def get_broadcast_by_slug(
     request: Request,
     slug: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: UserOutSchema | None = Depends(get_optional_user),
     service: BroadcastService = Depends(get_broadcast_service),
     redis: RedisClient = Depends(get_redis_client),
 ):
     if current_user is None or not is_admin(current_user):
-        return await cached_detail(
+        return await cached_response(
             redis,
             key=f"{BROADCAST_DETAIL_PREFIX}:{slug}",
             ttl=BROADCAST_DETAIL_TTL,
-            schema_class=BroadcastOutSchema,
+            soft_ttl=BROADCAST_DETAIL_SOFT_TTL,
+            refresh_fn=lambda: db_manager.run_in_session(
+                lambda session: service.get_by_slug(session, slug=slug, current_user=current_user)
+            ),
+            response_type=BroadcastOutSchema,
             fetch_fn=lambda: service.get_by_slug(db, slug=slug, current_user=current_user),
+            request=request,
+            cache_control=PUBLIC_CACHE_CONTROL,
         )
     return await service.get_by_slug(db, slug=slug, current_user=current_user)
 
@@ -91,7 +101,7 @@ async def get_broadcast_by_slug(
 async def get_broadcast(
     request: Request,
     broadcast_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: UserOutSchema | None = Depends(get_optional_user),
     service: BroadcastService = Depends(get_broadcast_service),
 ):
@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_current_user, get_db, require_admin_user
+from app.api.dependencies import get_current_user, get_db, get_read_db, require_admin_user
 from app.api.dependencies.integrations import get_redis_client
 from app.api.dependencies.services import get_category_service
 from app.common.cache_keys import CATEGORY_LIST_PREFIX, CATEGORY_LIST_TTL
-from app.common.cache_utils import cached_list
+from app.common.cache_utils import PUBLIC_CACHE_CONTROL, cached_response, versioned_key
 from app.core.config import settings
 from app.domain.category.schema import (
     CategoryCreateSchema,
@@ -40,18 +40,21 @@ async def list_categories(
     limit: int = 50,
     offset: int = 0,
     parent_id: int | None = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     service: CategoryService = Depends(get_category_service),
     redis: RedisClient = Depends(get_redis_client),
 ):
     if parent_id is None:
-        return await cached_list(
+        return await cached_response(
             redis,
-            key=f"{CATEGORY_LIST_PREFIX}:{limit}:{offset}",
+            key=await versioned_key(redis, CATEGORY_LIST_PREFIX, f"{limit}:{offset}"),
             ttl=CATEGORY_LIST_TTL,
-            schema_class=CategoryOutSchema,
+            response_type=list[CategoryOutSchema],
             fetch_fn=lambda: service.list(db, limit=limit, offset=offset, parent_id=None),
             from_attributes=True,
+            single_flight=True,
+            request=request,
+            cache_control=PUBLIC_CACHE_CONTROL,
         )
     return await service.list(db, limit=limit, offset=offset, parent_id=parent_id)
 
@@ -61,7 +64,7 @@ async def list_categories(
 async def get_category(
     request: Request,
     category_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     service: CategoryService = Depends(get_category_service),
 ):
     return await service.get_by_id(db, category_id=category_id)
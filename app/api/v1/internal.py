@@ -8,12 +8,15 @@ from app.api.dependencies import (
     get_system_user,
     verify_internal_key,
 )
+from app.api.dependencies.integrations import get_redis_client
 from app.core.config import settings
+from app.database.connection import db_manager
 from app.domain.category.schema import CategoryOutSchema
 from app.domain.category.service import CategoryService
 from app.domain.product.schema import ProductCreateSchema, ProductOutSchema
 from app.domain.product.service import ProductService
 from app.domain.user.schema import UserOutSchema
+from app.infrastructure.redis.client import RedisClient
 from app.middleware.rate_limiter import limiter
 
 # Service-to-service endpoints. The whole router is gated by the shared X-Internal-Key
@@ -69,3 +72,27 @@ async def get_product_by_name(
     service: ProductService = Depends(get_product_service),
 ):
     return await service.get_by_name(db, name)
+
+
+@router.get("/metrics/cache")
+@limiter.limit("60/minute")
+async def get_cache_metrics(
+    request: Request,
+    redis: RedisClient = Depends(get_redis_client),
+):
+    # Per-worker numbers: each uvicorn worker keeps its own L1 and counters.
+    if redis is None:
+        return {"l1": {"enabled": False}, "compression": None, "breaker": None, "pool": None}
+    return {
+        "l1": redis.local_cache_stats(),
+        "compression": redis.compression_stats(),
+        "breaker": redis.breaker_stats(),
+        "pool": redis.pool_stats(),
+    }
+
+
+@router.get("/metrics/db")
+@limiter.limit("60/minute")
+async def get_db_metrics(request: Request):
+    # Per-worker view: each uvicorn worker has its own pools and runs its own replica lag checks.
+    return {"pools": db_manager.pool_stats(), "replicas": db_manager.replica_stats()}
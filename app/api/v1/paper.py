@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import (
@@ -9,6 +9,7 @@ from app.api.dependencies import (
     require_researcher_user,
 )
 from app.api.dependencies.auth import get_optional_user
+from app.common.pagination import NEXT_CURSOR_HEADER
 from app.core.config import settings
 from app.domain.paper.schema import (
     PaperCreateSchema,
@@ -42,28 +43,42 @@ async def create_paper(
 @limiter.limit("60/minute")
 async def list_papers(
     request: Request,
+    response: Response,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     verification_status: PaperVerificationStatus | None = None,
     db: AsyncSession = Depends(get_db),
     current_user: UserOutSchema | None = Depends(get_optional_user),
     service: PaperService = Depends(get_paper_service),
 ):
-    return await service.list_papers(db, limit=limit, offset=offset, verification_status=verification_status, current_user=current_user)
+    papers, next_cursor = await service.list_papers(
+        db, limit=limit, offset=offset, verification_status=verification_status, current_user=current_user, cursor=cursor
+    )
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return papers
 
 
 @router.get("/me", response_model=list[PaperOutSchema])
 @limiter.limit("60/minute")
 async def list_my_papers(
     request: Request,
+    response: Response,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     status: PaperStatus | None = None,
     db: AsyncSession = Depends(get_db),
     current_user: UserOutSchema = Depends(get_current_user),
     service: PaperService = Depends(get_paper_service),
 ):
-    return await service.list_papers(db, limit=limit, offset=offset, paper_status=status, current_user=current_user, owner_only=True)
+    papers, next_cursor = await service.list_papers(
+        db, limit=limit, offset=offset, paper_status=status, current_user=current_user, owner_only=True, cursor=cursor
+    )
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return papers
 
 
 @router.get("/slug/{slug}", response_model=PaperOutSchema)
@@ -1,15 +1,18 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, Request, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, Request, Response, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import (
     get_current_user,
     get_db,
+    get_read_db,
     get_product_service,
 )
 from app.api.dependencies.services import get_storage_service
 from app.common.storage import R2StorageService
 from app.api.dependencies.auth import get_optional_user, require_admin_user, require_investor_user
 from app.common.permissions import is_admin
+from app.common.pagination import NEXT_CURSOR_HEADER
+from app.common.validators import normalize_search
 from app.common.schema import PaginatedSchema
 from app.core.config import settings
 from app.domain.product.schema import (
@@ -42,13 +45,17 @@ from app.domain.product.schema import (
     BountyCreateSchema, BountyUpdateSchema, BountyOutSchema,
 )
 from app.enums.enums import ProductDateFilter, ProductSortBy, ProductStage, ProductStatus
+from app.exceptions.exceptions import NotFoundError
 from app.domain.product.service import ProductService
 from app.common.cache_keys import (
-    PRODUCT_DETAIL_PREFIX, PRODUCT_DETAIL_TTL, PRODUCT_MEMBER_DETAIL_TTL,
-    PRODUCT_LIST_PREFIX, PRODUCT_LIST_TTL, PRODUCT_MEMBER_LIST_TTL,
+    PRODUCT_DETAIL_PREFIX, PRODUCT_DETAIL_SOFT_TTL, PRODUCT_DETAIL_TTL,
+    PRODUCT_LIST_PREFIX, PRODUCT_LIST_TTL, PRODUCT_SEARCH_TTL,
     PRODUCT_STATS, PRODUCT_STATS_TTL,
 )
-from app.common.cache_utils import cached_detail
+from app.common.cache_utils import (
+    PUBLIC_CACHE_CONTROL, cached_json, cached_response, conditional_json, versioned_key,
+)
+from app.database.connection import db_manager
 from app.domain.user.schema import UserOutSchema
 from app.api.dependencies.integrations import get_redis_client
 from app.infrastructure.redis.client import RedisClient
@@ -79,6 +86,7 @@ async def list_products(
     request: Request,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     status: ProductStatus | None = None,
     category_id: int | None = None,
     date_filter: ProductDateFilter | None = None,
@@ -86,59 +94,65 @@ async def list_products(
     q: str | None = None,
     upvoted: bool | None = None,
     listed: bool | None = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: UserOutSchema | None = Depends(get_optional_user),
     service: ProductService = Depends(get_product_service),
     redis: RedisClient | None = Depends(get_redis_client),
 ):
-    if q or (current_user is not None and is_admin(current_user)):
+    search = normalize_search(q)
+    if current_user is not None and (is_admin(current_user) or upvoted):
         return await service.list(
             db, limit=limit, offset=offset, status=status, current_user=current_user,
             category_id=category_id, date_filter=date_filter, sort_by=sort_by,
-            search=q, upvoted=upvoted, listed=listed,
+            search=search, upvoted=upvoted, listed=listed, cursor=cursor,
         )
 
-    if redis is not None:
-        if current_user is None:
-            cache_key = f"{PRODUCT_LIST_PREFIX}:{category_id}:{date_filter}:{sort_by}:{listed}:{limit}:{offset}"
-            ttl = PRODUCT_LIST_TTL
-        else:
-            cache_key = f"{PRODUCT_LIST_PREFIX}:member:{current_user.id}:{category_id}:{date_filter}:{sort_by}:{listed}:{upvoted}:{limit}:{offset}"
-            ttl = PRODUCT_MEMBER_LIST_TTL
-
-        cached = await redis.get(cache_key)
-        if cached:
-            return PaginatedSchema[ProductListSchema].model_validate_json(cached)
-        result = await service.list(
-            db, limit=limit, offset=offset, status=status, current_user=current_user,
-            category_id=category_id, date_filter=date_filter, sort_by=sort_by,
-            search=q, upvoted=upvoted, listed=listed,
-        )
-        await redis.set(cache_key, result.model_dump_json(), ttl_seconds=ttl)
-        return result
-
-    return await service.list(
-        db, limit=limit, offset=offset, status=status, current_user=current_user,
-        category_id=category_id, date_filter=date_filter, sort_by=sort_by,
-        search=q, upvoted=upvoted, listed=listed,
+    # Every viewer shares the anonymous page; members get their bookmark flags patched in.
+    suffix = f"{category_id}:{date_filter}:{sort_by}:{listed}:{limit}:{offset}:{cursor}"
+    if search is not None:
+        # Trailing, so the L1 pattern for the first browse page doesn't pick searches up.
+        suffix += f":q={search}"
+    cached = dict(
+        key=await versioned_key(redis, PRODUCT_LIST_PREFIX, suffix),
+        ttl=PRODUCT_LIST_TTL if search is None else PRODUCT_SEARCH_TTL,
+        response_type=PaginatedSchema[ProductListSchema],
+        fetch_fn=lambda: service.list(
+            db, limit=limit, offset=offset, status=status,
+            category_id=category_id, date_filter=date_filter, sort_by=sort_by, search=search,
+            listed=listed, cursor=cursor,
+        ),
+        # Every admin approval wipes these pages; coalesce the resulting burst of misses.
+        single_flight=True,
     )
+    if current_user is None:
+        return await cached_response(redis, **cached, request=request, cache_control=PUBLIC_CACHE_CONTROL)
+
+    page = await cached_json(redis, **cached)
+    # The summary list shows only the bookmark flag; skip the vote and interest lookups.
+    flags = await service.get_viewer_flags(db, [item["id"] for item in page["items"]], current_user, only=("bookmarked",))
+    for item in page["items"]:
+        item["bookmarked"] = item["id"] in flags["bookmarked"]
+    return conditional_json(request, page)
 
 
 @router.get("/stats", response_model=ProductReleaseStatsSchema)
 @limiter.limit("60/minute")
 async def get_product_stats(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     service: ProductService = Depends(get_product_service),
     redis: RedisClient = Depends(get_redis_client),
 ):
-    cached = await redis.get(PRODUCT_STATS)
-    if cached:
-        return ProductReleaseStatsSchema.model_validate_json(cached)
-
-    stats = await service.get_release_stats(db)
-    await redis.set(PRODUCT_STATS, stats.model_dump_json(), ttl_seconds=PRODUCT_STATS_TTL)
-    return stats
+    return await cached_response(
+        redis,
+        key=PRODUCT_STATS,
+        ttl=PRODUCT_STATS_TTL,
+        response_type=ProductReleaseStatsSchema,
+        fetch_fn=lambda: service.get_release_stats(db),
+        single_flight=True,
+        request=request,
+        cache_control=PUBLIC_CACHE_CONTROL,
+    )
 
 
 @router.get("/me", response_model=PaginatedSchema[ProductListSchema])
@@ -147,12 +161,15 @@ async def list_my_products(
     request: Request,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     status: ProductStatus | None = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: UserOutSchema = Depends(get_current_user),
     service: ProductService = Depends(get_product_service),
 ):
-    return await service.list(db, limit=limit, offset=offset, status=status, current_user=current_user, owner_only=True)
+    return await service.list(
+        db, limit=limit, offset=offset, status=status, current_user=current_user, owner_only=True, cursor=cursor
+    )
 
 
 @router.get("/me/voted", response_model=PaginatedSchema[ProductListSchema])
@@ -161,24 +178,32 @@ async def list_voted_products(
     request: Request,
     limit: int = 50,
     offset: int = 0,
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_read_db),
     current_user: UserOutSchema = Depends(get_current_user),
     service: ProductService = Depends(get_product_service),
 ):
-    return await service.list_voted(db, limit=limit, offset=offset, current_user=current_user)
+    return await service.list_voted(db, limit=limit, offset=offset, current_user=current_user, cursor=cursor)
 
 
 @router.get("/me/bookmarked", response_model=list[ProductSummarySchema])
 @limiter.limit("60/minute")
 async def list_bookmarked_products(
     request: Request,
+    response: Response,
     limit: int = 50,
     offset: int = 0,
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_read_db),
     current_user: UserOutSchema = Depends(get_current_user),
     service: ProductService = Depends(get_product_service),
 ):
-    return await service.list_bookmarked(db, limit=limit, offset=offset, current_user=current_user)
+    products, next_cursor = await service.list_bookmarked(
+        db, limit=limit, offset=offset, current_user=current_user, cursor=cursor
+    )
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return products
 
 
 @router.get("/stages", response_model=list[str])
@@ -191,7 +216,7 @@ async def list_stages():
 async def get_product_by_slug(
     request: Request,
     slug: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: UserOutSchema | None = Depends(get_optional_user),
     service: ProductService = Depends(get_product_service),
     redis: RedisClient = Depends(get_redis_client),
@@ -199,17 +224,37 @@ async def get_product_by_slug(
     if current_user is not None and is_admin(current_user):
         return await service.get_by_slug(db, slug=slug, current_user=current_user)
 
-    cache_key = (
-        f"{PRODUCT_DETAIL_PREFIX}:{slug}"
-        if current_user is None
-        else f"{PRODUCT_DETAIL_PREFIX}:member:{current_user.id}:{slug}"
+    # Every viewer shares the anonymous payload; members get their voted/bookmarked/interested flags patched in.
+    async def fetch():
+        return await service.get_by_slug(db, slug=slug)
+
+    async def refresh():
+        return await db_manager.run_in_session(lambda session: service.get_by_slug(session, slug=slug))
+
+    cached = dict(
+        key=await versioned_key(redis, f"{PRODUCT_DETAIL_PREFIX}:{slug}", "anon"),
+        ttl=PRODUCT_DETAIL_TTL,
+        response_type=ProductOutSchema,
+        fetch_fn=fetch,
+        single_flight=True,
+        soft_ttl=PRODUCT_DETAIL_SOFT_TTL,
+        refresh_fn=refresh,
     )
-    ttl = PRODUCT_DETAIL_TTL if current_user is None else PRODUCT_MEMBER_DETAIL_TTL
+    if current_user is None:
+        return await cached_response(redis, **cached, request=request, cache_control=PUBLIC_CACHE_CONTROL)
 
-    async def fetch():
+    try:
+        product = await cached_json(redis, **cached)
+    except NotFoundError:
+        # Not public — but its owner may still see it.
         return await service.get_by_slug(db, slug=slug, current_user=current_user)
-
-    return await cached_detail(redis, key=cache_key, ttl=ttl, schema_class=ProductOutSchema, fetch_fn=fetch)
+    if product["createdById"] == current_user.id:
+        # Owners also see unapproved team members, which the shared payload leaves out.
+        return await service.get_by_slug(db, slug=slug, current_user=current_user)
+    flags = await service.get_viewer_flags(db, [product["id"]], current_user)
+    for flag, ids in flags.items():
+        product[flag] = product["id"] in ids
+    return conditional_json(request, product)
 
 
 @router.get("/{product_id}", response_model=ProductOutSchema)
@@ -217,7 +262,7 @@ async def get_product_by_slug(
 async def get_product(
     request: Request,
     product_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: UserOutSchema | None = Depends(get_optional_user),
     service: ProductService = Depends(get_product_service),
 ):
@@ -230,7 +275,7 @@ async def list_similar_products(
     request: Request,
     product_id: int,
     limit: int = 3,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     service: ProductService = Depends(get_product_service),
 ):
     return await service.list_similar(db, product_id=product_id, limit=limit)
@@ -242,7 +287,7 @@ async def list_related_products(
     request: Request,
     product_id: int,
     limit: int = 3,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     service: ProductService = Depends(get_product_service),
 ):
     return await service.list_related(db, product_id=product_id, limit=limit)
@@ -358,7 +403,7 @@ async def list_comments(
     product_id: int,
     limit: int = 10,
     offset: int = 0,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     service: ProductService = Depends(get_product_service),
 ):
     return await service.list_comments(db, product_id=product_id, limit=limit, offset=offset)
@@ -427,7 +472,7 @@ async def pin_comment(
 async def list_links(
     request: Request,
     product_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     service: ProductService = Depends(get_product_service),
 ):
     return await service.list_links(db, product_id=product_id)
@@ -482,7 +527,7 @@ async def delete_link(
 async def list_media(
     request: Request,
     product_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     service: ProductService = Depends(get_product_service),
 ):
     return await service.list_media(db, product_id=product_id)
@@ -587,7 +632,7 @@ async def delete_logo(
 async def list_team(
     request: Request,
     product_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: UserOutSchema | None = Depends(get_optional_user),
     service: ProductService = Depends(get_product_service),
 ):
@@ -657,7 +702,7 @@ async def delete_team_member(
 async def list_backers(
     request: Request,
     product_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     service: ProductService = Depends(get_product_service),
 ):
     return await service.list_backers(db, product_id=product_id)
@@ -698,7 +743,7 @@ async def delete_backer(
 async def list_grants(
     request: Request,
     product_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     service: ProductService = Depends(get_product_service),
 ):
     return await service.list_grants(db, product_id=product_id)
@@ -739,7 +784,7 @@ async def delete_grant(
 async def list_voices(
     request: Request,
     product_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     service: ProductService = Depends(get_product_service),
 ):
     return await service.list_voices(db, product_id=product_id)
@@ -794,7 +839,7 @@ async def delete_voice(
 async def list_bounties(
     request: Request,
     product_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     service: ProductService = Depends(get_product_service),
 ):
     return await service.list_bounties(db, product_id=product_id)
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_read_db, get_search_service
+from app.api.dependencies.integrations import get_redis_client
+from app.common.cache_keys import SEARCH_PREFIX, SEARCH_TTL
+from app.common.cache_utils import PUBLIC_CACHE_CONTROL, cached_response, versioned_key
+from app.common.validators import normalize_search
+from app.core.config import settings
+from app.domain.search.schema import SearchResultsSchema
+from app.domain.search.service import SearchService
+from app.enums.enums import SearchEntityType
+from app.infrastructure.redis.client import RedisClient
+from app.middleware.rate_limiter import limiter
+
+router = APIRouter(prefix=settings.api.v1.search, tags=["Search"])
+
+
+@router.get("", response_model=SearchResultsSchema)
+@limiter.limit("120/minute")
+async def search(
+    request: Request,
+    q: str = "",
+    type: SearchEntityType | None = Query(default=None),
+    limit: int = Query(default=10, ge=1, le=50),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_read_db),
+    service: SearchService = Depends(get_search_service),
+    redis: RedisClient = Depends(get_redis_client),
+):
+    """Ranked, type-tagged hits across public products, articles, broadcasts and papers.
+
+    Every word of q matches as a prefix, so it can be called on each keystroke.
+    """
+    search_text = normalize_search(q)
+    return await cached_response(
+        redis,
+        key=await versioned_key(redis, SEARCH_PREFIX, f"{type}:{limit}:{cursor}:q={search_text}"),
+        ttl=SEARCH_TTL,
+        response_type=SearchResultsSchema,
+        fetch_fn=lambda: service.search(db, search_text, type, limit=limit, cursor=cursor),
+        request=request,
+        cache_control=PUBLIC_CACHE_CONTROL,
+    )
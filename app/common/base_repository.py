@@ -1,9 +1,10 @@
-from typing import Type, TypeVar, Generic, Optional, Any, Union, runtime_checkable, Protocol
+from typing import Type, TypeVar, Generic, Optional, Any, Sequence, Union, runtime_checkable, Protocol
 from pydantic import BaseModel
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import and_, exists
+from sqlalchemy import and_, delete, exists, func, insert, inspect, update
 from app.exceptions.exceptions import ConflictError, NotFoundError, DatabaseError, ValidationError
 
 PG_UNIQUE_VIOLATION = "23505"
@@ -102,6 +103,89 @@ class BaseRepository(Generic[T]):
         except Exception as e:
             raise DatabaseError(f"Failed to create {self.model.__name__}: {e}") from e
 
+    def _bulk_payloads(
+        self, rows: Sequence[Union[dict[str, Any], BaseModel]], current_user_id: int | None
+    ) -> list[dict[str, Any]]:
+        payloads = [row.model_dump() if isinstance(row, BaseModel) else dict(row) for row in rows]
+        if current_user_id:
+            for payload in payloads:
+                for field in ("created_by_id", "updated_by_id"):
+                    if hasattr(self.model, field):
+                        payload[field] = current_user_id
+        return payloads
+
+    async def create_many(
+        self,
+        session: AsyncSession,
+        rows: Sequence[Union[dict[str, Any], BaseModel]],
+        current_user_id: int | None = None,
+    ) -> list[T]:
+        """Insert rows with one multi-row INSERT ... RETURNING; returns the instances in input order."""
+        if not rows:
+            return []
+        try:
+            result = await session.execute(
+                insert(self.model).returning(self.model, sort_by_parameter_order=True),
+                self._bulk_payloads(rows, current_user_id),
+            )
+            return list(result.scalars().all())
+        except IntegrityError as e:
+            raise _translate_integrity_error(e, self.model.__name__) from e
+        except Exception as e:
+            raise DatabaseError(f"Failed to create {self.model.__name__} rows: {e}") from e
+
+    async def upsert_many(
+        self,
+        session: AsyncSession,
+        rows: Sequence[Union[dict[str, Any], BaseModel]],
+        conflict_columns: Sequence[str],
+        update_columns: Sequence[str] | None = None,
+        current_user_id: int | None = None,
+    ) -> list[T]:
+        """Insert rows, updating update_columns of those that collide on conflict_columns.
+
+        One multi-row INSERT ... ON CONFLICT ... RETURNING; returns the inserted or updated
+        instances in input order. update_columns=None updates every column the rows carry
+        (except the conflict target and created_by_id); an empty list leaves collisions alone,
+        and returns only the rows actually inserted, unordered. Rows must be unique on
+        conflict_columns.
+        """
+        if not rows:
+            return []
+        payloads = self._bulk_payloads(rows, current_user_id)
+        stmt = pg_insert(self.model)
+        if update_columns is None:
+            update_columns = [k for k in payloads[0] if k not in {*conflict_columns, "created_by_id"}]
+        if update_columns:
+            set_ = {column: stmt.excluded[column] for column in update_columns}
+            if hasattr(self.model, "updated_at"):
+                set_["updated_at"] = func.now()
+            stmt = stmt.on_conflict_do_update(index_elements=list(conflict_columns), set_=set_)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+        try:
+            result = await session.execute(
+                stmt.returning(self.model, sort_by_parameter_order=bool(update_columns)),
+                payloads,
+                # Rows already in the session must pick up the values just written.
+                execution_options={"populate_existing": True},
+            )
+            return list(result.scalars().all())
+        except IntegrityError as e:
+            raise _translate_integrity_error(e, self.model.__name__) from e
+        except Exception as e:
+            raise DatabaseError(f"Failed to upsert {self.model.__name__} rows: {e}") from e
+
+    async def delete_where(self, session: AsyncSession, *conditions) -> int:
+        """Hard-delete every row matching conditions in one statement; returns how many went."""
+        try:
+            result = await session.execute(delete(self.model).where(*conditions))
+            return result.rowcount
+        except IntegrityError as e:
+            raise _translate_integrity_error(e, self.model.__name__) from e
+        except Exception as e:
+            raise DatabaseError(f"Failed to delete {self.model.__name__} rows: {e}") from e
+
     async def update(
         self,
         session: AsyncSession,
@@ -109,27 +193,36 @@ class BaseRepository(Generic[T]):
         data: Union[dict[str, Any], BaseModel],
         current_user_id: int | None = None,
     ) -> T:
+        """UPDATE ... WHERE id = :id [AND deleted_at IS NULL] RETURNING *, in one round trip.
+
+        The returned row (server defaults, generated columns and updated_at included) is loaded
+        into the session's instance, so callers don't need to refresh it afterwards.
+        """
         try:
-            q = select(self.model).where(self.model.id == _id)
+            payload = data.model_dump(exclude_unset=True) if isinstance(data, BaseModel) else data
+
+            protected_fields = {"id", "created_at", "created_by_id"}
+            columns = inspect(self.model).column_attrs
+            values = {
+                getattr(self.model, key): value
+                for key, value in payload.items()
+                if key not in protected_fields and key in columns
+            }
+            if current_user_id and hasattr(self.model, "updated_by_id"):
+                values[self.model.updated_by_id] = current_user_id
+            if not values:
+                return await self.get_by_id(session, _id)
+
+            q = update(self.model).where(self.model.id == _id)
             if (f := self._active_filter()) is not None:
                 q = q.where(f)
-            result = await session.execute(q)
+            result = await session.execute(
+                q.values(values).returning(self.model),
+                execution_options={"synchronize_session": False, "populate_existing": True},
+            )
             instance = result.scalar_one_or_none()
             if not instance:
                 raise NotFoundError(f"{self.model.__name__} with ID {_id} not found")
-
-            payload = data.model_dump(exclude_unset=True) if isinstance(data, BaseModel) else data
-
-            protected_fields = {"id", "created_at", "created_by_id"}
-            for key, value in payload.items():
-                if key not in protected_fields:
-                    setattr(instance, key, value)
-
-            if current_user_id and hasattr(instance, "updated_by_id"):
-                instance.updated_by_id = current_user_id
-
-            await session.flush()
-            await session.refresh(instance)
             return instance
         except NotFoundError:
             raise
@@ -177,21 +270,21 @@ class BaseRepository(Generic[T]):
             raise DatabaseError(f"Failed to delete {self.model.__name__}: {e}") from e
 
     async def soft_delete(self, session: AsyncSession, _id: int, deleted_by_id: int | None = None) -> None:
+        """Mark the row deleted with a single UPDATE ... RETURNING; NotFoundError if it's gone already."""
         from datetime import datetime, timezone
         try:
+            values = {self.model.deleted_at: datetime.now(timezone.utc)}
+            if deleted_by_id and hasattr(self.model, "deleted_by_id"):
+                values[self.model.deleted_by_id] = deleted_by_id
             result = await session.execute(
-                select(self.model).where(
-                    and_(self.model.id == _id, self.model.deleted_at.is_(None))
-                )
+                update(self.model)
+                .where(and_(self.model.id == _id, self.model.deleted_at.is_(None)))
+                .values(values)
+                .returning(self.model),
+                execution_options={"synchronize_session": False, "populate_existing": True},
             )
-            instance = result.scalar_one_or_none()
-            if not instance:
+            if result.scalar_one_or_none() is None:
                 raise NotFoundError(f"{self.model.__name__} with ID {_id} not found")
-            if hasattr(instance, "deleted_at"):
-                instance.deleted_at = datetime.now(timezone.utc)
-            if deleted_by_id and hasattr(instance, "deleted_by_id"):
-                instance.deleted_by_id = deleted_by_id
-            await session.flush()
         except NotFoundError:
             raise
         except Exception as e:
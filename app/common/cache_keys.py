@@ -14,15 +14,46 @@ ARTICLE_LIST_PREFIX = "article:list"
 ARTICLE_LIST_TTL = TTL_24_HOURS
 ARTICLE_DETAIL_PREFIX = "article:detail"
 ARTICLE_DETAIL_TTL = TTL_24_HOURS
+ARTICLE_DETAIL_SOFT_TTL = TTL_12_HOURS
 
 BROADCAST_LIST_PREFIX = "broadcast:list"
 BROADCAST_LIST_TTL = TTL_24_HOURS
 BROADCAST_DETAIL_PREFIX = "broadcast:detail"
 BROADCAST_DETAIL_TTL = TTL_24_HOURS
+BROADCAST_DETAIL_SOFT_TTL = TTL_12_HOURS
 
 PRODUCT_LIST_PREFIX = "product:list"
 PRODUCT_LIST_TTL = TTL_30_MIN
-PRODUCT_MEMBER_LIST_TTL = TTL_5_MIN
+# Search pages share the list namespace but are long-tailed; keep them briefly.
+PRODUCT_SEARCH_TTL = TTL_5_MIN
 PRODUCT_DETAIL_PREFIX = "product:detail"
 PRODUCT_DETAIL_TTL = TTL_30_MIN
-PRODUCT_MEMBER_DETAIL_TTL = TTL_5_MIN
+PRODUCT_DETAIL_SOFT_TTL = TTL_10_MIN
+
+# Cross-entity search results, per normalized query; bumped by every service that reindexes.
+SEARCH_PREFIX = "search"
+SEARCH_TTL = TTL_5_MIN
+
+# List prefixes and product detail slugs (PRODUCT_DETAIL_PREFIX:{slug}) are generation-versioned
+# namespaces — see cache_utils.versioned_key / RedisClient.bump_generation.
+
+# Values at least this many bytes are zlib-compressed in Redis (longest matching key prefix wins).
+# Detail payloads carry descriptions, media, team, voices and bounties; list pages hold 50 items.
+COMPRESSION_THRESHOLDS = {
+    PRODUCT_DETAIL_PREFIX: 2048,
+    PRODUCT_LIST_PREFIX: 4096,
+    ARTICLE_DETAIL_PREFIX: 2048,
+    ARTICLE_LIST_PREFIX: 4096,
+    BROADCAST_DETAIL_PREFIX: 2048,
+    BROADCAST_LIST_PREFIX: 4096,
+}
+
+# Keys also held in each worker's in-process L1 (label -> glob pattern), when REDIS_L1_ENABLED.
+L1_CACHE_KEYS = {
+    CATEGORY_LIST_PREFIX: f"{CATEGORY_LIST_PREFIX}:*",
+    PRODUCT_STATS: PRODUCT_STATS,
+    # First page of the anonymous, all-categories product list. Keys are
+    # g{gen}:{category}:{date}:{sort}:{listed}:{limit}:{offset}:{cursor}; "*" also matches ":",
+    # so every segment is spelled out to pin category to None rather than letting g* swallow it.
+    PRODUCT_LIST_PREFIX: f"{PRODUCT_LIST_PREFIX}:g*:None:*:*:*:*:0:None",
+}
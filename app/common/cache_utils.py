@@ -1,12 +1,259 @@
+import asyncio
+import hashlib
 import json
+import time
 from collections.abc import Awaitable, Callable
-from typing import TypeVar
+from functools import lru_cache
+from typing import Any, TypeVar
 
-from pydantic import BaseModel
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
 
+from app.core.logger import get_logger
+from app.database.replicas import reads_on_primary
 from app.infrastructure.redis.client import RedisClient
 
+logger = get_logger(__name__)
+
 S = TypeVar("S", bound=BaseModel)
+R = TypeVar("R")
+
+FILL_LOCK_PREFIX = "lock:fill"
+# Long enough to cover a cold ProductService.list; short enough that a crashed filler unblocks quickly.
+FILL_LOCK_TTL_MS = 5_000
+FILL_WAIT_SECONDS = 2.0
+FILL_POLL_SECONDS = 0.05
+
+# Entries that carry metadata (e.g. a soft expiry) are stored as a one-line JSON header, a newline,
+# then the payload: '#{"soft": 1767225600.0}\n{...}'. Payloads are always JSON objects/arrays,
+# so a leading "#" unambiguously marks the header and plain entries keep reading as before.
+META_MARK = "#"
+# Header "fmt" of entries written by cached_response (serialized response bodies).
+RESPONSE_FORMAT = "body"
+
+# Anonymous bodies are identical for every viewer: let a shared cache (CDN) hold them briefly and
+# revalidate with If-None-Match; browsers always revalidate. Responses patched per member are private.
+# The session lives in a cookie, so every response also carries Vary: Cookie.
+PUBLIC_CACHE_CONTROL = "public, max-age=0, s-maxage=60, stale-while-revalidate=300"
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+# Cache fills currently running in this process, keyed by cache key.
+_inflight: dict[str, asyncio.Future] = {}
+# Keys with a stale-while-revalidate refresh scheduled in this process.
+_revalidating: set[str] = set()
+# Strong references so background refresh tasks aren't garbage-collected mid-flight.
+_background_tasks: set[asyncio.Task] = set()
+
+
+def pack_entry(payload: str, meta: dict) -> str:
+    if not meta:
+        return payload
+    return f"{META_MARK}{json.dumps(meta)}\n{payload}"
+
+
+def unpack_entry(raw: str) -> tuple[dict, str]:
+    if not raw.startswith(META_MARK):
+        return {}, raw
+    header, _, payload = raw.partition("\n")
+    return json.loads(header[len(META_MARK):]), payload
+
+
+def content_etag(body: str | bytes) -> str:
+    if isinstance(body, str):
+        body = body.encode()
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison (RFC 9110 13.1.2): a W/ prefix doesn't matter for GET.
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def conditional_response(
+    request: Request | None,
+    body: str | bytes,
+    *,
+    etag: str | None = None,
+    cache_control: str | None = None,
+) -> Response:
+    """A JSON Response carrying an ETag; a bodyless 304 if the request's If-None-Match already has it."""
+    etag = etag or content_etag(body)
+    headers = {"ETag": etag, "Vary": "Cookie"}
+    if cache_control is not None:
+        headers["Cache-Control"] = cache_control
+    if request is not None and _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def conditional_json(request: Request, data: Any, *, cache_control: str = PRIVATE_CACHE_CONTROL) -> Response:
+    """conditional_response for JSON data built per request, e.g. a shared entry with viewer flags patched in."""
+    return conditional_response(request, JSONResponse(data).body, cache_control=cache_control)
+
+
+async def versioned_key(redis: RedisClient | None, namespace: str, suffix: str) -> str:
+    """Build "{namespace}:g{generation}:{suffix}"; RedisClient.bump_generation(namespace) invalidates them all."""
+    if redis is None:
+        return f"{namespace}:{suffix}"
+    return f"{namespace}:g{await redis.get_generation(namespace)}:{suffix}"
+
+
+def _consume_exception(fut: asyncio.Future) -> None:
+    # Followers may all have gone away; mark the exception retrieved so asyncio doesn't log it.
+    if not fut.cancelled():
+        fut.exception()
+
+
+async def _coalesce(key: str, fill: Callable[[], Awaitable[R]]) -> R:
+    """Run fill() at most once per key in this process; concurrent callers share its result."""
+    existing = _inflight.get(key)
+    if existing is not None:
+        try:
+            return await asyncio.shield(existing)
+        except asyncio.CancelledError:
+            if not existing.cancelled():
+                raise  # this caller was cancelled, not the leader
+            # The leader's request was cancelled mid-fill — do the work ourselves.
+            return await fill()
+
+    fut: asyncio.Future = asyncio.get_running_loop().create_future()
+    fut.add_done_callback(_consume_exception)
+    _inflight[key] = fut
+    try:
+        result = await fill()
+    except asyncio.CancelledError:
+        fut.cancel()
+        raise
+    except Exception as e:
+        fut.set_exception(e)
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        if _inflight.get(key) is fut:
+            del _inflight[key]
+
+
+async def _locked_fill(
+    redis: RedisClient,
+    key: str,
+    fill: Callable[[], Awaitable[R]],
+    decode: Callable[[str], R | None],
+) -> R:
+    """Cross-worker single flight: one filler holds a short Redis lock while the others poll for its value.
+
+    decode() returns None for an entry it can't use (e.g. one in another format), which keeps polling.
+    """
+    lock_key = f"{FILL_LOCK_PREFIX}:{key}"
+    token = await redis.try_lock(lock_key, FILL_LOCK_TTL_MS)
+    if token is None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + FILL_WAIT_SECONDS
+        while loop.time() < deadline:
+            await asyncio.sleep(FILL_POLL_SECONDS)
+            cached = await redis.get(key)
+            if cached and (value := decode(cached)) is not None:
+                return value
+        # The filler is slow or died holding the lock — fall back to filling ourselves.
+        return await fill()
+    try:
+        return await fill()
+    finally:
+        await redis.release_lock(lock_key, token)
+
+
+async def _single_flight(
+    redis: RedisClient,
+    key: str,
+    fill: Callable[[], Awaitable[R]],
+    decode: Callable[[str], R | None],
+) -> R:
+    return await _coalesce(key, lambda: _locked_fill(redis, key, fill, decode))
+
+
+async def _revalidate(redis: RedisClient, key: str, refresh: Callable[[], Awaitable]) -> None:
+    lock_key = f"{FILL_LOCK_PREFIX}:{key}"
+    try:
+        token = await redis.try_lock(lock_key, FILL_LOCK_TTL_MS)
+        if token is None:
+            return  # another worker is already refreshing this key
+        try:
+            await refresh()
+        finally:
+            await redis.release_lock(lock_key, token)
+    except Exception:
+        # The stale entry keeps being served until its hard TTL; the next stale read retries.
+        logger.warning("cache_revalidation_failed", extra={"key": key}, exc_info=True)
+    finally:
+        _revalidating.discard(key)
+
+
+def _schedule_revalidation(redis: RedisClient, key: str, refresh: Callable[[], Awaitable]) -> None:
+    if key in _revalidating:
+        return
+    _revalidating.add(key)
+    task = asyncio.create_task(_revalidate(redis, key, refresh))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _cache_aside(
+    redis: RedisClient,
+    key: str,
+    ttl: int,
+    fetch_fn: Callable[[], Awaitable],
+    encode: Callable[[object], tuple[str, dict, R]],
+    decode: Callable[[str, dict], R],
+    *,
+    single_flight: bool,
+    soft_ttl: int | None,
+    refresh_fn: Callable[[], Awaitable] | None,
+    entry_format: str | None = None,
+) -> R:
+    """Shared read path: encode() turns a fetch result into (stored payload, extra entry meta, return value);
+    decode() turns a stored payload and its meta back into a return value.
+
+    entry_format tags what the payload is; entries tagged differently are treated as misses and overwritten.
+    """
+    if soft_ttl is not None and refresh_fn is None:
+        raise TypeError("soft_ttl requires a session-independent refresh_fn")
+    if not redis.available:
+        # Circuit open: go straight to the DB, skipping the read, the fill lock and the write.
+        return encode(await fetch_fn())[2]
+
+    async def fill_from(fn: Callable[[], Awaitable]) -> R:
+        # The entry outlives the invalidation that triggered this miss; don't fill it from a lagging replica.
+        with reads_on_primary():
+            result = await fn()
+        payload, extra, value = encode(result)
+        meta: dict = {"soft": time.time() + soft_ttl} if soft_ttl is not None else {}
+        if entry_format is not None:
+            meta["fmt"] = entry_format
+        meta.update(extra)
+        await redis.set(key, pack_entry(payload, meta), ttl_seconds=ttl)
+        return value
+
+    def decode_entry(raw: str) -> R | None:
+        meta, payload = unpack_entry(raw)
+        return decode(payload, meta) if meta.get("fmt") == entry_format else None
+
+    cached = await redis.get(key)
+    if cached:
+        meta, payload = unpack_entry(cached)
+        if meta.get("fmt") == entry_format:
+            if refresh_fn is not None and meta.get("soft", float("inf")) <= time.time():
+                _schedule_revalidation(redis, key, lambda: fill_from(refresh_fn))
+            return decode(payload, meta)
+
+    if single_flight:
+        return await _single_flight(redis, key, lambda: fill_from(fetch_fn), decode_entry)
+    return await fill_from(fetch_fn)
 
 
 async def cached_list(
@@ -17,22 +264,27 @@ async def cached_list(
     fetch_fn: Callable[[], Awaitable[list]],
     *,
     from_attributes: bool = False,
+    single_flight: bool = False,
 ) -> list[S]:
     """Cache-aside for public list endpoints. Always returns schema instances.
 
     Pass from_attributes=True when the service returns ORM objects rather than schemas.
+    Pass single_flight=True on hot keys so concurrent misses share one fetch instead of stampeding the DB.
     """
     if redis is None:
         return await fetch_fn()
 
-    cached = await redis.get(key)
-    if cached:
-        return [schema_class.model_validate(item) for item in json.loads(cached)]
+    def encode(result) -> tuple[str, dict, list[S]]:
+        schemas = [schema_class.model_validate(item, from_attributes=from_attributes) for item in result]
+        return json.dumps([s.model_dump(mode="json") for s in schemas]), {}, schemas
 
-    result = await fetch_fn()
-    schemas = [schema_class.model_validate(item, from_attributes=from_attributes) for item in result]
-    await redis.set(key, json.dumps([s.model_dump(mode="json") for s in schemas]), ttl_seconds=ttl)
-    return schemas
+    def decode(payload: str, meta: dict) -> list[S]:
+        return [schema_class.model_validate(item) for item in json.loads(payload)]
+
+    return await _cache_aside(
+        redis, key, ttl, fetch_fn, encode, decode,
+        single_flight=single_flight, soft_ttl=None, refresh_fn=None,
+    )
 
 
 async def cached_detail(
@@ -43,16 +295,105 @@ async def cached_detail(
     fetch_fn: Callable[[], Awaitable],
     *,
     from_attributes: bool = False,
+    single_flight: bool = False,
+    soft_ttl: int | None = None,
+    refresh_fn: Callable[[], Awaitable] | None = None,
 ) -> S:
-    """Try Redis first; on miss, fetch from DB, cache it, then return. Skips cache if Redis is unavailable."""
+    """Try Redis first; on miss, fetch from DB, cache it, then return. Skips cache if Redis is unavailable.
+
+    Pass single_flight=True on hot keys so concurrent misses share one fetch instead of stampeding the DB.
+
+    Pass soft_ttl (< ttl) to enable stale-while-revalidate: once an entry is older than soft_ttl it is
+    still served, and refresh_fn runs in the background to replace it; ttl stays the hard bound on
+    staleness. refresh_fn must not use the request's DB session — it runs after the response is sent.
+    """
     if redis is None:
         return await fetch_fn()
 
-    cached = await redis.get(key)
-    if cached:
-        return schema_class.model_validate(json.loads(cached))
+    def encode(result) -> tuple[str, dict, S]:
+        schema = schema_class.model_validate(result, from_attributes=from_attributes)
+        return json.dumps(schema.model_dump(mode="json")), {}, schema
+
+    def decode(payload: str, meta: dict) -> S:
+        return schema_class.model_validate(json.loads(payload))
+
+    return await _cache_aside(
+        redis, key, ttl, fetch_fn, encode, decode,
+        single_flight=single_flight, soft_ttl=soft_ttl, refresh_fn=refresh_fn,
+    )
+
+
+@lru_cache(maxsize=64)
+def _adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+async def cached_response(
+    redis: RedisClient | None,
+    key: str,
+    ttl: int,
+    response_type: Any,
+    fetch_fn: Callable[[], Awaitable],
+    *,
+    from_attributes: bool = False,
+    single_flight: bool = False,
+    soft_ttl: int | None = None,
+    refresh_fn: Callable[[], Awaitable] | None = None,
+    request: Request | None = None,
+    cache_control: str | None = None,
+) -> Any:
+    """Like cached_detail, but caches the serialized response body and returns hits as a raw Response.
+
+    A hit does no JSON parsing or model construction. The body is what FastAPI would have produced
+    for response_type (camelCase aliases), so routes keep their response_model for docs. Keys must not
+    be shared with cached_detail/cached_list; entries they wrote are ignored and refilled.
+
+    The body's ETag is stored with the entry. Pass the request to answer a matching If-None-Match
+    with a bodyless 304 straight from the cache, and cache_control to set the Cache-Control header.
+    """
+    if redis is None:
+        return await fetch_fn()
+    adapter = _adapter(response_type)
+
+    # (body, etag) rather than a Response: single flight shares one fill across requests whose
+    # If-None-Match headers differ.
+    def encode(result) -> tuple[str, dict, tuple[str, str]]:
+        body = adapter.dump_json(adapter.validate_python(result, from_attributes=from_attributes), by_alias=True).decode()
+        etag = content_etag(body)
+        return body, {"etag": etag}, (body, etag)
 
-    result = await fetch_fn()
-    schema = schema_class.model_validate(result, from_attributes=from_attributes)
-    await redis.set(key, json.dumps(schema.model_dump(mode="json")), ttl_seconds=ttl)
-    return schema
+    def decode(payload: str, meta: dict) -> tuple[str, str]:
+        return payload, meta.get("etag") or content_etag(payload)
+
+    body, etag = await _cache_aside(
+        redis, key, ttl, fetch_fn, encode, decode,
+        single_flight=single_flight, soft_ttl=soft_ttl, refresh_fn=refresh_fn, entry_format=RESPONSE_FORMAT,
+    )
+    return conditional_response(request, body, etag=etag, cache_control=cache_control)
+
+
+async def cached_json(
+    redis: RedisClient | None,
+    key: str,
+    ttl: int,
+    response_type: Any,
+    fetch_fn: Callable[[], Awaitable],
+    *,
+    from_attributes: bool = False,
+    single_flight: bool = False,
+    soft_ttl: int | None = None,
+    refresh_fn: Callable[[], Awaitable] | None = None,
+) -> Any:
+    """cached_response, parsed back to plain JSON data (camelCase keys).
+
+    For routes that serve one shared entry to every viewer and patch a few per-viewer fields in;
+    send the patched data back through conditional_json.
+    """
+    result = await cached_response(
+        redis, key, ttl, response_type, fetch_fn,
+        from_attributes=from_attributes, single_flight=single_flight, soft_ttl=soft_ttl, refresh_fn=refresh_fn,
+    )
+    if isinstance(result, Response):
+        return json.loads(result.body)
+    adapter = _adapter(response_type)
+    return adapter.dump_python(adapter.validate_python(result, from_attributes=from_attributes), mode="json", by_alias=True)
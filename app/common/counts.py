@@ -0,0 +1,101 @@
+import hashlib
+import json
+from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.cache_utils import versioned_key
+from app.common.pagination import Page
+from app.core.config import settings
+from app.database.connection import db_manager
+from app.database.query_stats import record_count_strategy
+from app.database.replicas import reads_on_primary
+from app.infrastructure.redis.client import RedisClient
+
+# How a list's total was obtained; reported per request (X-Count-Strategy, access log).
+CACHED = "cached"      # exact count from Redis, keyed by the normalized filters
+WINDOW = "window"      # count(*) OVER () folded into the page query
+EXACT = "exact"        # separate SELECT count(*), run alongside the page query
+ESTIMATE = "estimate"  # planner row estimate (EXPLAIN of the list's own query) for unfiltered admin views
+
+
+class ListTotal:
+    """Pick the cheapest way to get the total of one paginated list request.
+
+    namespace is the list's versioned cache namespace, so the writes that invalidate its pages
+    invalidate its cached counts too. filters is the normalized filter tuple; None means the
+    count must not be cached (e.g. it depends on per-user state that doesn't bump the namespace).
+    estimate(session) returns the planner's estimate of the list's size (see db_utils.estimate_rows);
+    pass it only for unfiltered views, and it's used only when settings.db.count_estimates is on.
+    """
+
+    def __init__(
+        self,
+        redis: RedisClient | None,
+        namespace: str,
+        ttl: int,
+        filters: tuple | None,
+        estimate: Callable[[AsyncSession], Awaitable[int]] | None = None,
+    ):
+        self._redis = redis
+        self._namespace = namespace
+        self._ttl = ttl
+        self._filters = filters
+        self._estimate = estimate if settings.db.count_estimates else None
+
+    async def fetch(
+        self,
+        db: AsyncSession,
+        page: Callable[[AsyncSession, bool], Awaitable[Page]],
+        count: Callable[[AsyncSession], Awaitable[int]],
+        *,
+        offset: int,
+        cursor: str | None,
+    ) -> tuple[Page, int]:
+        """(page, total). page(session, with_total) runs the page query; count(session) the exact count."""
+        key = await self._cache_key()
+        cached = await self._redis.get(key) if key is not None else None
+        if cached is not None:
+            record_count_strategy(CACHED)
+            return await page(db, False), int(cached)
+
+        if self._estimate is not None:
+            # Estimated from the same predicates the page query applies (soft deletes included).
+            result, estimate = await db_manager.gather_reads(
+                db, lambda session: page(session, False), self._estimate,
+            )
+            record_count_strategy(ESTIMATE)
+            return result, estimate
+
+        # A total that gets cached is served until the namespace is bumped again: count on the primary,
+        # like the cache fills in cache_utils, so a replica that lags a write doesn't pin the old total.
+        with reads_on_primary() if key is not None else nullcontext():
+            if cursor is None:
+                # Postgres computes the whole filtered result for the window either way, but it's one
+                # statement instead of two.
+                result = await page(db, True)
+                if result.total is not None:
+                    total, strategy = result.total, WINDOW
+                elif offset == 0:
+                    total, strategy = 0, WINDOW
+                else:
+                    # Paged past the end: the window had no row to ride on.
+                    total, strategy = await count(db), EXACT
+            else:
+                # A cursor filters out the rows before it, so the window can't count them.
+                result, total = await db_manager.gather_reads(
+                    db, lambda session: page(session, False), count,
+                )
+                strategy = EXACT
+
+        record_count_strategy(strategy)
+        if key is not None:
+            await self._redis.set(key, str(total), self._ttl)  # type: ignore[union-attr]
+        return result, total
+
+    async def _cache_key(self) -> str | None:
+        if self._redis is None or self._filters is None:
+            return None
+        digest = hashlib.blake2b(json.dumps(self._filters, default=str).encode(), digest_size=16).hexdigest()
+        return await versioned_key(self._redis, self._namespace, f"count:{digest}")
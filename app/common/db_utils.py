@@ -1,5 +1,9 @@
-from sqlalchemy import Table, delete, insert, select
+import json
+
+from sqlalchemy import CTE, Select, Table, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
 
 
 async def sync_categories(
@@ -51,3 +55,71 @@ async def sync_association(
             insert(table),
             [{owner_col: owner_id, target_col: cid} for cid in to_add],
         )
+
+
+async def shift_counter(
+    session: AsyncSession,
+    counter: InstrumentedAttribute[int],
+    where: ColumnElement[bool],
+    changed: CTE,
+    *,
+    decrement: bool = False,
+) -> int | None:
+    """Run changed (an INSERT/DELETE ... RETURNING CTE) and move counter by the rows it returned.
+
+    Both happen in one statement, so the counter can't miss a write that commits, and a no-op
+    (duplicate insert, delete of a missing row) leaves it alone. Returns the new counter value,
+    or None if no row matched where.
+    """
+    entity = counter.class_
+    delta = select(func.count()).select_from(changed).scalar_subquery()
+    result = await session.execute(
+        update(entity)
+        .where(where)
+        # Keep updated_at: a vote isn't an edit of the row it counts on.
+        .values({counter: counter - delta if decrement else counter + delta, entity.updated_at: entity.updated_at})
+        .returning(counter)
+        .execution_options(synchronize_session=False)
+    )
+    return result.scalar_one_or_none()
+
+
+async def shift_counters(
+    session: AsyncSession,
+    counter: InstrumentedAttribute[int],
+    changed: CTE,
+    *,
+    decrement: bool = False,
+) -> list[int]:
+    """Like shift_counter, for a changed CTE spanning many rows of counter's table.
+
+    changed returns the ids of the rows to move (its first column); each moves by how many times
+    its id was returned, in the same statement as the change. Returns the ids that moved.
+    """
+    entity = counter.class_
+    ref = changed.c[0]
+    per_row = select(ref.label("id"), func.count().label("n")).group_by(ref).subquery()
+    result = await session.execute(
+        update(entity)
+        .where(entity.id == per_row.c.id)
+        .values({
+            counter: counter - per_row.c.n if decrement else counter + per_row.c.n,
+            entity.updated_at: entity.updated_at,
+        })
+        .returning(entity.id)
+        .execution_options(synchronize_session=False)
+    )
+    return sorted(result.scalars().all())
+
+
+async def estimate_rows(session: AsyncSession, query: Select) -> int:
+    """The planner's estimate of how many rows query returns, from EXPLAIN (nothing is scanned).
+
+    Bound values are inlined, so query must only compare against literal-renderable values.
+    """
+    conn = await session.connection()
+    sql = query.order_by(None).compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,116 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from sqlalchemy import DateTime, Float, Select, and_, false, func, literal, or_, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.exceptions.exceptions import ValidationError
+
+# Response header carrying the next cursor for endpoints that return a bare list.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class Page(NamedTuple):
+    items: list[Any]
+    next_cursor: str | None
+    # count(*) OVER () of the filtered query, when asked for; None if the page came back empty.
+    total: int | None = None
+
+
+class SortKey(NamedTuple):
+    expr: ColumnElement
+    descending: bool = True
+    # Nullable keys sort NULLs last, in either direction.
+    nullable: bool = False
+
+
+def keyset_order(keys: Sequence[SortKey]) -> list[ColumnElement]:
+    clauses = []
+    for key in keys:
+        clause = key.expr.desc() if key.descending else key.expr.asc()
+        clauses.append(clause.nulls_last() if key.nullable else clause)
+    return clauses
+
+
+def keyset_page(
+    q: Select, keys: Sequence[SortKey], *, limit: int, offset: int, cursor: str | None, with_total: bool = False
+) -> Select:
+    """Restrict q (already ordered by keys) to one page: the rows after cursor, or at offset without one.
+
+    The key values are appended to each row and one extra row is fetched; split_page() strips
+    both and turns them into the next cursor. The last key must be unique (the primary key).
+    with_total also appends count(*) OVER (), the size of the whole filtered result — only
+    meaningful without a cursor, which would filter out the rows before it.
+    """
+    if cursor is not None:
+        q = q.where(_after(keys, decode_cursor(cursor, keys)))
+    else:
+        q = q.offset(offset)
+    if with_total:
+        q = q.add_columns(func.count().over())
+    return q.add_columns(*(key.expr for key in keys)).limit(limit + 1)
+
+
+def split_page(rows: Sequence[Any], limit: int, with_total: bool = False) -> Page:
+    """Page of the first column of each row, with the cursor after its last row (None on the last page)."""
+    rows = list(rows)
+    keys_from = 2 if with_total else 1
+    next_cursor = encode_cursor(rows[limit - 1][keys_from:]) if len(rows) > limit > 0 else None
+    total = rows[0][1] if with_total and rows else None
+    return Page([row[0] for row in rows[:limit]], next_cursor, total)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, keys: Sequence[SortKey]) -> list[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError
+        return [_parse_value(key, value) for key, value in zip(keys, values)]
+    except (ValueError, TypeError, binascii.Error):
+        raise ValidationError("Invalid pagination cursor")
+
+
+def _parse_value(key: SortKey, value: Any) -> Any:
+    if value is None:
+        if not key.nullable:
+            raise ValueError
+        return None
+    if isinstance(key.expr.type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(key.expr.type, Float):
+        # Scores (e.g. search rank); JSON round-trips floats exactly.
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise ValueError
+        return float(value)
+    if not isinstance(value, (int, str)) or isinstance(value, bool):
+        raise ValueError
+    return value
+
+
+def _after(keys: Sequence[SortKey], values: list[Any]) -> ColumnElement:
+    if not any(key.nullable for key in keys) and len({key.descending for key in keys}) == 1:
+        # Row-value comparison, which Postgres can answer with an index range scan.
+        row = tuple_(*(key.expr for key in keys))
+        bound = tuple_(*(literal(v, key.expr.type) for key, v in zip(keys, values)))
+        return row < bound if keys[0].descending else row > bound
+
+    clauses = []
+    for i, (key, value) in enumerate(zip(keys, values)):
+        if value is None:
+            # Nothing sorts after NULL on this key; only later keys can advance.
+            continue
+        beyond = key.expr < value if key.descending else key.expr > value
+        if key.nullable:
+            beyond = or_(beyond, key.expr.is_(None))
+        equal = [k.expr.is_(None) if v is None else k.expr == v for k, v in zip(keys[:i], values[:i])]
+        clauses.append(and_(*equal, beyond))
+    return or_(*clauses) if clauses else false()
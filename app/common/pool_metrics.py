@@ -0,0 +1,80 @@
+import bisect
+import time
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+
+# Upper bounds (ms) of the checkout wait histogram buckets; anything slower lands in "+Inf".
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """Checkout waits and connection ages for one connection pool (per worker).
+
+    The pool reports each checkout through checkout(), and each physical connection through
+    connected()/disconnected(); current sizes are passed to stats() by whoever owns the pool.
+    """
+
+    def __init__(self) -> None:
+        self.waiters = 0
+        self.peak_waiters = 0
+        self._wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self._wait_count = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._failed = 0
+        self._connected_at: dict[Hashable, float] = {}
+
+    @contextmanager
+    def checkout(self, queued: bool) -> Iterator[None]:
+        """Time one checkout; queued means no connection was free, so the caller waits in line."""
+        if queued:
+            self.waiters += 1
+            self.peak_waiters = max(self.peak_waiters, self.waiters)
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            if queued:
+                self.waiters -= 1
+        self._observe_wait(time.perf_counter() - start)
+
+    def connected(self, connection: Hashable) -> None:
+        self._connected_at[connection] = time.monotonic()
+
+    def disconnected(self, connection: Hashable) -> None:
+        self._connected_at.pop(connection, None)
+
+    def stats(self, **gauges: int) -> dict:
+        now = time.monotonic()
+        ages = [now - t for t in self._connected_at.values()]
+        cumulative, buckets = 0, {}
+        for bound, count in zip((*map(str, WAIT_BUCKETS_MS), "+Inf"), self._wait_buckets):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {
+            **gauges,
+            "waiters": self.waiters,
+            "peak_waiters": self.peak_waiters,
+            "failed_checkouts": self._failed,
+            "checkout_wait_ms": {
+                "count": self._wait_count,
+                "sum": round(self._wait_total * 1000, 3),
+                "max": round(self._wait_max * 1000, 3),
+                # Cumulative: checkouts that took at most this many ms.
+                "buckets": buckets,
+            },
+            "connection_age_seconds": {
+                "connections": len(ages),
+                "max": round(max(ages), 1) if ages else None,
+                "mean": round(sum(ages) / len(ages), 1) if ages else None,
+            },
+        }
+
+    def _observe_wait(self, seconds: float) -> None:
+        self._wait_buckets[bisect.bisect_left(WAIT_BUCKETS_MS, seconds * 1000)] += 1
+        self._wait_count += 1
+        self._wait_total += seconds
+        self._wait_max = max(self._wait_max, seconds)
@@ -26,4 +26,6 @@ class CamelModel(BaseModel):
 
 class PaginatedSchema(CamelModel, Generic[T]):
     items: list[T]
-    total: int
\ No newline at end of file
+    total: int
+    # Opaque; pass back as `cursor` for the next page. None on the last page.
+    next_cursor: str | None = None
\ No newline at end of file
@@ -17,3 +17,13 @@ def extract_domain(url: str) -> str | None:
     if not host or " " in host or "." not in host:
         return None
     return host[4:] if host.startswith("www.") else host
+
+
+MAX_SEARCH_LENGTH = 100
+
+
+def normalize_search(value: str | None) -> str | None:
+    """Lowercased, whitespace-collapsed search text (None if blank), so equivalent queries share a cache entry."""
+    if not value:
+        return None
+    return " ".join(value.split()).lower()[:MAX_SEARCH_LENGTH] or None
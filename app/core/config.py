@@ -25,6 +25,7 @@ class ApiV1Prefix(BaseModel):
     broadcast: str = "/broadcast"
     internal: str = "/internal"
     subscriber: str = "/subscriber"
+    search: str = "/search"
 
 
 class ApiPrefix(BaseModel):
@@ -34,6 +35,27 @@ class ApiPrefix(BaseModel):
 class DbConfig(BaseSettings):
     url: str
     direct_url: str
+    # Per engine (primary and each replica) and per worker.
+    pool_size: int = 20
+    max_overflow: int = 10
+    # Seconds a checkout waits for a free connection before raising.
+    pool_timeout: float = 30.0
+    # Connections older than this are replaced on their next checkout; -1 keeps them forever.
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    # Statements at least this slow are logged (normalized) to app.db.slow_query with their route.
+    slow_query_ms: int = 200
+    # Unfiltered admin list views report the planner's row estimate as their total instead of counting.
+    count_estimates: bool = False
+    # Pooled connections one request may hold at once for DatabaseManager.gather_reads.
+    parallel_reads: int = 4
+    # Comma-separated read replica URLs (same driver as url). Empty: every read goes to the primary.
+    replica_urls: str = ""
+    # Replicas further behind than this are skipped until they catch up; lag is rechecked this often.
+    replica_max_lag_seconds: float = 5.0
+    replica_check_seconds: float = 2.0
+    # After a successful write, the client's reads stick to the primary this long (recent_write cookie).
+    read_your_writes_seconds: int = 10
 
     model_config = _cfg("DATABASE_")
 
@@ -41,6 +63,20 @@ class DbConfig(BaseSettings):
 class RedisConfig(BaseSettings):
     url: str
     use_ipv6: bool = False
+    # Once max_connections are in use, a command waits up to pool_timeout for one to free up.
+    max_connections: int = 20
+    pool_timeout: float = 0.5
+    # In-process L1 in front of Redis for the keys listed in cache_keys.L1_CACHE_KEYS.
+    # The TTL bounds staleness should an invalidation message be lost.
+    l1_enabled: bool = False
+    l1_max_bytes: int = 16 * 1024 * 1024
+    l1_ttl_seconds: float = 5.0
+    # Per-command socket timeout; a hung Redis should cost a request this much, not seconds.
+    socket_timeout: float = 0.5
+    # After breaker_threshold consecutive failures, skip Redis for breaker_cooldown_seconds
+    # before letting a single probe call through.
+    breaker_threshold: int = 5
+    breaker_cooldown_seconds: float = 10.0
 
     model_config = _cfg("REDIS_")
 
@@ -5,32 +5,42 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker
 )
 from sqlalchemy.orm import declarative_base
+import asyncio
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
+from typing import Any, TypeVar
 from app.core.config import settings
 from app.core.logger import get_logger
+from app.database.pool import InstrumentedQueuePool, instrument_pool, pool_stats
+from app.database.query_stats import instrument_queries
+from app.database.replicas import PRIMARY_INFO, REPLICA_BIND, WROTE, ReadRoutingSession, ReplicaSet
 
 
 logger = get_logger()
 
 Base = declarative_base()
 
+T = TypeVar("T")
+
+# AsyncSession.info key holding the request's gather_reads semaphore.
+_READ_SLOTS = "parallel_read_slots"
+# Routing state a gather_reads sibling inherits, so it reads from the same place as its parent.
+_ROUTING_KEYS = (REPLICA_BIND, PRIMARY_INFO, WROTE)
+
 
 class DatabaseManager:
     def __init__(self):
         self.engine: AsyncEngine | None = None
         self.async_session: async_sessionmaker | None = None
+        self.read_session: async_sessionmaker | None = None
+        self.replicas: ReplicaSet | None = None
+        self._replica_monitor: asyncio.Task | None = None
 
     def init_engine(self):
         """
-        Initialize the async engine.
+        Initialize the async engine, plus one per configured read replica.
         """
-        self.engine = create_async_engine(
-            settings.db.url,
-            echo=False,
-            pool_size=20,
-            pool_pre_ping=True,
-            connect_args={"server_settings": {"application_name": "ai-assistant"}}
-        )
+        self.engine = self._create_engine(settings.db.url, application_name="ai-assistant")
 
         self.async_session = async_sessionmaker(
             bind=self.engine,
@@ -41,6 +51,57 @@ class DatabaseManager:
             # close_resets_only=False
         )
 
+        replica_urls = [url.strip() for url in settings.db.replica_urls.split(",") if url.strip()]
+        if replica_urls:
+            self.replicas = ReplicaSet(
+                [self._create_engine(url, application_name="ai-assistant-read") for url in replica_urls],
+                max_lag_seconds=settings.db.replica_max_lag_seconds,
+                check_seconds=settings.db.replica_check_seconds,
+            )
+        self.read_session = async_sessionmaker(
+            bind=self.engine,
+            class_=AsyncSession,
+            sync_session_class=ReadRoutingSession,
+            expire_on_commit=False,
+            autoflush=False,
+            autocommit=False,
+        )
+
+    @staticmethod
+    def _create_engine(url: str, application_name: str) -> AsyncEngine:
+        engine = create_async_engine(
+            url,
+            echo=False,
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.db.pool_size,
+            max_overflow=settings.db.max_overflow,
+            pool_timeout=settings.db.pool_timeout,
+            pool_recycle=settings.db.pool_recycle,
+            pool_pre_ping=settings.db.pool_pre_ping,
+            connect_args={"server_settings": {"application_name": application_name}},
+        )
+        instrument_pool(engine)
+        instrument_queries(engine)
+        return engine
+
+    def start_replica_monitor(self) -> None:
+        """Start tracking replica lag; until a replica's first check passes, its reads go to the primary."""
+        if self.replicas is not None and self._replica_monitor is None:
+            self._replica_monitor = asyncio.create_task(self.replicas.monitor())
+
+    def replica_stats(self) -> list[dict]:
+        return self.replicas.stats() if self.replicas is not None else []
+
+    def pool_stats(self) -> dict[str, dict]:
+        """Per-worker pool metrics for the primary and each replica engine."""
+        if self.engine is None:
+            return {}
+        stats = {"primary": pool_stats(self.engine)}
+        if self.replicas is not None:
+            for replica in self.replicas.members():
+                stats[replica.name] = pool_stats(replica.engine)
+        return stats
+
     async def create_all_tables(self):
         """
         Create all tables (use only for testing or first run).
@@ -69,10 +130,84 @@ class DatabaseManager:
         finally:
             await session.close()
 
+    @asynccontextmanager
+    async def read_session_scope(self, primary: AsyncSession, use_primary: bool = False):
+        """
+        Session for read-only work: statements go to a replica within the lag budget, or the
+        primary if there is none, use_primary is set, or a write is seen — its own, or a commit
+        on the request's primary session.
+        """
+        if not self.read_session:
+            raise RuntimeError("Session not initialized. Call init_engine() first.")
+        replica = None if use_primary or self.replicas is None else self.replicas.pick()
+        info: dict = {PRIMARY_INFO: primary.info}
+        if replica is not None:
+            info[REPLICA_BIND] = replica.engine.sync_engine
+        session = self.read_session(info=info)
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    async def run_in_session(self, fn: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """
+        Run fn with its own short-lived session.
+        For work that outlives the request session, e.g. background cache refreshes.
+        """
+        async with self.session_scope() as session:
+            return await fn(session)
+
+    async def gather_reads(self, db: AsyncSession, *reads: Callable[[AsyncSession], Awaitable[Any]]) -> list[Any]:
+        """
+        Run independent read-only queries concurrently, each on its own short-lived pooled session.
+        One AsyncSession can't run statements concurrently, so asyncio.gather on a single session
+        only serializes them. At most settings.db.parallel_reads run at once per request session
+        (db), nested calls included. The reads don't see db's uncommitted writes — commit first.
+        Results come back in order; if one read fails the others are cancelled.
+        """
+        if db.bind is None or len(reads) < 2:
+            return [await read(db) for read in reads]
+        slots = db.info.get(_READ_SLOTS)
+        if slots is None:
+            slots = db.info[_READ_SLOTS] = asyncio.Semaphore(settings.db.parallel_reads)
+
+        routing = {key: db.info[key] for key in _ROUTING_KEYS if key in db.info}
+
+        async def run(read: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+            session = AsyncSession(
+                bind=db.bind,
+                sync_session_class=type(db.sync_session),
+                info=dict(routing),
+                expire_on_commit=False,
+                autoflush=False,
+            )
+            async with slots, session:
+                return await read(session)
+
+        tasks = [asyncio.ensure_future(run(read)) for read in reads]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     async def close(self):
         """
-        Dispose the engine.
+        Dispose the engines.
         """
+        if self._replica_monitor is not None:
+            self._replica_monitor.cancel()
+            try:
+                await self._replica_monitor
+            except asyncio.CancelledError:
+                pass
+        if self.replicas is not None:
+            await self.replicas.dispose()
         if self.engine:
             await self.engine.dispose()
 
@@ -0,0 +1,50 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from app.common.pool_metrics import PoolMetrics
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that times checkouts and counts the tasks queued for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        # Same condition QueuePool uses to decide it has to block on the queue.
+        queued = -1 < self._max_overflow <= self._overflow and self._pool.empty()
+        with self.metrics.checkout(queued):
+            return super()._do_get()
+
+
+def instrument_pool(engine: AsyncEngine) -> None:
+    """Track physical connections of engine's pool (created with InstrumentedQueuePool) for their age."""
+    pool = engine.sync_engine.pool
+    metrics: PoolMetrics = pool.metrics  # type: ignore[attr-defined]
+
+    @event.listens_for(pool, "connect")
+    def _connected(dbapi_connection, record) -> None:
+        metrics.connected(record)
+
+    @event.listens_for(pool, "close")
+    def _closed(dbapi_connection, record) -> None:
+        metrics.disconnected(record)
+
+    @event.listens_for(pool, "detach")
+    def _detached(dbapi_connection, record) -> None:
+        metrics.disconnected(record)
+
+
+def pool_stats(engine: AsyncEngine) -> dict:
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, InstrumentedQueuePool):
+        return {"instrumented": False}
+    return pool.metrics.stats(
+        size=pool.size(),
+        checked_out=pool.checkedout(),
+        # Negative while the base pool hasn't been filled yet.
+        overflow=max(pool.overflow(), 0),
+        idle=pool.checkedin(),
+    )
@@ -0,0 +1,101 @@
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+slow_query_logger = get_logger("app.db.slow_query")
+
+_PARAMS = re.compile(r"\$\d+|%\(\w+\)s|'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PARAM_LISTS = re.compile(r"\(\?(?:, \?)+\)")
+_WHITESPACE = re.compile(r"\s+")
+_MAX_LOGGED_SQL = 2000
+
+
+@dataclass
+class QueryStats:
+    """Statements run on behalf of one request, accumulated by the engine's cursor events."""
+
+    scope: dict = field(repr=False)
+    count: int = 0
+    total_s: float = 0.0
+    slowest_s: float = 0.0
+    slowest_sql: str | None = None
+    # How a paginated list's total was obtained (app.common.counts), if the request listed one.
+    count_strategy: str | None = None
+
+    @property
+    def route(self) -> str:
+        # Set on the scope by the router once the request has been matched.
+        route = self.scope.get("route")
+        return getattr(route, "path", None) or self.scope.get("path", "-")
+
+
+# Shared by reference with child tasks (gather_reads) and with SQLAlchemy's greenlets,
+# which run in the calling task's context.
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries(scope: dict) -> Iterator[QueryStats]:
+    """Count the statements run while handling the request in scope."""
+    stats = QueryStats(scope)
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+def record_count_strategy(strategy: str) -> None:
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.count_strategy = strategy
+
+
+def normalize_sql(statement: str) -> str:
+    """Collapse whitespace and replace literals and bound parameters with ?, so slow statements group."""
+    sql = _PARAMS.sub("?", _WHITESPACE.sub(" ", statement).strip())
+    return _PARAM_LISTS.sub("(?, ...)", sql)[:_MAX_LOGGED_SQL]
+
+
+def instrument_queries(engine: AsyncEngine) -> None:
+    """Time every statement on engine into the current request's QueryStats and log slow ones."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        stats = _query_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.total_s += elapsed
+            if elapsed > stats.slowest_s:
+                stats.slowest_s = elapsed
+                stats.slowest_sql = statement
+        if elapsed * 1000 >= settings.db.slow_query_ms:
+            # Imported here: app.middleware.logging imports this module.
+            from app.middleware.logging import get_request_id
+
+            slow_query_logger.warning("slow_query", extra={
+                "request_id": get_request_id(),
+                "route": stats.route if stats is not None else None,
+                "duration_ms": round(elapsed * 1000, 1),
+                "sql": normalize_sql(statement),
+            })
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _failed(context) -> None:
+        # after_cursor_execute doesn't run for a failed statement.
+        if context.connection is not None and context.connection.info.get("query_start"):
+            context.connection.info["query_start"].pop()
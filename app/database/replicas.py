@@ -0,0 +1,141 @@
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.core.logger import get_logger
+
+logger = get_logger()
+
+# Session.info keys used for routing.
+REPLICA_BIND = "replica_bind"        # sync Engine of the replica chosen for this session
+PRIMARY_INFO = "primary_info"        # info dict of the request's primary session
+WROTE = "wrote"                      # this session sent a write, so it stays on the primary
+COMMITTED = "committed"              # set on every session when it commits
+
+# Set by reads_on_primary(); tasks started inside it (e.g. gather_reads) inherit it.
+_primary_reads: ContextVar[bool] = ContextVar("primary_reads", default=False)
+
+# Seconds behind the primary; 0 when fully replayed (an idle primary doesn't count as lag).
+# NULL when the replica has WAL it hasn't replayed but has never replayed a transaction.
+_LAG_SQL = text("""
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+""")
+
+
+@contextmanager
+def reads_on_primary():
+    """Send every ReadRoutingSession statement issued in this context to the primary.
+
+    For reads whose result outlives the request, e.g. a cache fill: a replica that hasn't replayed
+    a write yet would otherwise pin the pre-write rows in Redis for the entry's whole TTL.
+    """
+    token = _primary_reads.set(True)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_committed(session: Session) -> None:
+    session.info[COMMITTED] = True
+
+
+class ReadRoutingSession(Session):
+    """Sends statements to info[REPLICA_BIND] until a write is seen, then everything goes to the primary.
+
+    A write is a flush or a DML statement on this session, or a commit on the request's primary
+    session (info[PRIMARY_INFO]), so reads issued after it see its rows. Inside reads_on_primary()
+    every statement goes to the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        replica = self.info.get(REPLICA_BIND)
+        if replica is not None and not self._on_primary():
+            if not self._flushing and not isinstance(clause, UpdateBase):
+                return replica
+            self.info[WROTE] = True
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def _on_primary(self) -> bool:
+        return (
+            _primary_reads.get()
+            or self.info.get(WROTE, False)
+            or self.info.get(PRIMARY_INFO, {}).get(COMMITTED, False)
+        )
+
+
+@dataclass
+class Replica:
+    name: str
+    engine: AsyncEngine
+    # None until the first successful check, and whenever the replica can't be reached.
+    lag_seconds: float | None = None
+
+
+class ReplicaSet:
+    """Read replicas with their replication lag, refreshed in the background by monitor()."""
+
+    def __init__(self, engines: list[AsyncEngine], max_lag_seconds: float, check_seconds: float):
+        self._replicas = [Replica(e.url.host or "replica", e) for e in engines]
+        self._max_lag = max_lag_seconds
+        self._check_seconds = check_seconds
+        self._next = 0
+
+    def pick(self) -> Replica | None:
+        """Round-robin over replicas within the lag budget; None means use the primary."""
+        usable = [r for r in self._replicas if r.lag_seconds is not None and r.lag_seconds <= self._max_lag]
+        if not usable:
+            return None
+        self._next = (self._next + 1) % len(usable)
+        return usable[self._next]
+
+    def members(self) -> list[Replica]:
+        return list(self._replicas)
+
+    async def check(self) -> None:
+        await asyncio.gather(*(self._check_one(r) for r in self._replicas))
+
+    async def monitor(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self._check_seconds)
+
+    def stats(self) -> list[dict]:
+        return [
+            {
+                "name": r.name,
+                "lag_seconds": r.lag_seconds,
+                "usable": r.lag_seconds is not None and r.lag_seconds <= self._max_lag,
+            }
+            for r in self._replicas
+        ]
+
+    async def dispose(self) -> None:
+        for replica in self._replicas:
+            await replica.engine.dispose()
+
+    async def _check_one(self, replica: Replica) -> None:
+        was_usable = replica.lag_seconds is not None and replica.lag_seconds <= self._max_lag
+        try:
+            async with asyncio.timeout(self._check_seconds):
+                async with replica.engine.connect() as conn:
+                    lag = (await conn.execute(_LAG_SQL)).scalar()
+            replica.lag_seconds = float(lag) if lag is not None else None
+        except Exception:
+            replica.lag_seconds = None
+            logger.warning("Replica lag check failed for %s", replica.name)
+        usable = replica.lag_seconds is not None and replica.lag_seconds <= self._max_lag
+        if was_usable and not usable:
+            logger.warning("Replica %s skipped; lag %s s", replica.name, replica.lag_seconds)
+        elif usable and not was_usable:
+            logger.info("Replica %s back in rotation", replica.name)
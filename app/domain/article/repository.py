@@ -3,6 +3,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import load_only
 
 from app.common.base_repository import BaseRepository
+from app.common.db_utils import estimate_rows
+from app.common.pagination import Page, SortKey, keyset_order, keyset_page, split_page
 from app.domain.article.model import Article, ArticleTag
 from app.domain.tag.model import Tag
 from app.enums.enums import ArticleStatus, ArticleType
@@ -55,7 +57,9 @@ class ArticleRepository(BaseRepository[Article]):
         tag: str | None,
         limit: int,
         offset: int,
-    ) -> list[Article]:
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page:
         # Prune the large `content` body — the list path serializes summaries only.
         q = select(Article).options(
             load_only(
@@ -68,9 +72,12 @@ class ArticleRepository(BaseRepository[Article]):
             )
         )
         q = self._apply_filters(q, status, article_type, tag)
-        q = q.order_by(Article.published_at.desc().nulls_last(), Article.id.desc()).limit(limit).offset(offset)
-        result = await db.execute(q)
-        return list(result.scalars().all())
+        keys = [SortKey(Article.published_at, nullable=True), SortKey(Article.id)]
+        q = q.order_by(*keyset_order(keys))
+        result = await db.execute(
+            keyset_page(q, keys, limit=limit, offset=offset, cursor=cursor, with_total=with_total)
+        )
+        return split_page(result.all(), limit, with_total)
 
     async def count_filtered(
         self,
@@ -83,6 +90,10 @@ class ArticleRepository(BaseRepository[Article]):
         result = await db.execute(q)
         return result.scalar() or 0
 
+    async def estimate_unfiltered(self, db: AsyncSession) -> int:
+        """Planner estimate of count_filtered() with no filters (live rows), without scanning them."""
+        return await estimate_rows(db, self._apply_filters(select(Article.id), None, None, None))
+
     async def get_tags_for_articles(
         self, db: AsyncSession, article_ids: list[int]
     ) -> dict[int, list[Tag]]:
@@ -3,7 +3,10 @@ from datetime import datetime, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.common.cache_keys import ARTICLE_DETAIL_PREFIX, ARTICLE_LIST_PREFIX, BROADCAST_DETAIL_PREFIX
+from app.common.cache_keys import (
+    ARTICLE_DETAIL_PREFIX, ARTICLE_LIST_PREFIX, ARTICLE_LIST_TTL, BROADCAST_DETAIL_PREFIX, SEARCH_PREFIX,
+)
+from app.common.counts import ListTotal
 from app.common.db_utils import sync_association
 from app.common.permissions import is_admin
 from app.common.schema import PaginatedSchema
@@ -11,10 +14,11 @@ from app.domain.article.model import ArticleTag
 from app.domain.article.repository import ArticleRepository
 from app.domain.article.schema import ArticleCreateSchema, ArticleOutSchema, ArticleSummarySchema, ArticleUpdateSchema
 from app.domain.broadcast.repository import BroadcastRepository
+from app.domain.search.repository import SearchRepository
 from app.domain.tag.repository import TagRepository
 from app.domain.user.repository import UserRepository
 from app.domain.user.schema import UserOutSchema
-from app.enums.enums import ArticleStatus
+from app.enums.enums import ArticleStatus, SearchEntityType
 from app.exceptions.exceptions import ConflictError, NotFoundError
 from app.infrastructure.redis.client import RedisClient
 from app.utils.slug import slugify, with_random_suffix
@@ -27,30 +31,30 @@ class ArticleService:
         tag_repo: TagRepository,
         user_repo: UserRepository,
         broadcast_repo: BroadcastRepository,
+        search_repo: SearchRepository | None = None,
         redis: RedisClient | None = None,
     ):
         self.repo = repo
         self.tag_repo = tag_repo
         self.user_repo = user_repo
         self.broadcast_repo = broadcast_repo
+        self.search_repo = search_repo or SearchRepository()
         self.redis = redis
 
-    async def _invalidate_list_cache(self) -> None:
-        if self.redis:
-            await self.redis.delete_by_pattern(f"{ARTICLE_LIST_PREFIX}:*")
-
-    async def _invalidate_detail_cache(self, slug: str) -> None:
-        if self.redis:
-            await self.redis.delete(f"{ARTICLE_DETAIL_PREFIX}:{slug}")
-
-    async def _invalidate_broadcast_detail_cache(self, db: AsyncSession, broadcast_id: int | None) -> None:
-        if not self.redis or not broadcast_id:
+    async def _invalidate_cache(
+        self, db: AsyncSession, *slugs: str, broadcast_ids: tuple[int | None, ...] = ()
+    ) -> None:
+        """Drop the article list and search results, the given article details and the linked broadcasts' details in one Redis round trip."""
+        if not self.redis:
             return
-        try:
-            broadcast = await self.broadcast_repo.get_by_id(db, broadcast_id)
-            await self.redis.delete(f"{BROADCAST_DETAIL_PREFIX}:{broadcast.slug}")
-        except NotFoundError:
-            pass
+        keys = [f"{ARTICLE_DETAIL_PREFIX}:{slug}" for slug in slugs]
+        for broadcast_id in {b for b in broadcast_ids if b}:
+            try:
+                broadcast = await self.broadcast_repo.get_by_id(db, broadcast_id)
+                keys.append(f"{BROADCAST_DETAIL_PREFIX}:{broadcast.slug}")
+            except NotFoundError:
+                pass
+        await self.redis.invalidate(keys=keys, namespaces=[ARTICLE_LIST_PREFIX, SEARCH_PREFIX])
 
     async def create(
         self,
@@ -75,13 +79,11 @@ class ArticleService:
             payload["slug"] = with_random_suffix(base)
             article = await self.repo.create(db, payload, current_user_id=current_user.id)
         await self._sync_tags(db, article.id, tag_names)
+        await self.search_repo.reindex(db, SearchEntityType.ARTICLE, [article.id])
 
         await db.commit()
         await db.refresh(article)
-        await asyncio.gather(
-            self._invalidate_list_cache(),
-            self._invalidate_broadcast_detail_cache(db, article.broadcast_id),
-        )
+        await self._invalidate_cache(db, broadcast_ids=(article.broadcast_id,))
         return await self._to_schema(db, article)
 
     async def list_articles(
@@ -93,14 +95,29 @@ class ArticleService:
         article_type,
         tag: str | None,
         current_user: UserOutSchema | None,
+        cursor: str | None = None,
     ) -> PaginatedSchema[ArticleSummarySchema]:
         # Non-admins may only see published articles
         if current_user is None or not is_admin(current_user):
             status = ArticleStatus.PUBLISHED
 
+        list_total = ListTotal(
+            self.redis, ARTICLE_LIST_PREFIX, ARTICLE_LIST_TTL,
+            filters=(status, article_type, tag),
+            estimate=self.repo.estimate_unfiltered if not any((status, article_type, tag)) else None,
+        )
         # List path omits the large `content` body — repo prunes it from the SELECT too.
-        total = await self.repo.count_filtered(db, status=status, article_type=article_type, tag=tag)
-        articles = await self.repo.get_all_filtered(db, status=status, article_type=article_type, tag=tag, limit=limit, offset=offset)
+        page, total = await list_total.fetch(
+            db,
+            lambda session, with_total: self.repo.get_all_filtered(
+                session, status=status, article_type=article_type, tag=tag,
+                limit=limit, offset=offset, cursor=cursor, with_total=with_total,
+            ),
+            lambda session: self.repo.count_filtered(session, status=status, article_type=article_type, tag=tag),
+            offset=offset,
+            cursor=cursor,
+        )
+        articles, next_cursor = page.items, page.next_cursor
         if not articles:
             return PaginatedSchema(items=[], total=total)
 
@@ -112,7 +129,7 @@ class ArticleService:
             out = ArticleSummarySchema.model_validate(article, from_attributes=True)
             out.tags = [t.name for t in tags_map[article.id]]
             results.append(out)
-        return PaginatedSchema(items=results, total=total)
+        return PaginatedSchema(items=results, total=total, next_cursor=next_cursor)
 
     async def get_by_id(
         self,
@@ -171,30 +188,22 @@ class ArticleService:
 
         if tag_names is not None:
             await self._sync_tags(db, article_id, tag_names)
+        await self.search_repo.reindex(db, SearchEntityType.ARTICLE, [article_id])
 
         await db.commit()
-        await db.refresh(article)
 
-        invalidations = [self._invalidate_list_cache(), self._invalidate_detail_cache(article.slug)]
-        if old_slug != article.slug:
-            invalidations.append(self._invalidate_detail_cache(old_slug))
         # Invalidate broadcast cache for both old and new broadcast_id when the link changes
-        if "broadcast_id" in payload:
-            invalidations.append(self._invalidate_broadcast_detail_cache(db, old_broadcast_id))
-            invalidations.append(self._invalidate_broadcast_detail_cache(db, article.broadcast_id))
-        await asyncio.gather(*invalidations)
+        broadcast_ids = (old_broadcast_id, article.broadcast_id) if "broadcast_id" in payload else ()
+        await self._invalidate_cache(db, *{article.slug, old_slug}, broadcast_ids=broadcast_ids)
 
         return await self._to_schema(db, article)
 
     async def delete_by_id(self, db: AsyncSession, article_id: int, current_user: UserOutSchema) -> None:
         article = await self.repo.get_by_id(db, article_id)
         await self.repo.soft_delete(db, article_id, deleted_by_id=current_user.id)
+        await self.search_repo.reindex(db, SearchEntityType.ARTICLE, [article_id])
         await db.commit()
-        await asyncio.gather(
-            self._invalidate_list_cache(),
-            self._invalidate_detail_cache(article.slug),
-            self._invalidate_broadcast_detail_cache(db, article.broadcast_id),
-        )
+        await self._invalidate_cache(db, article.slug, broadcast_ids=(article.broadcast_id,))
 
     # -------------------------
     # Helpers
@@ -3,6 +3,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import load_only
 
 from app.common.base_repository import BaseRepository
+from app.common.db_utils import estimate_rows
+from app.common.pagination import Page, SortKey, keyset_order, keyset_page, split_page
 from app.domain.broadcast.model import Broadcast, BroadcastTag
 from app.domain.tag.model import Tag
 from app.enums.enums import BroadcastStatus, BroadcastType
@@ -55,7 +57,9 @@ class BroadcastRepository(BaseRepository[Broadcast]):
         tag: str | None,
         limit: int,
         offset: int,
-    ) -> list[Broadcast]:
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page:
         # Prune the large `description` body — the list path serializes summaries only.
         q = select(Broadcast).options(
             load_only(
@@ -65,9 +69,12 @@ class BroadcastRepository(BaseRepository[Broadcast]):
             )
         )
         q = self._apply_filters(q, status, broadcast_type, tag)
-        q = q.order_by(Broadcast.origin_date.desc().nulls_last(), Broadcast.id.desc()).limit(limit).offset(offset)
-        result = await db.execute(q)
-        return list(result.scalars().all())
+        keys = [SortKey(Broadcast.origin_date, nullable=True), SortKey(Broadcast.id)]
+        q = q.order_by(*keyset_order(keys))
+        result = await db.execute(
+            keyset_page(q, keys, limit=limit, offset=offset, cursor=cursor, with_total=with_total)
+        )
+        return split_page(result.all(), limit, with_total)
 
     async def count_filtered(
         self,
@@ -80,6 +87,10 @@ class BroadcastRepository(BaseRepository[Broadcast]):
         result = await db.execute(q)
         return result.scalar() or 0
 
+    async def estimate_unfiltered(self, db: AsyncSession) -> int:
+        """Planner estimate of count_filtered() with no filters (live rows), without scanning them."""
+        return await estimate_rows(db, self._apply_filters(select(Broadcast.id), None, None, None))
+
     async def get_tags_for_broadcasts(
         self, db: AsyncSession, broadcast_ids: list[int]
     ) -> dict[int, list[Tag]]:
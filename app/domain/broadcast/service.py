@@ -9,6 +9,7 @@ from app.common.schema import PaginatedSchema
 from app.domain.article.repository import ArticleRepository
 from app.domain.broadcast.model import BroadcastTag
 from app.domain.broadcast.repository import BroadcastRepository
+from app.domain.search.repository import SearchRepository
 from app.domain.broadcast.schema import (
     ArticleForBroadcastSchema,
     BroadcastCreateSchema,
@@ -19,8 +20,9 @@ from app.domain.broadcast.schema import (
 from app.domain.tag.repository import TagRepository
 from app.domain.user.repository import UserRepository
 from app.domain.user.schema import UserOutSchema
-from app.enums.enums import BroadcastStatus
-from app.common.cache_keys import BROADCAST_DETAIL_PREFIX, BROADCAST_LIST_PREFIX
+from app.enums.enums import BroadcastStatus, SearchEntityType
+from app.common.cache_keys import BROADCAST_DETAIL_PREFIX, BROADCAST_LIST_PREFIX, BROADCAST_LIST_TTL, SEARCH_PREFIX
+from app.common.counts import ListTotal
 from app.exceptions.exceptions import ConflictError, NotFoundError
 from app.infrastructure.redis.client import RedisClient
 from app.utils.slug import slugify, with_random_suffix
@@ -33,21 +35,23 @@ class BroadcastService:
         tag_repo: TagRepository,
         user_repo: UserRepository,
         article_repo: ArticleRepository,
+        search_repo: SearchRepository | None = None,
         redis: RedisClient | None = None,
     ):
         self.repo = repo
         self.tag_repo = tag_repo
         self.user_repo = user_repo
         self.article_repo = article_repo
+        self.search_repo = search_repo or SearchRepository()
         self.redis = redis
 
-    async def _invalidate_list_cache(self) -> None:
+    async def _invalidate_cache(self, *slugs: str) -> None:
+        """Drop the broadcast list, search results and the given broadcast details in one Redis round trip."""
         if self.redis:
-            await self.redis.delete_by_pattern(f"{BROADCAST_LIST_PREFIX}:*")
-
-    async def _invalidate_detail_cache(self, slug: str) -> None:
-        if self.redis:
-            await self.redis.delete(f"{BROADCAST_DETAIL_PREFIX}:{slug}")
+            await self.redis.invalidate(
+                keys=[f"{BROADCAST_DETAIL_PREFIX}:{slug}" for slug in slugs],
+                namespaces=[BROADCAST_LIST_PREFIX, SEARCH_PREFIX],
+            )
 
     async def create(
         self,
@@ -69,10 +73,11 @@ class BroadcastService:
             payload["slug"] = with_random_suffix(base)
             broadcast = await self.repo.create(db, payload, current_user_id=current_user.id)
         await self._sync_tags(db, broadcast.id, tag_names)
+        await self.search_repo.reindex(db, SearchEntityType.BROADCAST, [broadcast.id])
 
         await db.commit()
         await db.refresh(broadcast)
-        await self._invalidate_list_cache()
+        await self._invalidate_cache()
         return await self._to_schema(db, broadcast)
 
     async def list_broadcasts(
@@ -84,14 +89,27 @@ class BroadcastService:
         broadcast_type,
         tag: str | None,
         current_user: UserOutSchema | None,
+        cursor: str | None = None,
     ) -> PaginatedSchema[BroadcastSummarySchema]:
         if current_user is None or not is_admin(current_user):
             status = BroadcastStatus.PUBLISHED
 
-        total = await self.repo.count_filtered(db, status=status, broadcast_type=broadcast_type, tag=tag)
-        broadcasts = await self.repo.get_all_filtered(
-            db, status=status, broadcast_type=broadcast_type, tag=tag, limit=limit, offset=offset
+        list_total = ListTotal(
+            self.redis, BROADCAST_LIST_PREFIX, BROADCAST_LIST_TTL,
+            filters=(status, broadcast_type, tag),
+            estimate=self.repo.estimate_unfiltered if not any((status, broadcast_type, tag)) else None,
         )
+        page, total = await list_total.fetch(
+            db,
+            lambda session, with_total: self.repo.get_all_filtered(
+                session, status=status, broadcast_type=broadcast_type, tag=tag,
+                limit=limit, offset=offset, cursor=cursor, with_total=with_total,
+            ),
+            lambda session: self.repo.count_filtered(session, status=status, broadcast_type=broadcast_type, tag=tag),
+            offset=offset,
+            cursor=cursor,
+        )
+        broadcasts, next_cursor = page.items, page.next_cursor
         if not broadcasts:
             return PaginatedSchema(items=[], total=total)
 
@@ -104,7 +122,7 @@ class BroadcastService:
             out = BroadcastSummarySchema.model_validate(broadcast, from_attributes=True)
             out.tags = [t.name for t in tags_map[broadcast.id]]
             results.append(out)
-        return PaginatedSchema(items=results, total=total)
+        return PaginatedSchema(items=results, total=total, next_cursor=next_cursor)
 
     async def get_by_id(
         self,
@@ -156,22 +174,20 @@ class BroadcastService:
 
         if tag_names is not None:
             await self._sync_tags(db, broadcast_id, tag_names)
+        await self.search_repo.reindex(db, SearchEntityType.BROADCAST, [broadcast_id])
 
         await db.commit()
-        await db.refresh(broadcast)
 
-        invalidations = [self._invalidate_list_cache(), self._invalidate_detail_cache(broadcast.slug)]
-        if old_slug != broadcast.slug:
-            invalidations.append(self._invalidate_detail_cache(old_slug))
-        await asyncio.gather(*invalidations)
+        await self._invalidate_cache(*{broadcast.slug, old_slug})
 
         return await self._to_schema(db, broadcast)
 
     async def delete_by_id(self, db: AsyncSession, broadcast_id: int, current_user: UserOutSchema) -> None:
         broadcast = await self.repo.get_by_id(db, broadcast_id)
         await self.repo.soft_delete(db, broadcast_id, deleted_by_id=current_user.id)
+        await self.search_repo.reindex(db, SearchEntityType.BROADCAST, [broadcast_id])
         await db.commit()
-        await asyncio.gather(self._invalidate_list_cache(), self._invalidate_detail_cache(broadcast.slug))
+        await self._invalidate_cache(broadcast.slug)
 
     # -------------------------
     # Helpers
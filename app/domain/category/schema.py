@@ -9,6 +9,7 @@ class CategoryCreateSchema(CamelModel):
 
 class CategoryUpdateSchema(CamelModel):
     name: str
+    is_hidden_from_all: bool | None = None
 
 
 class CategoryStatusUpdateSchema(CamelModel):
@@ -20,3 +21,4 @@ class CategoryOutSchema(CamelModel):
     name: str
     parent_id: int | None = None
     status: str = VerificationStatus.APPROVED.value
+    is_hidden_from_all: bool = False
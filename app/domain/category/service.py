@@ -3,19 +3,29 @@ from __future__ import annotations
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.common.cache_keys import CATEGORY_LIST_PREFIX
+from app.common.cache_keys import CATEGORY_LIST_PREFIX, PRODUCT_LIST_PREFIX, PRODUCT_STATS, SEARCH_PREFIX
 from app.domain.category.model import Category
 from app.domain.category.repository import CategoryRepository
 from app.domain.category.schema import CategoryCreateSchema, CategoryStatusUpdateSchema, CategoryUpdateSchema
+from app.domain.product.repository import ProductRepository
+from app.domain.search.repository import SearchRepository
 from app.domain.user.schema import UserOutSchema
-from app.enums.enums import VerificationStatus
+from app.enums.enums import SearchEntityType, VerificationStatus
 from app.exceptions.exceptions import NotFoundError
 from app.infrastructure.redis.client import RedisClient
 
 
 class CategoryService:
-    def __init__(self, repo: CategoryRepository, redis: RedisClient | None = None):
+    def __init__(
+        self,
+        repo: CategoryRepository,
+        product_repo: ProductRepository | None = None,
+        search_repo: SearchRepository | None = None,
+        redis: RedisClient | None = None,
+    ):
         self.repo = repo
+        self.product_repo = product_repo or ProductRepository()
+        self.search_repo = search_repo or SearchRepository()
         self.redis = redis
 
     async def get_by_name(self, db: AsyncSession, name: str, *, is_subcategory: bool) -> Category:
@@ -25,9 +35,14 @@ class CategoryService:
             raise NotFoundError(f"{label} '{name}' not found")
         return category
 
-    async def _invalidate_list_cache(self) -> None:
-        if self.redis:
-            await self.redis.delete_by_pattern(f"{CATEGORY_LIST_PREFIX}:*")
+    async def _invalidate_list_cache(self, relisted: bool = False) -> None:
+        """Drop the category lists, plus the product feeds, stats and search when product listing changed."""
+        if not self.redis:
+            return
+        if relisted:
+            await self.redis.invalidate(keys=[PRODUCT_STATS], namespaces=[CATEGORY_LIST_PREFIX, PRODUCT_LIST_PREFIX, SEARCH_PREFIX])
+        else:
+            await self.redis.bump_generation(CATEGORY_LIST_PREFIX)
 
     async def create(
         self,
@@ -60,10 +75,8 @@ class CategoryService:
         data: CategoryStatusUpdateSchema,
         current_user: UserOutSchema,
     ) -> Category:
-        category = await self.repo.get_by_id(db, category_id)
-        await self.repo.update_instance(db, category, {"status": data.status.value})
+        category = await self.repo.update(db, category_id, {"status": data.status.value})
         await db.commit()
-        await db.refresh(category)
         await self._invalidate_list_cache()
         return category
 
@@ -77,9 +90,16 @@ class CategoryService:
         data: CategoryUpdateSchema,
         current_user: UserOutSchema | None = None,
     ) -> Category:
+        category = await self.repo.get_by_id(db, category_id)
+        was_hidden = category.is_hidden_from_all
         result = await self.repo.update(db, category_id, data, current_user_id=current_user.id if current_user else None)
+        relisted = []
+        if result.is_hidden_from_all != was_hidden:
+            product_ids = await self.product_repo.get_ids_in_category_tree(db, category_id)
+            relisted = await self.product_repo.refresh_listed(db, product_ids)
+            await self.search_repo.reindex(db, SearchEntityType.PRODUCT, relisted)
         await db.commit()
-        await self._invalidate_list_cache()
+        await self._invalidate_list_cache(relisted=bool(relisted))
         return result
 
     async def delete_by_id(
@@ -88,7 +108,11 @@ class CategoryService:
         category_id: int,
         current_user: UserOutSchema | None = None,
     ) -> None:
+        # Collected before the delete cascades away the links (and the subcategories).
+        product_ids = await self.product_repo.get_ids_in_category_tree(db, category_id)
         await self.repo.delete_by_id(db, category_id)
+        relisted = await self.product_repo.refresh_listed(db, product_ids)
+        await self.search_repo.reindex(db, SearchEntityType.PRODUCT, relisted)
         await db.commit()
-        await self._invalidate_list_cache()
+        await self._invalidate_list_cache(relisted=bool(relisted))
 
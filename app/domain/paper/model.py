@@ -63,3 +63,6 @@ class Paper(Base, TimestampMixin, UserAuditMixin):
         nullable=False,
         server_default="pending",
     )
+    # Row count of paper_votes, moved by PaperRepository in the statement that adds or removes
+    # the vote; scripts/reconcile_counters.py repairs drift.
+    vote_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
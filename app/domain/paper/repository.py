@@ -1,9 +1,11 @@
-from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy import and_, delete, func, or_, select, update
 from app.exceptions.exceptions import NotFoundError
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.base_repository import BaseRepository
+from app.common.db_utils import shift_counter, shift_counters
+from app.common.pagination import Page, SortKey, keyset_order, keyset_page, split_page
 from app.domain.category.model import Category
 from app.domain.paper.model import Paper, PaperCategory, PaperVote
 from app.enums.enums import PaperStatus, PaperVerificationStatus
@@ -21,7 +23,8 @@ class PaperRepository(BaseRepository[Paper]):
         offset: int,
         user_id: int | None = None,
         paper_status: PaperStatus | None = None,
-    ) -> list[Paper]:
+        cursor: str | None = None,
+    ) -> Page:
         q = select(Paper)
         if verification_status is not None:
             q = q.where(Paper.verification_status == verification_status)
@@ -29,9 +32,11 @@ class PaperRepository(BaseRepository[Paper]):
             q = q.where(Paper.created_by_id == user_id)
         if paper_status is not None:
             q = q.where(Paper.status == paper_status)
-        q = q.limit(limit).offset(offset)
-        result = await db.execute(q)
-        return list(result.scalars().all())
+        # Newest first, like get_latest; id breaks ties so pages never overlap.
+        keys = [SortKey(Paper.created_at), SortKey(Paper.id)]
+        q = q.order_by(*keyset_order(keys))
+        result = await db.execute(keyset_page(q, keys, limit=limit, offset=offset, cursor=cursor))
+        return split_page(result.all(), limit)
 
     async def get_latest(
         self,
@@ -97,34 +102,48 @@ class PaperRepository(BaseRepository[Paper]):
         )
         return {row.paper_id for row in result}
 
-    async def get_vote_counts(
-        self, db: AsyncSession, paper_ids: list[int]
-    ) -> dict[int, int]:
-        result = await db.execute(
-            select(PaperVote.paper_id, func.count().label("cnt"))
-            .where(PaperVote.paper_id.in_(paper_ids))
-            .group_by(PaperVote.paper_id)
-        )
-        counts = {row.paper_id: row.cnt for row in result}
-        return {pid: counts.get(pid, 0) for pid in paper_ids}
-
-    async def get_vote_count(self, db: AsyncSession, paper_id: int) -> int:
-        return (await self.get_vote_counts(db, [paper_id]))[paper_id]
-
-    async def add_vote(self, db: AsyncSession, paper_id: int, user_id: int) -> None:
-        await db.execute(
+    async def add_vote(self, db: AsyncSession, paper_id: int, user_id: int) -> int:
+        """Add the vote and count it onto the paper in one statement. Returns the new count."""
+        inserted = (
             pg_insert(PaperVote)
             .values(paper_id=paper_id, user_id=user_id)
             .on_conflict_do_nothing()
+            .returning(PaperVote.user_id)
+            .cte("inserted")
         )
-
-    async def remove_vote(self, db: AsyncSession, paper_id: int, user_id: int) -> None:
-        await db.execute(
-            delete(PaperVote).where(
-                PaperVote.paper_id == paper_id,
-                PaperVote.user_id == user_id,
-            )
+        return await shift_counter(db, Paper.vote_count, Paper.id == paper_id, inserted) or 0
+
+    async def remove_vote(self, db: AsyncSession, paper_id: int, user_id: int) -> int:
+        deleted = (
+            delete(PaperVote)
+            .where(PaperVote.paper_id == paper_id, PaperVote.user_id == user_id)
+            .returning(PaperVote.user_id)
+            .cte("deleted")
+        )
+        return await shift_counter(db, Paper.vote_count, Paper.id == paper_id, deleted, decrement=True) or 0
+
+    async def remove_user_votes(self, db: AsyncSession, user_id: int) -> list[int]:
+        """Delete the user's paper votes, moving each paper's vote_count down in the same statement.
+        Returns the papers touched."""
+        deleted = delete(PaperVote).where(PaperVote.user_id == user_id).returning(PaperVote.paper_id).cte("deleted")
+        return await shift_counters(db, Paper.vote_count, deleted, decrement=True)
+
+    async def reconcile_vote_counts(self, db: AsyncSession, dry_run: bool = False) -> list[int]:
+        """Reset every paper vote_count that disagrees with paper_votes; returns the ids corrected."""
+        actual = (
+            select(func.count()).select_from(PaperVote).where(PaperVote.paper_id == Paper.id).scalar_subquery()
         )
+        if dry_run:
+            result = await db.execute(select(Paper.id).where(Paper.vote_count != actual))
+        else:
+            result = await db.execute(
+                update(Paper)
+                .where(Paper.vote_count != actual)
+                .values({Paper.vote_count: actual, Paper.updated_at: Paper.updated_at})
+                .returning(Paper.id)
+                .execution_options(synchronize_session=False)
+            )
+        return sorted(result.scalars().all())
 
     async def get_related(
         self,
@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.cache_keys import SEARCH_PREFIX
 from app.common.db_utils import sync_categories
 from app.common.permissions import assert_can_modify, is_admin, is_owner
 from app.domain.category.repository import CategoryRepository
@@ -15,16 +16,33 @@ from app.domain.paper.schema import (
     PaperVerificationStatusUpdateSchema,
     VoteOutSchema,
 )
+from app.domain.search.repository import SearchRepository
 from app.domain.user.schema import UserOutSchema
-from app.enums.enums import PaperStatus, PaperVerificationStatus
+from app.enums.enums import PaperStatus, PaperVerificationStatus, SearchEntityType
 from app.exceptions.exceptions import ConflictError, NotFoundError
+from app.infrastructure.redis.client import RedisClient
 from app.utils.slug import slugify, with_random_suffix
 
 
 class PaperService:
-    def __init__(self, repo: PaperRepository, category_repo: CategoryRepository):
+    def __init__(
+        self,
+        repo: PaperRepository,
+        category_repo: CategoryRepository,
+        search_repo: SearchRepository | None = None,
+        redis: RedisClient | None = None,
+    ):
         self.repo = repo
         self.category_repo = category_repo
+        self.search_repo = search_repo or SearchRepository()
+        self.redis = redis
+
+    async def _commit_and_reindex(self, db: AsyncSession, paper_id: int) -> None:
+        """Commit the paper's write together with its search document, then drop cached search results."""
+        await self.search_repo.reindex(db, SearchEntityType.PAPER, [paper_id])
+        await db.commit()
+        if self.redis:
+            await self.redis.invalidate(namespaces=[SEARCH_PREFIX])
 
     async def create(
         self,
@@ -50,7 +68,7 @@ class PaperService:
 
         await sync_categories(db, self.category_repo, PaperCategory.__table__, "paper_id", paper.id, category_ids)
 
-        await db.commit()
+        await self._commit_and_reindex(db, paper.id)
         await db.refresh(paper)
         return await self._to_schema(db, paper, current_user=current_user)
 
@@ -63,34 +81,35 @@ class PaperService:
         paper_status: PaperStatus | None = None,
         current_user: UserOutSchema | None = None,
         owner_only: bool = False,
-    ) -> list[PaperOutSchema]:
+        cursor: str | None = None,
+    ) -> tuple[list[PaperOutSchema], str | None]:
+        """One page of papers and the cursor for the next page (None on the last one)."""
         user_id: int | None = None
         if owner_only and current_user is not None:
             user_id = current_user.id
         elif current_user is None or not is_admin(current_user):
             verification_status = PaperVerificationStatus.APPROVED
-        papers = await self.repo.get_all_by_verification_status(db, verification_status, limit=limit, offset=offset, user_id=user_id, paper_status=paper_status)
+        page = await self.repo.get_all_by_verification_status(
+            db, verification_status, limit=limit, offset=offset, user_id=user_id, paper_status=paper_status, cursor=cursor
+        )
+        papers, next_cursor = page.items, page.next_cursor
         if not papers:
-            return []
+            return [], next_cursor
         paper_ids = [p.id for p in papers]
-        tasks = [
-            self.repo.get_vote_counts(db, paper_ids),
-            self.repo.get_categories_for_papers(db, paper_ids),
-        ]
+        tasks = [self.repo.get_categories_for_papers(db, paper_ids)]
         if current_user:
             tasks.append(self.repo.get_user_votes(db, paper_ids, current_user.id))
         gathered = await asyncio.gather(*tasks)
-        vote_counts, categories_map = gathered[0], gathered[1]
-        user_votes: set[int] = gathered[2] if current_user else set()
+        categories_map = gathered[0]
+        user_votes: set[int] = gathered[1] if current_user else set()
         results = []
         for paper in papers:
             out = PaperOutSchema.model_validate(paper, from_attributes=True)
-            out.vote_count = vote_counts[paper.id]
             out.category_ids = [c.id for c in categories_map[paper.id]]
             if current_user:
                 out.voted = paper.id in user_votes
             results.append(out)
-        return results
+        return results, next_cursor
 
     async def get_by_id(
         self, db: AsyncSession, paper_id: int, current_user: UserOutSchema | None = None
@@ -145,8 +164,7 @@ class PaperService:
         if category_ids is not None:
             await sync_categories(db, self.category_repo, PaperCategory.__table__, "paper_id", paper_id, category_ids)
 
-        await db.commit()
-        await db.refresh(paper)
+        await self._commit_and_reindex(db, paper_id)
         return await self._to_schema(db, paper)
 
     async def delete_by_id(
@@ -158,7 +176,7 @@ class PaperService:
         paper = await self.repo.get_by_id(db, paper_id)
         assert_can_modify(paper, current_user)
         await self.repo.delete_by_id(db, paper_id)
-        await db.commit()
+        await self._commit_and_reindex(db, paper_id)
 
     async def update_verification_status(
         self,
@@ -167,8 +185,7 @@ class PaperService:
         data: PaperVerificationStatusUpdateSchema,
     ) -> PaperOutSchema:
         paper = await self.repo.update(db, paper_id, {"verification_status": data.verification_status}, current_user_id=None)
-        await db.commit()
-        await db.refresh(paper)
+        await self._commit_and_reindex(db, paper_id)
         return await self._to_schema(db, paper)
 
     async def vote(
@@ -181,12 +198,11 @@ class PaperService:
         await self.repo.assert_exists_by_id(db, paper_id)
 
         if voted:
-            await self.repo.add_vote(db, paper_id, current_user.id)
+            vote_count = await self.repo.add_vote(db, paper_id, current_user.id)
         else:
-            await self.repo.remove_vote(db, paper_id, current_user.id)
+            vote_count = await self.repo.remove_vote(db, paper_id, current_user.id)
 
         await db.commit()
-        vote_count = await self.repo.get_vote_count(db, paper_id)
         return VoteOutSchema(paper_id=paper_id, vote_count=vote_count)
 
     async def get_related(
@@ -215,31 +231,22 @@ class PaperService:
         if not papers:
             return []
         ids = [p.id for p in papers]
-        vote_counts, categories_map = await asyncio.gather(
-            self.repo.get_vote_counts(db, ids),
-            self.repo.get_categories_for_papers(db, ids),
-        )
+        categories_map = await self.repo.get_categories_for_papers(db, ids)
         results = []
         for p in papers:
             out = PaperOutSchema.model_validate(p, from_attributes=True)
-            out.vote_count = vote_counts[p.id]
             out.category_ids = [c.id for c in categories_map[p.id]]
             results.append(out)
         return results
 
     async def _to_schema(self, db: AsyncSession, paper, current_user: UserOutSchema | None = None) -> PaperOutSchema:
-        tasks = [
-            self.repo.get_categories_for_paper(db, paper.id),
-            self.repo.get_vote_count(db, paper.id),
-        ]
+        tasks = [self.repo.get_categories_for_paper(db, paper.id)]
         if current_user:
             tasks.append(self.repo.get_user_votes(db, [paper.id], current_user.id))
         gathered = await asyncio.gather(*tasks)
-        categories, vote_count = gathered[0], gathered[1]
         result = PaperOutSchema.model_validate(paper, from_attributes=True)
-        result.category_ids = [c.id for c in categories]
-        result.vote_count = vote_count
+        result.category_ids = [c.id for c in gathered[0]]
         if current_user:
-            result.voted = paper.id in gathered[2]
+            result.voted = paper.id in gathered[1]
         return result
 
@@ -1,7 +1,8 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import String, Integer, Float, Numeric, Text, Boolean, DateTime, ForeignKey, Enum as SQLEnum, PrimaryKeyConstraint, CheckConstraint, Index, UniqueConstraint, cast
+from sqlalchemy import String, Integer, Float, Numeric, Text, Boolean, DateTime, ForeignKey, Enum as SQLEnum, PrimaryKeyConstraint, CheckConstraint, Computed, Index, UniqueConstraint, cast, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.types import UserDefinedType
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -10,6 +11,10 @@ from app.common.audit_mixin import TimestampMixin, UserAuditMixin, SoftDeleteMix
 from app.enums.enums import ProductStage, ProductStatus, ProductLinkType, ProductMediaType, VerificationStatus, BountyStatus
 
 
+# Text search configuration of Product.search_vector; queries must parse with the same one.
+SEARCH_CONFIG = "english"
+
+
 class LtreeType(UserDefinedType):
     """PostgreSQL ltree extension type. Stored as ltree in DB, returned as str in Python."""
     cache_ok = True
@@ -40,7 +45,11 @@ class LtreeType(UserDefinedType):
 
 class ProductCategory(Base, TimestampMixin):
     __tablename__ = "product_category"
-    __table_args__ = (PrimaryKeyConstraint("product_id", "category_id"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("product_id", "category_id"),
+        # Category feeds and "more in this category" start from the category side.
+        Index("ix_product_category_category", "category_id", "product_id"),
+    )
 
     product_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False
@@ -153,6 +162,34 @@ class Product(Base, TimestampMixin, UserAuditMixin, SoftDeleteMixin):
         Index("ix_products_status_created", "status", "created_at"),
         # Approved-product browse path sorts by approved_at; mirrors the above for that query shape.
         Index("ix_products_status_approved", "status", "approved_at"),
+        # Feeds match their keyset order (ProductRepository._build_status_query), so a page is an
+        # index range scan instead of a sort over every product the filters let through.
+        # Newest/oldest feeds of any status (admin views, category feeds); OLDEST scans backward.
+        Index(
+            "ix_products_status_launch",
+            "status",
+            text("launch_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_products_status_top",
+            "status",
+            text("vote_count DESC"),
+            text("launch_at DESC"),
+            text("id DESC"),
+        ),
+        # Default (listed) feed: its keyset order over exactly the rows it can return.
+        Index(
+            "ix_products_listed_feed",
+            text("launch_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("status = 'approved' AND deleted_at IS NULL AND is_listed"),
+        ),
+        # Product search (ProductRepository._build_status_query): full-text over search_vector,
+        # plus trigram matching on the name for substrings and typos (needs pg_trgm).
+        Index("ix_products_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_products_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
     )
 
     id: Mapped[int] = mapped_column(
@@ -178,6 +215,32 @@ class Product(Base, TimestampMixin, UserAuditMixin, SoftDeleteMixin):
         server_default="pending",
     )
     approved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Products launch (become publicly visible) when approved, not when submitted; never-approved
+    # rows fall back to created_at. Every feed orders by it.
+    launch_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        Computed("coalesce(approved_at, created_at)", persisted=True),
+    )
+    # Denormalized row counts of product_votes / product_bookmarks / product_investor_interests,
+    # moved by ProductRepository in the statement that adds or removes the row.
+    # scripts/reconcile_counters.py repairs drift (e.g. rows removed by a user's cascade delete).
+    vote_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    bookmark_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    investor_interest_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    # False while the product sits in a category hidden from all feeds (Category.is_hidden_from_all).
+    # Kept in step by ProductRepository.refresh_listed() wherever either side changes.
+    is_listed: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="true")
+    # Weighted name > short_desc > description. Only ever queried, so never loaded.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(short_desc, '')), 'B') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(\"desc\", '')), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
 
 class ProductLink(Base, TimestampMixin, UserAuditMixin):
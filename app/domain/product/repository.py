@@ -1,11 +1,13 @@
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import delete, func, insert, or_, select, text
-from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import Float, Text, cast, delete, exists, func, insert, literal, literal_column, null, or_, select, text, union_all, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import load_only
+from sqlalchemy.orm import aliased, join, load_only
 
 from app.common.base_repository import BaseRepository
+from app.common.db_utils import estimate_rows, shift_counter, shift_counters
+from app.common.pagination import Page, SortKey, keyset_order, keyset_page, split_page
 from app.domain.category.model import Category
 from app.domain.lab.model import Lab
 from app.domain.paper.model import Paper
@@ -14,6 +16,7 @@ from app.domain.user.model import ResearcherProfile, User
 from app.enums.enums import PaperStatus, ProductDateFilter, ProductSortBy, ProductStatus
 from app.exceptions.exceptions import NotFoundError, ValidationError
 from app.domain.product.model import (
+    SEARCH_CONFIG,
     Product,
     ProductBookmark,
     ProductCategory,
@@ -32,6 +35,31 @@ from app.domain.product.model import (
 )
 from app.enums.enums import VerificationStatus
 
+# Per-viewer flag name -> the interaction table it's read from (see get_user_flags).
+USER_FLAGS = {"voted": ProductVote, "bookmarked": ProductBookmark, "interested": ProductInvestorInterest}
+
+
+def _json_object(**fields):
+    """json_build_object('key', value, ...). Keys are inlined: json_build_object takes "any", so
+    Postgres can't infer the type of a bound key parameter."""
+    args = []
+    for key, value in fields.items():
+        args += [literal_column(f"'{key}'"), value]
+    return func.json_build_object(*args)
+
+
+def _json_array(element, *where, order_by=(), select_from=None):
+    """Correlated scalar subquery aggregating element over the matching rows; '[]' when there are none."""
+    agg = func.json_agg(aggregate_order_by(element, *order_by) if order_by else element)
+    q = select(func.coalesce(agg, literal_column("'[]'::json")))
+    if select_from is not None:
+        q = q.select_from(select_from)
+    return q.where(*where).scalar_subquery()
+
+
+def _count(model, *where):
+    return select(func.count()).select_from(model).where(*where).scalar_subquery()
+
 
 class CommentRepository(BaseRepository[ProductComment]):
     def __init__(self) -> None:
@@ -112,7 +140,7 @@ class ProductLinkRepository(BaseRepository[ProductLink]):
         result = await db.execute(
             select(ProductLink)
             .where(ProductLink.product_id == product_id)
-            .order_by(ProductLink.link_type.asc(), ProductLink.created_at.asc())
+            .order_by(ProductLink.link_type.asc(), ProductLink.created_at.asc(), ProductLink.id.asc())
         )
         return list(result.scalars().all())
 
@@ -127,7 +155,7 @@ class ProductMediaRepository(BaseRepository[ProductMedia]):
         result = await db.execute(
             select(ProductMedia)
             .where(ProductMedia.product_id == product_id)
-            .order_by(ProductMedia.sort_order.asc(), ProductMedia.created_at.asc())
+            .order_by(ProductMedia.sort_order.asc(), ProductMedia.created_at.asc(), ProductMedia.id.asc())
         )
         return list(result.scalars().all())
 
@@ -150,7 +178,8 @@ class ProductTeamRepository(BaseRepository[ProductTeamMember]):
         q = select(ProductTeamMember).where(ProductTeamMember.product_id == product_id)
         if status is not None:
             q = q.where(ProductTeamMember.status == status)
-        q = q.order_by(ProductTeamMember.created_at.asc())
+        # Rows created together share created_at (the transaction's now()); id keeps their order.
+        q = q.order_by(ProductTeamMember.created_at.asc(), ProductTeamMember.id.asc())
         result = await db.execute(q)
         return list(result.scalars().all())
 
@@ -165,7 +194,7 @@ class ProductBackerRepository(BaseRepository[ProductBacker]):
         result = await db.execute(
             select(ProductBacker)
             .where(ProductBacker.product_id == product_id)
-            .order_by(ProductBacker.created_at.asc())
+            .order_by(ProductBacker.created_at.asc(), ProductBacker.id.asc())
         )
         return list(result.scalars().all())
 
@@ -180,7 +209,7 @@ class ProductGrantRepository(BaseRepository[ProductGrant]):
         result = await db.execute(
             select(ProductGrant)
             .where(ProductGrant.product_id == product_id)
-            .order_by(ProductGrant.created_at.asc())
+            .order_by(ProductGrant.created_at.asc(), ProductGrant.id.asc())
         )
         return list(result.scalars().all())
 
@@ -236,11 +265,6 @@ class ProductRepository(BaseRepository[Product]):
         now = datetime.now(tz=timezone.utc)
         # Exclude products in hidden categories (e.g. Nouns) so stats match the
         # default listed feed, which filters the same way via listed=True.
-        hidden_product_ids = (
-            select(ProductCategory.product_id)
-            .join(Category, ProductCategory.category_id == Category.id)
-            .where(Category.is_hidden_from_all == True)
-        )
         # Cutoffs come from _period_cutoff so these counts match the list filters exactly.
         q = select(
             func.count().label("total"),
@@ -251,7 +275,7 @@ class ProductRepository(BaseRepository[Product]):
         ).where(
             Product.status == ProductStatus.APPROVED,
             Product.deleted_at.is_(None),
-            ~Product.id.in_(hidden_product_ids),
+            Product.is_listed,
         )
         row = (await db.execute(q)).mappings().one()
         return dict(row)
@@ -286,19 +310,7 @@ class ProductRepository(BaseRepository[Product]):
         upvoted_by_user_id: int | None = None,
         listed: bool | None = None,
     ):
-        vote_subq = None
-        if sort_by == ProductSortBy.TOP:
-            vote_subq = (
-                select(
-                    ProductVote.product_id,
-                    func.count().label("vote_count"),
-                )
-                .group_by(ProductVote.product_id)
-                .subquery()
-            )
-            q = select(Product).outerjoin(vote_subq, vote_subq.c.product_id == Product.id)
-        else:
-            q = select(Product)
+        q = select(Product)
 
         if status is not None:
             q = q.where(Product.status == status)
@@ -315,8 +327,19 @@ class ProductRepository(BaseRepository[Product]):
         if date_filter is not None:
             cutoff = self._period_cutoff(datetime.now(tz=timezone.utc), date_filter)
             q = q.where(Product.created_at >= cutoff)
+        search_rank = None
         if search and (search_text := search.strip()):
-            q = q.where(Product.name.ilike(f"%{search_text}%"))
+            query = func.websearch_to_tsquery(SEARCH_CONFIG, search_text)
+            q = q.where(or_(
+                Product.search_vector.bool_op("@@")(query),
+                # Trigram index on name: substrings/prefixes, and near misses (word_similarity).
+                Product.name.ilike(f"%{search_text}%"),
+                literal(search_text).bool_op("<%")(Product.name),
+            ))
+            search_rank = (
+                func.ts_rank(Product.search_vector, query, type_=Float)
+                + func.word_similarity(search_text, Product.name, type_=Float)
+            )
         if upvoted_by_user_id is not None:
             q = q.where(
                 Product.id.in_(
@@ -324,33 +347,27 @@ class ProductRepository(BaseRepository[Product]):
                 )
             )
         if listed is not None:
-            hidden_product_ids = (
-                select(ProductCategory.product_id)
-                .join(Category, ProductCategory.category_id == Category.id)
-                .where(Category.is_hidden_from_all == True)
-            )
-            if listed:
-                q = q.where(~Product.id.in_(hidden_product_ids))
-            else:
-                q = q.where(Product.id.in_(hidden_product_ids))
+            # With status=APPROVED, listed=True is the predicate of ix_products_listed_feed.
+            q = q.where(Product.is_listed if listed else ~Product.is_listed)
 
         q = q.where(Product.deleted_at.is_(None))
 
-        # Products launch (become publicly visible) when approved, not when submitted —
-        # sort by that recency, falling back to created_at for never-approved rows.
-        approved_or_created = func.coalesce(Product.approved_at, Product.created_at)
-        if vote_subq is not None:
-            q = q.order_by(
-                func.coalesce(vote_subq.c.vote_count, 0).desc(),
-                approved_or_created.desc(),
-                Product.id.desc(),
-            )
+        if sort_by == ProductSortBy.TOP:
+            # Read off ix_products_status_top, which must list the same columns in this order.
+            keys = [
+                SortKey(Product.vote_count),
+                SortKey(Product.launch_at),
+                SortKey(Product.id),
+            ]
+        elif search_rank is not None and sort_by is None:
+            # Searches without an explicit sort come back best match first.
+            keys = [SortKey(search_rank), SortKey(Product.id)]
         elif sort_by == ProductSortBy.OLDEST:
-            q = q.order_by(approved_or_created.asc(), Product.id.asc())
+            keys = [SortKey(Product.launch_at, descending=False), SortKey(Product.id, descending=False)]
         else:
-            q = q.order_by(approved_or_created.desc(), Product.id.desc())
+            keys = [SortKey(Product.launch_at), SortKey(Product.id)]
 
-        return q, vote_subq
+        return q.order_by(*keyset_order(keys)), keys
 
     async def get_all_by_status(
         self,
@@ -365,8 +382,10 @@ class ProductRepository(BaseRepository[Product]):
         search: str | None = None,
         upvoted_by_user_id: int | None = None,
         listed: bool | None = None,
-    ) -> list[Product]:
-        q, _ = self._build_status_query(status, user_id, category_id, date_filter, sort_by, search, upvoted_by_user_id, listed)
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page:
+        q, keys = self._build_status_query(status, user_id, category_id, date_filter, sort_by, search, upvoted_by_user_id, listed)
         # Summary list serializes these columns only — prune the `description` body and unused fields from the read.
         q = q.options(
             load_only(
@@ -375,9 +394,11 @@ class ProductRepository(BaseRepository[Product]):
                 Product.logo, Product.status, Product.created_at, Product.updated_at,
                 Product.approved_at,
             )
-        ).limit(limit).offset(offset)
-        result = await db.execute(q)
-        return list(result.scalars().all())
+        )
+        result = await db.execute(
+            keyset_page(q, keys, limit=limit, offset=offset, cursor=cursor, with_total=with_total)
+        )
+        return split_page(result.all(), limit, with_total)
 
     async def count_by_status(
         self,
@@ -395,6 +416,13 @@ class ProductRepository(BaseRepository[Product]):
         result = await db.execute(q)
         return result.scalar() or 0
 
+    async def estimate_by_status(
+        self, db: AsyncSession, status: ProductStatus | None = None, listed: bool | None = None
+    ) -> int:
+        """Planner estimate of count_by_status(status, listed=listed), without scanning the rows."""
+        q, _ = self._build_status_query(status, listed=listed)
+        return await estimate_rows(db, q)
+
     async def get_by_ids(self, db: AsyncSession, product_ids: list[int]) -> list[Product]:
         result = await db.execute(
             select(Product).where(Product.id.in_(product_ids), Product.deleted_at.is_(None))
@@ -421,6 +449,162 @@ class ProductRepository(BaseRepository[Product]):
             raise NotFoundError(f"Product with ID {product_id} not found")  # Don't reveal existence of product if status doesn't match
         return instance
 
+    async def get_detail_json(
+        self,
+        db: AsyncSession,
+        *,
+        media_base_url: str,
+        slug: str | None = None,
+        product_id: int | None = None,
+        viewer_id: int | None = None,
+        viewer_is_admin: bool = False,
+    ) -> str | None:
+        """The whole ProductOutSchema payload for one product as JSON text, in a single statement.
+
+        Counts, categories, founder, papers and every child collection are correlated json_agg
+        subqueries, so detail is one round trip instead of one per collection. Unapproved team
+        members are included only for admins and the product's owner (viewer_id); voted/bookmarked/
+        interested are null without a viewer. logo is returned as stored. Visibility by status is
+        left to the caller. Returns None if no such (non-deleted) product exists.
+        """
+        parent, sub = aliased(Category), aliased(Category)
+        sub_link = aliased(ProductCategory)
+        # Nested as CategoryRefSchema expects: parent categories, each with the product's subcategories.
+        subcategories = _json_array(
+            _json_object(id=sub.id, name=sub.name, status=sub.status),
+            sub_link.product_id == ProductCategory.product_id,
+            sub.parent_id == parent.id,
+            select_from=join(sub_link, sub, sub.id == sub_link.category_id),
+        )
+        categories = _json_array(
+            _json_object(id=parent.id, name=parent.name, subcategories=subcategories),
+            ProductCategory.product_id == Product.id,
+            parent.parent_id.is_(None),
+            select_from=join(ProductCategory, parent, parent.id == ProductCategory.category_id),
+        )
+        founder = (
+            select(_json_object(
+                id=User.id, name=User.name, lab_name=Lab.name, university_name=University.name,
+            ))
+            .select_from(User)
+            .outerjoin(ResearcherProfile, ResearcherProfile.user_id == User.id)
+            .outerjoin(Lab, Lab.id == ResearcherProfile.lab_id)
+            .outerjoin(University, University.id == Lab.university_id)
+            .where(User.id == Product.created_by_id)
+            .scalar_subquery()
+        )
+
+        team_where = [ProductTeamMember.product_id == Product.id]
+        if not viewer_is_admin:
+            approved = ProductTeamMember.status == VerificationStatus.APPROVED
+            team_where.append(or_(approved, Product.created_by_id == viewer_id) if viewer_id is not None else approved)
+
+        def flag(model):
+            if viewer_id is None:
+                return null()
+            return exists().where(model.product_id == Product.id, model.user_id == viewer_id)
+
+        payload = _json_object(
+            id=Product.id,
+            slug=Product.slug,
+            name=Product.name,
+            short_desc=Product.short_desc,
+            description=Product.description,
+            stage=Product.stage,
+            funding=Product.funding,
+            founded=Product.founded,
+            quality_badge=Product.quality_badge,
+            imported=Product.imported,
+            logo=Product.logo,
+            email=Product.email,
+            status=Product.status,
+            created_at=Product.created_at,
+            updated_at=Product.updated_at,
+            approved_at=Product.approved_at,
+            created_by_id=Product.created_by_id,
+            vote_count=Product.vote_count,
+            bookmark_count=Product.bookmark_count,
+            investor_interest_count=Product.investor_interest_count,
+            categories=categories,
+            founder=founder,
+            voted=flag(ProductVote),
+            bookmarked=flag(ProductBookmark),
+            interested=flag(ProductInvestorInterest),
+            papers=_json_array(
+                _json_object(
+                    id=Paper.id, title=Paper.title, slug=Paper.slug,
+                    abstract=Paper.abstract, published_at=Paper.published_at,
+                ),
+                Paper.product_id == Product.id,
+                Paper.status == PaperStatus.PUBLISHED,
+                order_by=[Paper.published_at.desc()],
+            ),
+            links=_json_array(
+                _json_object(
+                    id=ProductLink.id, product_id=ProductLink.product_id, link_type=ProductLink.link_type,
+                    url=ProductLink.url, label=ProductLink.label,
+                ),
+                ProductLink.product_id == Product.id,
+                order_by=[ProductLink.link_type.asc(), ProductLink.created_at.asc(), ProductLink.id.asc()],
+            ),
+            media=_json_array(
+                _json_object(
+                    id=ProductMedia.id, media_type=ProductMedia.media_type, sort_order=ProductMedia.sort_order,
+                    url=literal(f"{media_base_url}/") + ProductMedia.storage_key,
+                ),
+                ProductMedia.product_id == Product.id,
+                order_by=[ProductMedia.sort_order.asc(), ProductMedia.created_at.asc(), ProductMedia.id.asc()],
+            ),
+            team=_json_array(
+                _json_object(
+                    id=ProductTeamMember.id, product_id=ProductTeamMember.product_id, user_id=ProductTeamMember.user_id,
+                    name=ProductTeamMember.name, role_label=ProductTeamMember.role_label,
+                    bio_note=ProductTeamMember.bio_note, linkedin_url=ProductTeamMember.linkedin_url,
+                    twitter_url=ProductTeamMember.twitter_url, github_url=ProductTeamMember.github_url,
+                    other_url=ProductTeamMember.other_url, status=ProductTeamMember.status,
+                ),
+                *team_where,
+                order_by=[ProductTeamMember.created_at.asc(), ProductTeamMember.id.asc()],
+            ),
+            backers=_json_array(
+                _json_object(id=ProductBacker.id, product_id=ProductBacker.product_id, name=ProductBacker.name),
+                ProductBacker.product_id == Product.id,
+                order_by=[ProductBacker.created_at.asc(), ProductBacker.id.asc()],
+            ),
+            grants=_json_array(
+                _json_object(id=ProductGrant.id, product_id=ProductGrant.product_id, name=ProductGrant.name),
+                ProductGrant.product_id == Product.id,
+                order_by=[ProductGrant.created_at.asc(), ProductGrant.id.asc()],
+            ),
+            voices=_json_array(
+                _json_object(
+                    id=ProductVoice.id, product_id=ProductVoice.product_id, quote=ProductVoice.quote,
+                    source_url=ProductVoice.source_url, author_name=ProductVoice.author_name,
+                    sort_order=ProductVoice.sort_order,
+                ),
+                ProductVoice.product_id == Product.id,
+                order_by=[ProductVoice.sort_order.asc(), ProductVoice.created_at.asc()],
+            ),
+            bounties=_json_array(
+                _json_object(
+                    id=Bounty.id, product_id=Bounty.product_id, title=Bounty.title, tech_label=Bounty.tech_label,
+                    # As text so Decimal keeps its scale ("10.50", not 10.5).
+                    reward_amount=cast(Bounty.reward_amount, Text), status=Bounty.status,
+                    external_url=Bounty.external_url,
+                ),
+                Bounty.product_id == Product.id,
+                order_by=[Bounty.created_at.desc()],
+            ),
+        )
+
+        q = select(cast(payload, Text)).where(Product.deleted_at.is_(None))
+        if slug is not None:
+            q = q.where(Product.slug == slug)
+        else:
+            q = q.where(Product.id == product_id)
+        result = await db.execute(q)
+        return result.scalar_one_or_none()
+
     # -------------------------
     # Categories
     # -------------------------
@@ -445,7 +629,6 @@ class ProductRepository(BaseRepository[Product]):
     async def get_product_ids_by_category_ids(
         self, db: AsyncSession, category_ids: list[int], exclude_ids: list[int], limit: int
     ) -> list[int]:
-        approved_or_created = func.coalesce(Product.approved_at, Product.created_at)
         result = await db.execute(
             select(ProductCategory.product_id)
             .join(Product, Product.id == ProductCategory.product_id)
@@ -455,12 +638,54 @@ class ProductRepository(BaseRepository[Product]):
                 Product.status == ProductStatus.APPROVED,
                 Product.deleted_at.is_(None),
             )
-            .group_by(ProductCategory.product_id, approved_or_created, Product.id)
-            .order_by(approved_or_created.desc(), Product.id.desc())
+            .group_by(ProductCategory.product_id, Product.launch_at, Product.id)
+            .order_by(Product.launch_at.desc(), Product.id.desc())
             .limit(limit)
         )
         return [row.product_id for row in result]
 
+    async def get_ids_in_category_tree(self, db: AsyncSession, category_id: int) -> list[int]:
+        """Ids of products linked to category_id or to one of its subcategories."""
+        result = await db.execute(
+            select(ProductCategory.product_id)
+            .join(Category, Category.id == ProductCategory.category_id)
+            .where(or_(Category.id == category_id, Category.parent_id == category_id))
+            .distinct()
+        )
+        return list(result.scalars().all())
+
+    async def refresh_listed(
+        self, db: AsyncSession, product_ids: list[int] | None = None, dry_run: bool = False
+    ) -> list[int]:
+        """Recompute is_listed for product_ids (every product when None) from their categories.
+
+        Only rows whose flag is wrong are written; returns their ids. Call it after a product's
+        categories change, or after a category's is_hidden_from_all flips.
+        """
+        if product_ids is not None and not product_ids:
+            return []
+        hidden = exists().where(
+            ProductCategory.product_id == Product.id,
+            Category.id == ProductCategory.category_id,
+            Category.is_hidden_from_all == True,
+        )
+        # Listed exactly when not hidden, so a flag equal to `hidden` is stale.
+        stale = Product.is_listed == hidden
+        if product_ids is not None:
+            stale = stale & Product.id.in_(product_ids)
+        if dry_run:
+            result = await db.execute(select(Product.id).where(stale))
+        else:
+            result = await db.execute(
+                update(Product)
+                .where(stale)
+                # Keep updated_at: re-deriving the flag isn't an edit of the product.
+                .values({Product.is_listed: ~hidden, Product.updated_at: Product.updated_at})
+                .returning(Product.id)
+                .execution_options(synchronize_session=False)
+            )
+        return sorted(result.scalars().all())
+
     # -------------------------
     # Similar products (admin-curated, symmetric)
     # -------------------------
@@ -581,20 +806,6 @@ class ProductRepository(BaseRepository[Product]):
     # -------------------------
     # Votes
     # -------------------------
-    async def get_vote_counts(
-        self, db: AsyncSession, product_ids: list[int]
-    ) -> dict[int, int]:
-        result = await db.execute(
-            select(ProductVote.product_id, func.count().label("cnt"))
-            .where(ProductVote.product_id.in_(product_ids))
-            .group_by(ProductVote.product_id)
-        )
-        counts = {row.product_id: row.cnt for row in result}
-        return {pid: counts.get(pid, 0) for pid in product_ids}
-
-    async def get_vote_count(self, db: AsyncSession, product_id: int) -> int:
-        return (await self.get_vote_counts(db, [product_id]))[product_id]
-
     async def get_user_votes(
         self, db: AsyncSession, product_ids: list[int], user_id: int
     ) -> set[int]:
@@ -607,6 +818,27 @@ class ProductRepository(BaseRepository[Product]):
         )
         return {row.product_id for row in result}
 
+    async def get_user_flags(
+        self, db: AsyncSession, product_ids: list[int], user_id: int, only: tuple[str, ...] = tuple(USER_FLAGS)
+    ) -> dict[str, set[int]]:
+        """The user's flags (votes, bookmarks, investor interests) among product_ids, in one query.
+
+        only names the flags to read; the other interaction tables aren't touched.
+        """
+        def flagged(flag: str):
+            model = USER_FLAGS[flag]
+            return select(literal(flag).label("flag"), model.product_id).where(
+                model.product_id.in_(product_ids),
+                model.user_id == user_id,
+            )
+
+        queries = [flagged(flag) for flag in only]
+        result = await db.execute(union_all(*queries) if len(queries) > 1 else queries[0])
+        flags: dict[str, set[int]] = {flag: set() for flag in only}
+        for row in result:
+            flags[row.flag].add(row.product_id)
+        return flags
+
     async def get_voted_product_ids_by_user(
         self, db: AsyncSession, user_id: int, limit: int, offset: int
     ) -> list[int]:
@@ -619,49 +851,22 @@ class ProductRepository(BaseRepository[Product]):
         )
         return [row.product_id for row in result]
 
-    async def add_vote(self, db: AsyncSession, product_id: int, user_id: int) -> None:
-        await db.execute(
-            pg_insert(ProductVote)
-            .values(product_id=product_id, user_id=user_id)
-            .on_conflict_do_nothing()
-        )
+    async def add_vote(self, db: AsyncSession, product_id: int, user_id: int) -> int:
+        return await self._add_interactions(db, ProductVote, Product.vote_count, product_id, [user_id])
 
     async def add_votes_bulk(
         self, db: AsyncSession, product_id: int, user_ids: list[int]
     ) -> None:
         if not user_ids:
             return
-        await db.execute(
-            pg_insert(ProductVote)
-            .values([{"product_id": product_id, "user_id": uid} for uid in user_ids])
-            .on_conflict_do_nothing()
-        )
+        await self._add_interactions(db, ProductVote, Product.vote_count, product_id, user_ids)
 
-    async def remove_vote(self, db: AsyncSession, product_id: int, user_id: int) -> None:
-        await db.execute(
-            delete(ProductVote).where(
-                ProductVote.product_id == product_id,
-                ProductVote.user_id == user_id,
-            )
-        )
+    async def remove_vote(self, db: AsyncSession, product_id: int, user_id: int) -> int:
+        return await self._remove_interaction(db, ProductVote, Product.vote_count, product_id, user_id)
 
     # -------------------------
     # Bookmarks
     # -------------------------
-    async def get_bookmark_counts(
-        self, db: AsyncSession, product_ids: list[int]
-    ) -> dict[int, int]:
-        result = await db.execute(
-            select(ProductBookmark.product_id, func.count().label("cnt"))
-            .where(ProductBookmark.product_id.in_(product_ids))
-            .group_by(ProductBookmark.product_id)
-        )
-        counts = {row.product_id: row.cnt for row in result}
-        return {pid: counts.get(pid, 0) for pid in product_ids}
-
-    async def get_bookmark_count(self, db: AsyncSession, product_id: int) -> int:
-        return (await self.get_bookmark_counts(db, [product_id]))[product_id]
-
     async def get_user_bookmarks(
         self, db: AsyncSession, product_ids: list[int], user_id: int
     ) -> set[int]:
@@ -675,49 +880,26 @@ class ProductRepository(BaseRepository[Product]):
         return {row.product_id for row in result}
 
     async def get_bookmarked_product_ids_by_user(
-        self, db: AsyncSession, user_id: int, limit: int, offset: int
-    ) -> list[int]:
-        result = await db.execute(
+        self, db: AsyncSession, user_id: int, limit: int, offset: int, cursor: str | None = None
+    ) -> Page:
+        keys = [SortKey(ProductBookmark.created_at), SortKey(ProductBookmark.product_id)]
+        q = (
             select(ProductBookmark.product_id)
             .where(ProductBookmark.user_id == user_id)
-            .order_by(ProductBookmark.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+            .order_by(*keyset_order(keys))
         )
-        return [row.product_id for row in result]
+        result = await db.execute(keyset_page(q, keys, limit=limit, offset=offset, cursor=cursor))
+        return split_page(result.all(), limit)
 
-    async def add_bookmark(self, db: AsyncSession, product_id: int, user_id: int) -> None:
-        await db.execute(
-            pg_insert(ProductBookmark)
-            .values(product_id=product_id, user_id=user_id)
-            .on_conflict_do_nothing()
-        )
+    async def add_bookmark(self, db: AsyncSession, product_id: int, user_id: int) -> int:
+        return await self._add_interactions(db, ProductBookmark, Product.bookmark_count, product_id, [user_id])
 
-    async def remove_bookmark(self, db: AsyncSession, product_id: int, user_id: int) -> None:
-        await db.execute(
-            delete(ProductBookmark).where(
-                ProductBookmark.product_id == product_id,
-                ProductBookmark.user_id == user_id,
-            )
-        )
+    async def remove_bookmark(self, db: AsyncSession, product_id: int, user_id: int) -> int:
+        return await self._remove_interaction(db, ProductBookmark, Product.bookmark_count, product_id, user_id)
 
     # -------------------------
     # Investor interests
     # -------------------------
-    async def get_investor_interest_counts(
-        self, db: AsyncSession, product_ids: list[int]
-    ) -> dict[int, int]:
-        result = await db.execute(
-            select(ProductInvestorInterest.product_id, func.count().label("cnt"))
-            .where(ProductInvestorInterest.product_id.in_(product_ids))
-            .group_by(ProductInvestorInterest.product_id)
-        )
-        counts = {row.product_id: row.cnt for row in result}
-        return {pid: counts.get(pid, 0) for pid in product_ids}
-
-    async def get_investor_interest_count(self, db: AsyncSession, product_id: int) -> int:
-        return (await self.get_investor_interest_counts(db, [product_id]))[product_id]
-
     async def get_user_investor_interests(
         self, db: AsyncSession, product_ids: list[int], user_id: int
     ) -> set[int]:
@@ -730,18 +912,80 @@ class ProductRepository(BaseRepository[Product]):
         )
         return {row.product_id for row in result}
 
-    async def add_investor_interest(self, db: AsyncSession, product_id: int, user_id: int) -> None:
-        await db.execute(
-            pg_insert(ProductInvestorInterest)
-            .values(product_id=product_id, user_id=user_id)
-            .on_conflict_do_nothing()
+    async def add_investor_interest(self, db: AsyncSession, product_id: int, user_id: int) -> int:
+        return await self._add_interactions(
+            db, ProductInvestorInterest, Product.investor_interest_count, product_id, [user_id]
         )
 
-    async def remove_investor_interest(self, db: AsyncSession, product_id: int, user_id: int) -> None:
-        await db.execute(
-            delete(ProductInvestorInterest).where(
-                ProductInvestorInterest.product_id == product_id,
-                ProductInvestorInterest.user_id == user_id,
-            )
+    async def remove_investor_interest(self, db: AsyncSession, product_id: int, user_id: int) -> int:
+        return await self._remove_interaction(
+            db, ProductInvestorInterest, Product.investor_interest_count, product_id, user_id
+        )
+
+    # -------------------------
+    # Interaction counters
+    # -------------------------
+    async def _add_interactions(
+        self, db: AsyncSession, model, counter, product_id: int, user_ids: list[int]
+    ) -> int:
+        """Insert (product_id, user_id) rows, skipping existing ones, and count the new ones onto
+        the product in the same statement. Returns the new count."""
+        inserted = (
+            pg_insert(model)
+            .values([{"product_id": product_id, "user_id": uid} for uid in user_ids])
+            .on_conflict_do_nothing()
+            .returning(model.user_id)
+            .cte("inserted")
         )
+        return await shift_counter(db, counter, Product.id == product_id, inserted) or 0
+
+    async def _remove_interaction(
+        self, db: AsyncSession, model, counter, product_id: int, user_id: int
+    ) -> int:
+        deleted = (
+            delete(model)
+            .where(model.product_id == product_id, model.user_id == user_id)
+            .returning(model.user_id)
+            .cte("deleted")
+        )
+        return await shift_counter(db, counter, Product.id == product_id, deleted, decrement=True) or 0
+
+    async def remove_user_interactions(self, db: AsyncSession, user_id: int) -> list[int]:
+        """Delete the user's votes, bookmarks and investor interests, moving each product's counters
+        down in the same statements (the user-delete cascade would skip them). Returns the products touched."""
+        touched: set[int] = set()
+        for model, counter in (
+            (ProductVote, Product.vote_count),
+            (ProductBookmark, Product.bookmark_count),
+            (ProductInvestorInterest, Product.investor_interest_count),
+        ):
+            deleted = delete(model).where(model.user_id == user_id).returning(model.product_id).cte("deleted")
+            touched.update(await shift_counters(db, counter, deleted, decrement=True))
+        return sorted(touched)
+
+    async def reconcile_counters(self, db: AsyncSession, dry_run: bool = False) -> dict[str, list[int]]:
+        """Reset every product counter that disagrees with its table to the real count.
+
+        Returns the ids corrected per counter. A toggle committing between the count and the
+        write can leave a counter off by one; the next run repairs it.
+        """
+        fixed = {}
+        for model, counter in (
+            (ProductVote, Product.vote_count),
+            (ProductBookmark, Product.bookmark_count),
+            (ProductInvestorInterest, Product.investor_interest_count),
+        ):
+            actual = _count(model, model.product_id == Product.id)
+            if dry_run:
+                result = await db.execute(select(Product.id).where(counter != actual))
+            else:
+                result = await db.execute(
+                    update(Product)
+                    .where(counter != actual)
+                    .values({counter: actual, Product.updated_at: Product.updated_at})
+                    .returning(Product.id)
+                    .execution_options(synchronize_session=False)
+                )
+            fixed[f"product {counter.key}"] = sorted(result.scalars().all())
+        return fixed
 
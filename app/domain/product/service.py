@@ -13,11 +13,12 @@ from app.common.permissions import assert_can_modify, is_admin, is_owner
 from app.common.schema import PaginatedSchema
 from app.domain.product.model import Product, ProductComment
 from app.domain.category.repository import CategoryRepository
-from app.domain.product.model import ProductCategory
+from app.domain.product.model import ProductBacker, ProductCategory, ProductGrant, ProductLink
 from app.domain.product.repository import (
     CommentRepository, ProductRepository,
     ProductLinkRepository, ProductMediaRepository, ProductTeamRepository,
     ProductBackerRepository, ProductGrantRepository, ProductVoiceRepository, BountyRepository,
+    USER_FLAGS,
 )
 from app.domain.paper.schema import PaperSummarySchema
 from app.domain.product.schema import (
@@ -51,19 +52,21 @@ from app.domain.product.schema import (
     BountyCreateSchema, BountyUpdateSchema, BountyOutSchema,
 )
 from fastapi import BackgroundTasks, UploadFile
+from app.domain.search.repository import SearchRepository
 from app.domain.user.repository import UserRepository
 from app.domain.user.schema import UserOutSchema
-from app.enums.enums import ProductDateFilter, ProductMediaType, ProductSortBy, ProductStatus, UserRole, VerificationStatus
+from app.enums.enums import ProductDateFilter, ProductMediaType, ProductSortBy, ProductStatus, SearchEntityType, UserRole, VerificationStatus
 from app.exceptions.exceptions import ConflictError, ExternalServiceError, NotFoundError, ValidationError
 from app.infrastructure.email.service import EmailDeliveryError, EmailService
 from app.infrastructure.logodev.service import LogoDevService, is_logo_skip_domain
 from app.common.storage import R2StorageService, ALLOWED_CONTENT_TYPES, MAX_FILE_SIZE_BYTES
-from app.common.validators import extract_domain
+from app.common.validators import extract_domain, normalize_search
 from app.database.connection import db_manager
 from app.infrastructure.redis.client import RedisClient
 from app.core.config import settings
 from app.utils.slug import slugify, with_random_suffix
-from app.common.cache_keys import PRODUCT_DETAIL_PREFIX, PRODUCT_LIST_PREFIX, PRODUCT_STATS
+from app.common.cache_keys import PRODUCT_DETAIL_PREFIX, PRODUCT_LIST_PREFIX, PRODUCT_LIST_TTL, PRODUCT_STATS, SEARCH_PREFIX
+from app.common.counts import ListTotal
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -92,9 +95,6 @@ def _build_category_refs(categories: list) -> list[CategoryRefSchema]:
 
 @dataclass
 class _InteractionData:
-    vote_counts: dict[int, int]
-    bookmark_counts: dict[int, int]
-    investor_interest_counts: dict[int, int]
     categories_map: dict[int, list]
     user_votes: set[int] = field(default_factory=set)
     user_bookmarks: set[int] = field(default_factory=set)
@@ -118,6 +118,7 @@ class ProductService:
         user_repo: UserRepository | None = None,
         redis: RedisClient | None = None,
         logo_dev_service: LogoDevService | None = None,
+        search_repo: SearchRepository | None = None,
     ):
         self.repo = repo
         self.category_repo = category_repo
@@ -133,21 +134,16 @@ class ProductService:
         self.user_repo = user_repo or UserRepository()
         self.redis = redis
         self.logo_dev_service = logo_dev_service or LogoDevService()
+        self.search_repo = search_repo or SearchRepository()
 
-    async def _invalidate_stats_cache(self) -> None:
-        if self.redis:
-            await self.redis.delete(PRODUCT_STATS)
-
-    async def _invalidate_list_cache(self) -> None:
-        if self.redis:
-            await self.redis.delete_by_pattern(f"{PRODUCT_LIST_PREFIX}:*")
-
-    async def _invalidate_detail_cache(self, slug: str) -> None:
-        if self.redis:
-            await asyncio.gather(
-                self.redis.delete(f"{PRODUCT_DETAIL_PREFIX}:{slug}"),
-                self.redis.delete_by_pattern(f"{PRODUCT_DETAIL_PREFIX}:member:*:{slug}"),
-            )
+    async def _invalidate_cache(self, *slugs: str, lists: bool = False, stats: bool = False) -> None:
+        """Drop the given product detail namespaces (and optionally lists, search results and stats) in one Redis round trip."""
+        if not self.redis:
+            return
+        namespaces = [f"{PRODUCT_DETAIL_PREFIX}:{slug}" for slug in slugs]
+        if lists:
+            namespaces += [PRODUCT_LIST_PREFIX, SEARCH_PREFIX]
+        await self.redis.invalidate(keys=[PRODUCT_STATS] if stats else [], namespaces=namespaces)
 
     async def _fetch_interaction_data(
         self,
@@ -155,22 +151,19 @@ class ProductService:
         product_ids: list[int],
         current_user: UserOutSchema | None,
     ) -> _InteractionData:
-        tasks = [
-            self.repo.get_vote_counts(db, product_ids),
-            self.repo.get_bookmark_counts(db, product_ids),
-            self.repo.get_investor_interest_counts(db, product_ids),
-            self.repo.get_categories_for_products(db, product_ids),
+        reads = [
+            lambda session: self.repo.get_categories_for_products(session, product_ids),
         ]
         if current_user:
-            tasks += [
-                self.repo.get_user_votes(db, product_ids, current_user.id),
-                self.repo.get_user_bookmarks(db, product_ids, current_user.id),
-                self.repo.get_user_investor_interests(db, product_ids, current_user.id),
+            reads += [
+                lambda session: self.repo.get_user_votes(session, product_ids, current_user.id),
+                lambda session: self.repo.get_user_bookmarks(session, product_ids, current_user.id),
+                lambda session: self.repo.get_user_investor_interests(session, product_ids, current_user.id),
             ]
-        gathered = await asyncio.gather(*tasks)
-        data = _InteractionData(*gathered[:4])
+        gathered = await db_manager.gather_reads(db, *reads)
+        data = _InteractionData(gathered[0])
         if current_user:
-            data.user_votes, data.user_bookmarks, data.user_interests = gathered[4], gathered[5], gathered[6]
+            data.user_votes, data.user_bookmarks, data.user_interests = gathered[1], gathered[2], gathered[3]
         return data
 
     def _logo_url(self, logo: str | None) -> str | None:
@@ -238,41 +231,22 @@ class ProductService:
             await self.category_repo.assert_subcategories_belong_to_parents(db, sub_category_ids, category_ids)
         all_cat_ids = category_ids + sub_category_ids
         await sync_categories(db, self.category_repo, ProductCategory.__table__, "product_id", product.id, all_cat_ids)
+        await self.repo.refresh_listed(db, [product.id])
 
+        # One multi-row INSERT per child table, however many rows each carries.
+        link_rows = [{"product_id": product.id, **link} for link in links]
         if url:
-            await self.link_repo.create(
-                db,
-                {"product_id": product.id, "link_type": "website", "url": url, "label": None},
-                current_user_id=current_user.id,
-            )
-
-        for link in links:
-            await self.link_repo.create(
-                db,
-                {"product_id": product.id, **link},
-                current_user_id=current_user.id,
-            )
-
-        for name in backers:
-            await self.backer_repo.create(
-                db,
-                {"product_id": product.id, "name": name},
-                current_user_id=current_user.id,
-            )
-
-        for name in grants:
-            await self.grant_repo.create(
-                db,
-                {"product_id": product.id, "name": name},
-                current_user_id=current_user.id,
-            )
-
-        for member in team:
-            await self.team_repo.create(
-                db,
-                {"product_id": product.id, **member},
-                current_user_id=current_user.id,
-            )
+            link_rows.insert(0, {"product_id": product.id, "link_type": "website", "url": url, "label": None})
+        await self.link_repo.create_many(db, link_rows, current_user_id=current_user.id)
+        await self.backer_repo.create_many(
+            db, [{"product_id": product.id, "name": name} for name in backers], current_user_id=current_user.id
+        )
+        await self.grant_repo.create_many(
+            db, [{"product_id": product.id, "name": name} for name in grants], current_user_id=current_user.id
+        )
+        await self.team_repo.create_many(
+            db, [{"product_id": product.id, **member} for member in team], current_user_id=current_user.id
+        )
 
         await db.commit()
         await db.refresh(product)
@@ -301,6 +275,7 @@ class ProductService:
         search: str | None = None,
         upvoted: bool | None = None,
         listed: bool | None = None,
+        cursor: str | None = None,
     ) -> PaginatedSchema[ProductListSchema]:
         user_id: int | None = None
         if owner_only and current_user is not None:
@@ -310,41 +285,55 @@ class ProductService:
             # Non-admins can only see approved products
             status = ProductStatus.APPROVED
         upvoted_by_user_id: int | None = current_user.id if upvoted and current_user else None
+        # An explicit listed is a filter; the default below is applied inside the estimate too.
+        unfiltered = listed is None and not any((status, user_id, category_id, date_filter, upvoted_by_user_id))
         # Admins viewing pending products see all regardless of category visibility
         admin_viewing_pending = (current_user and is_admin(current_user) and status == ProductStatus.PENDING)
         if listed is None and category_id is None and not admin_viewing_pending:
             listed = True
-        # First query provisions the session connection; remaining independent queries run concurrently.
-        products = await self.repo.get_all_by_status(
-            db, status, limit=limit, offset=offset, user_id=user_id,
-            category_id=category_id, date_filter=date_filter, sort_by=sort_by,
-            search=search, upvoted_by_user_id=upvoted_by_user_id, listed=listed,
+        search = normalize_search(search)
+        unfiltered = unfiltered and not search
+        list_total = ListTotal(
+            self.redis, PRODUCT_LIST_PREFIX, PRODUCT_LIST_TTL,
+            # Only approved views are invalidated with the list namespace: submissions and votes
+            # don't bump it, so pending/owner/"my upvoted" counts can't be cached.
+            filters=(
+                (user_id, category_id, date_filter, search, listed)
+                if status == ProductStatus.APPROVED and not upvoted_by_user_id else None
+            ),
+            estimate=(
+                (lambda session: self.repo.estimate_by_status(session, listed=listed))
+                if unfiltered and current_user and is_admin(current_user) else None
+            ),
         )
-
-        if not products:
-            total = await self.repo.count_by_status(
-                db, status, user_id=user_id,
+        page, total = await list_total.fetch(
+            db,
+            lambda session, with_total: self.repo.get_all_by_status(
+                session, status, limit=limit, offset=offset, user_id=user_id,
+                category_id=category_id, date_filter=date_filter, sort_by=sort_by,
+                search=search, upvoted_by_user_id=upvoted_by_user_id, listed=listed,
+                cursor=cursor, with_total=with_total,
+            ),
+            lambda session: self.repo.count_by_status(
+                session, status, user_id=user_id,
                 category_id=category_id, date_filter=date_filter,
                 search=search, upvoted_by_user_id=upvoted_by_user_id, listed=listed,
-            )
+            ),
+            offset=offset,
+            cursor=cursor,
+        )
+        products, next_cursor = page.items, page.next_cursor
+        if not products:
             return PaginatedSchema(items=[], total=total)
 
         product_ids = [p.id for p in products]
         # Summary list omits counts/voted/interested — fetch only categories (+ the viewer's bookmark flag).
-        coros: list = [
-            self.repo.count_by_status(
-                db, status, user_id=user_id,
-                category_id=category_id, date_filter=date_filter,
-                search=search, upvoted_by_user_id=upvoted_by_user_id, listed=listed,
-            ),
-            self.repo.get_categories_for_products(db, product_ids),
-        ]
+        reads: list = [lambda session: self.repo.get_categories_for_products(session, product_ids)]
         if current_user:
-            coros.append(self.repo.get_user_bookmarks(db, product_ids, current_user.id))
-        gather_results = await asyncio.gather(*coros)
-        total = gather_results[0]
-        categories_map = gather_results[1]
-        user_bookmarks: set[int] = gather_results[2] if current_user else set()
+            reads.append(lambda session: self.repo.get_user_bookmarks(session, product_ids, current_user.id))
+        gather_results = await db_manager.gather_reads(db, *reads)
+        categories_map = gather_results[0]
+        user_bookmarks: set[int] = gather_results[1] if current_user else set()
 
         results = []
         for product in products:
@@ -354,27 +343,62 @@ class ProductService:
             if current_user:
                 out.bookmarked = product.id in user_bookmarks
             results.append(out)
-        return PaginatedSchema(items=results, total=total)
+        return PaginatedSchema(items=results, total=total, next_cursor=next_cursor)
+
+    async def get_viewer_flags(
+        self,
+        db: AsyncSession,
+        product_ids: list[int],
+        current_user: UserOutSchema,
+        only: tuple[str, ...] = tuple(USER_FLAGS),
+    ) -> dict[str, set[int]]:
+        """Per-viewer voted/bookmarked/interested product ids (or just the flags in only), to overlay
+        on shared (anonymous) payloads."""
+        if not product_ids:
+            return {flag: set() for flag in only}
+        return await self.repo.get_user_flags(db, product_ids, current_user.id, only=only)
 
     async def get_by_id(
         self, db: AsyncSession, product_id: int, current_user: UserOutSchema | None = None
     ) -> ProductOutSchema:
-        product = await self.repo.get_by_id(db, product_id)
-        if product.status != ProductStatus.APPROVED:
-            if current_user is None or (not is_admin(current_user) and not is_owner(product, current_user)):
-                raise NotFoundError(f"Product with id '{product_id}' not found")
-        return await self._to_schema(db, product, current_user=current_user)
+        product = await self._get_detail(db, current_user, product_id=product_id)
+        if product is None:
+            raise NotFoundError(f"Product with id '{product_id}' not found")
+        return product
 
     async def get_by_slug(
         self, db: AsyncSession, slug: str, current_user: UserOutSchema | None = None
     ) -> ProductOutSchema:
-        product = await self.repo.get_by_slug(db, slug)
-        if not product:
+        product = await self._get_detail(db, current_user, slug=slug)
+        if product is None:
             raise NotFoundError(f"Product with slug '{slug}' not found")
-        if product.status != ProductStatus.APPROVED:
-            if current_user is None or (not is_admin(current_user) and not is_owner(product, current_user)):
-                raise NotFoundError(f"Product with slug '{slug}' not found")
-        return await self._to_schema(db, product, current_user=current_user)
+        return product
+
+    async def _get_detail(
+        self,
+        db: AsyncSession,
+        current_user: UserOutSchema | None,
+        *,
+        slug: str | None = None,
+        product_id: int | None = None,
+    ) -> ProductOutSchema | None:
+        """Product detail in one statement, validated straight from JSON; None if missing or not visible to the viewer."""
+        payload = await self.repo.get_detail_json(
+            db,
+            media_base_url=settings.r2.cdn_base_url.rstrip('/'),
+            slug=slug,
+            product_id=product_id,
+            viewer_id=current_user.id if current_user else None,
+            viewer_is_admin=current_user is not None and is_admin(current_user),
+        )
+        if payload is None:
+            return None
+        result = ProductOutSchema.model_validate_json(payload)
+        if result.status != ProductStatus.APPROVED:
+            if current_user is None or (not is_admin(current_user) and not is_owner(result, current_user)):
+                return None
+        result.logo = self._logo_url(result.logo)
+        return result
 
     async def get_by_name(self, db: AsyncSession, name: str) -> ProductOutSchema:
         """Exact, case-insensitive lookup for trusted internal callers (any status)."""
@@ -405,32 +429,33 @@ class ProductService:
         product = await self.repo.update(db, product_id, payload, current_user_id=current_user.id)
 
         if links is not None:
-            existing = await self.link_repo.get_by_product_id(db, product_id)
-            existing_by_type = {l.link_type: l for l in existing}
-            new_types = {l["link_type"] for l in links}
-            for link_type, existing_link in existing_by_type.items():
-                if link_type not in new_types:
-                    await self.link_repo.delete_by_id(db, existing_link.id)
-            for link in links:
-                link_type = link["link_type"]
-                if link_type in existing_by_type:
-                    await self.link_repo.update_instance(db, existing_by_type[link_type], {"url": link["url"], "label": link.get("label")})
-                else:
-                    await self.link_repo.create(db, {"product_id": product_id, **link}, current_user_id=current_user.id)
+            # One link per type: the last one sent wins, as the upsert can't touch a row twice.
+            by_type = {link["link_type"]: link for link in links}
+            await self.link_repo.delete_where(
+                db, ProductLink.product_id == product_id, ProductLink.link_type.notin_(by_type)
+            )
+            await self.link_repo.upsert_many(
+                db,
+                [
+                    {"product_id": product_id, "link_type": link_type, "url": link["url"], "label": link.get("label")}
+                    for link_type, link in by_type.items()
+                ],
+                conflict_columns=["product_id", "link_type"],
+                update_columns=["url", "label"],
+                current_user_id=current_user.id,
+            )
 
         if backers is not None:
-            existing_backers = await self.backer_repo.get_by_product_id(db, product_id)
-            for b in existing_backers:
-                await self.backer_repo.delete_by_id(db, b.id)
-            for name in backers:
-                await self.backer_repo.create(db, {"product_id": product_id, "name": name}, current_user_id=current_user.id)
+            await self.backer_repo.delete_where(db, ProductBacker.product_id == product_id)
+            await self.backer_repo.create_many(
+                db, [{"product_id": product_id, "name": name} for name in backers], current_user_id=current_user.id
+            )
 
         if grants is not None:
-            existing_grants = await self.grant_repo.get_by_product_id(db, product_id)
-            for g in existing_grants:
-                await self.grant_repo.delete_by_id(db, g.id)
-            for name in grants:
-                await self.grant_repo.create(db, {"product_id": product_id, "name": name}, current_user_id=current_user.id)
+            await self.grant_repo.delete_where(db, ProductGrant.product_id == product_id)
+            await self.grant_repo.create_many(
+                db, [{"product_id": product_id, "name": name} for name in grants], current_user_id=current_user.id
+            )
 
         if category_ids is not None or sub_category_ids is not None or other_subcategory_name:
             existing_cats = await self.repo.get_categories_for_product(db, product_id)
@@ -454,14 +479,13 @@ class ProductService:
                 await self.category_repo.assert_subcategories_belong_to_parents(db, new_sub_ids, new_parent_ids)
             synced_ids = new_parent_ids + new_sub_ids
             await sync_categories(db, self.category_repo, ProductCategory.__table__, "product_id", product_id, synced_ids)
+            await self.repo.refresh_listed(db, [product_id])
+        await self.search_repo.reindex(db, SearchEntityType.PRODUCT, [product_id])
 
+        # repo.update() loaded the written row; the child writes since don't change it.
         await db.commit()
-        await db.refresh(product)
 
-        invalidations = [self._invalidate_list_cache(), self._invalidate_detail_cache(product.slug)]
-        if old_slug != product.slug:
-            invalidations.append(self._invalidate_detail_cache(old_slug))
-        await asyncio.gather(*invalidations)
+        await self._invalidate_cache(*{product.slug, old_slug}, lists=True)
 
         return await self._to_schema(db, product)
 
@@ -474,40 +498,35 @@ class ProductService:
         product = await self.repo.get_by_id(db, product_id)
         assert_can_modify(product, current_user)
         await self.repo.soft_delete(db, product_id, deleted_by_id=current_user.id)
+        await self.search_repo.reindex(db, SearchEntityType.PRODUCT, [product_id])
         await db.commit()
-        await asyncio.gather(
-            self._invalidate_stats_cache(),
-            self._invalidate_list_cache(),
-            self._invalidate_detail_cache(product.slug),
-        )
+        await self._invalidate_cache(product.slug, lists=True, stats=True)
 
     async def list_voted(
-        self, db: AsyncSession, limit: int, offset: int, current_user: UserOutSchema
+        self, db: AsyncSession, limit: int, offset: int, current_user: UserOutSchema, cursor: str | None = None
     ) -> PaginatedSchema[ProductListSchema]:
-        return await self.list(db, limit=limit, offset=offset, current_user=current_user, upvoted=True)
+        return await self.list(db, limit=limit, offset=offset, current_user=current_user, upvoted=True, cursor=cursor)
 
     async def list_bookmarked(
-        self, db: AsyncSession, limit: int, offset: int, current_user: UserOutSchema
-    ) -> list[ProductSummarySchema]:
-        product_ids = await self.repo.get_bookmarked_product_ids_by_user(db, current_user.id, limit, offset)
-        return await self._to_summary_list(db, product_ids)
+        self, db: AsyncSession, limit: int, offset: int, current_user: UserOutSchema, cursor: str | None = None
+    ) -> tuple[list[ProductSummarySchema], str | None]:
+        """Bookmarked products, most recent bookmark first, and the cursor for the next page."""
+        page = await self.repo.get_bookmarked_product_ids_by_user(db, current_user.id, limit, offset, cursor=cursor)
+        return await self._to_summary_list(db, page.items), page.next_cursor
 
     async def _to_summary_list(
         self, db: AsyncSession, product_ids: list[int]
     ) -> list[ProductSummarySchema]:
         if not product_ids:
             return []
-        products, vote_counts, bookmark_counts, categories_map = await asyncio.gather(
-            self.repo.get_by_ids(db, product_ids),
-            self.repo.get_vote_counts(db, product_ids),
-            self.repo.get_bookmark_counts(db, product_ids),
-            self.repo.get_categories_for_products(db, product_ids),
+        products, categories_map = await db_manager.gather_reads(
+            db,
+            lambda session: self.repo.get_by_ids(session, product_ids),
+            lambda session: self.repo.get_categories_for_products(session, product_ids),
         )
         results = []
         for product in products:
             out = ProductSummarySchema.model_validate(product, from_attributes=True)
-            out.vote_count = vote_counts[product.id]
-            out.bookmark_count = bookmark_counts[product.id]
             out.categories = _build_category_refs(categories_map[product.id])
             results.append(out)
         return results
@@ -517,7 +536,7 @@ class ProductService:
     ) -> ToggleOutSchema:
         return await self._toggle(
             db, product_id, toggled,
-            self.repo.add_vote, self.repo.remove_vote, self.repo.get_vote_count,
+            self.repo.add_vote, self.repo.remove_vote,
             current_user,
         )
 
@@ -526,7 +545,7 @@ class ProductService:
     ) -> ToggleOutSchema:
         return await self._toggle(
             db, product_id, toggled,
-            self.repo.add_bookmark, self.repo.remove_bookmark, self.repo.get_bookmark_count,
+            self.repo.add_bookmark, self.repo.remove_bookmark,
             current_user,
         )
 
@@ -535,7 +554,7 @@ class ProductService:
     ) -> ToggleOutSchema:
         return await self._toggle(
             db, product_id, toggled,
-            self.repo.add_investor_interest, self.repo.remove_investor_interest, self.repo.get_investor_interest_count,
+            self.repo.add_investor_interest, self.repo.remove_investor_interest,
             current_user,
         )
 
@@ -546,16 +565,15 @@ class ProductService:
         toggled: bool,
         add_fn: Callable,
         remove_fn: Callable,
-        count_fn: Callable,
         current_user: UserOutSchema,
     ) -> ToggleOutSchema:
         await self.repo.get_by_id_with_status_check(db, product_id, required_status=ProductStatus.APPROVED)
+        # Both return the product's counter as moved by this write.
         if toggled:
-            await add_fn(db, product_id, current_user.id)
+            count = await add_fn(db, product_id, current_user.id)
         else:
-            await remove_fn(db, product_id, current_user.id)
+            count = await remove_fn(db, product_id, current_user.id)
         await db.commit()
-        count = await count_fn(db, product_id)
         return ToggleOutSchema(product_id=product_id, count=count)
 
     async def list_comments(
@@ -684,13 +702,10 @@ class ProductService:
             if ghost_user_ids:
                 sample_size = min(random.randint(80, 100), len(ghost_user_ids))
                 await self.repo.add_votes_bulk(db, product_id, random.sample(ghost_user_ids, sample_size))
+        await self.search_repo.reindex(db, SearchEntityType.PRODUCT, [product_id])
         await db.commit()
         await db.refresh(product)
-        await asyncio.gather(
-            self._invalidate_stats_cache(),
-            self._invalidate_list_cache(),
-            self._invalidate_detail_cache(product.slug),
-        )
+        await self._invalidate_cache(product.slug, lists=True, stats=True)
         if data.status == ProductStatus.APPROVED and product.created_by_id:
             try:
                 submitter = await self.user_repo.get_by_id(db, product.created_by_id)
@@ -864,7 +879,7 @@ class ProductService:
         await storage.upload_file(key=key, data=data, content_type=content_type)
         await self.repo.update_instance(db, product, {"logo": key})
         await db.commit()
-        await self._invalidate_detail_cache(product.slug)
+        await self._invalidate_cache(product.slug)
         return key
 
     async def upload_logo(
@@ -937,7 +952,7 @@ class ProductService:
                 pass  # best-effort
         await self.repo.update_instance(db, product, {"logo": None})
         await db.commit()
-        await self._invalidate_detail_cache(product.slug)
+        await self._invalidate_cache(product.slug)
 
     # -------------------------
     # Product Team
@@ -1172,9 +1187,10 @@ class ProductService:
             return []
 
         curated_set = set(curated_ids)
-        products, categories_map = await asyncio.gather(
-            self.repo.get_by_ids(db, similar_ids),
-            self.repo.get_categories_for_products(db, similar_ids),
+        products, categories_map = await db_manager.gather_reads(
+            db,
+            lambda session: self.repo.get_by_ids(session, similar_ids),
+            lambda session: self.repo.get_categories_for_products(session, similar_ids),
         )
         # get_by_ids already preserves the requested order, so curated entries stay first.
         results = []
@@ -1198,7 +1214,7 @@ class ProductService:
         await self.repo.sync_similar_products(db, product_id, data.similar_product_ids)
         await db.commit()
         await db.refresh(product)
-        await self._invalidate_detail_cache(product.slug)
+        await self._invalidate_cache(product.slug)
         return await self._to_schema(db, product)
 
     async def list_related(
@@ -1229,34 +1245,33 @@ class ProductService:
         await self.repo.sync_related_products(db, product_id, data.related_product_ids)
         await db.commit()
         await db.refresh(product)
-        await self._invalidate_detail_cache(product.slug)
+        await self._invalidate_cache(product.slug)
         return await self._to_schema(db, product)
 
     async def _to_schema(
         self, db: AsyncSession, product, current_user: UserOutSchema | None = None
     ) -> ProductOutSchema:
         team_status = None if (current_user and (is_admin(current_user) or is_owner(product, current_user))) else VerificationStatus.APPROVED
-        ix, founder_data, (papers, links, media, team, backers, grants, voices, bounties) = await asyncio.gather(
+        # Both fan-outs draw on the same per-request pool of read sessions.
+        ix, (founder_data, papers, links, media, team, backers, grants, voices, bounties) = await asyncio.gather(
             self._fetch_interaction_data(db, [product.id], current_user),
-            self.repo.get_founder_summary(db, product.created_by_id),
-            asyncio.gather(
-                self.repo.get_papers_for_product(db, product.id),
-                self.link_repo.get_by_product_id(db, product.id),
-                self.media_repo.get_by_product_id(db, product.id),
-                self.team_repo.get_by_product_id(db, product.id, status=team_status),
-                self.backer_repo.get_by_product_id(db, product.id),
-                self.grant_repo.get_by_product_id(db, product.id),
-                self.voice_repo.get_by_product_id(db, product.id),
-                self.bounty_repo.get_by_product_id(db, product.id),
+            db_manager.gather_reads(
+                db,
+                lambda session: self.repo.get_founder_summary(session, product.created_by_id),
+                lambda session: self.repo.get_papers_for_product(session, product.id),
+                lambda session: self.link_repo.get_by_product_id(session, product.id),
+                lambda session: self.media_repo.get_by_product_id(session, product.id),
+                lambda session: self.team_repo.get_by_product_id(session, product.id, status=team_status),
+                lambda session: self.backer_repo.get_by_product_id(session, product.id),
+                lambda session: self.grant_repo.get_by_product_id(session, product.id),
+                lambda session: self.voice_repo.get_by_product_id(session, product.id),
+                lambda session: self.bounty_repo.get_by_product_id(session, product.id),
             ),
         )
 
         result = ProductOutSchema.model_validate(product, from_attributes=True)
         result.logo = self._logo_url(product.logo)
         result.categories = _build_category_refs(ix.categories_map[product.id])
-        result.vote_count = ix.vote_counts[product.id]
-        result.bookmark_count = ix.bookmark_counts[product.id]
-        result.investor_interest_count = ix.investor_interest_counts[product.id]
         result.papers = [PaperSummarySchema.model_validate(p, from_attributes=True) for p in papers]
         result.founder = FounderSummarySchema.model_validate(founder_data) if founder_data else None
         result.links = [ProductLinkOutSchema.model_validate(l, from_attributes=True) for l in links]
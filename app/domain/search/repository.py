@@ -0,0 +1,109 @@
+import re
+
+from sqlalchemy import Float, Select, cast, delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Bundle
+
+from app.common.pagination import Page, SortKey, keyset_order, keyset_page, split_page
+from app.domain.article.model import Article
+from app.domain.broadcast.model import Broadcast
+from app.domain.paper.model import Paper
+from app.domain.product.model import SEARCH_CONFIG, Product
+from app.domain.search.model import SearchDocument
+from app.enums.enums import (
+    ArticleStatus,
+    BroadcastStatus,
+    PaperVerificationStatus,
+    ProductStatus,
+    SearchEntityType,
+)
+
+# Article bodies can be long; the document (and its headline) only needs the opening.
+BODY_MAX_CHARS = 10_000
+HEADLINE_OPTIONS = "MaxFragments=1, MaxWords=24, MinWords=8, StartSel=<mark>, StopSel=</mark>"
+
+_WORDS = re.compile(r"[^\W_]+")
+_DOCUMENT_COLUMNS = ["entity_type", "entity_id", "slug", "title", "body", "published_at"]
+
+
+def prefix_tsquery(search: str) -> str | None:
+    """to_tsquery text matching every word of search as a prefix, so results follow each keystroke."""
+    words = _WORDS.findall(search)
+    return " & ".join(f"{word}:*" for word in words) if words else None
+
+
+def _source(entity_type: SearchEntityType) -> tuple[Select, object]:
+    """(SELECT of the entity's public rows in _DOCUMENT_COLUMNS order, its id column)."""
+    kind = cast(literal(entity_type.value), SearchDocument.entity_type.type)
+    if entity_type == SearchEntityType.PRODUCT:
+        body = func.concat_ws("\n", Product.short_desc, Product.description)
+        q = select(kind, Product.id, Product.slug, Product.name, func.left(body, BODY_MAX_CHARS), Product.approved_at)
+        return q.where(Product.status == ProductStatus.APPROVED, Product.deleted_at.is_(None), Product.is_listed), Product.id
+    if entity_type == SearchEntityType.ARTICLE:
+        q = select(kind, Article.id, Article.slug, Article.title, func.left(Article.content, BODY_MAX_CHARS), Article.published_at)
+        return q.where(Article.status == ArticleStatus.PUBLISHED, Article.deleted_at.is_(None)), Article.id
+    if entity_type == SearchEntityType.BROADCAST:
+        q = select(kind, Broadcast.id, Broadcast.slug, Broadcast.title, func.left(Broadcast.description, BODY_MAX_CHARS), Broadcast.published_at)
+        return q.where(Broadcast.status == BroadcastStatus.PUBLISHED, Broadcast.deleted_at.is_(None)), Broadcast.id
+    q = select(kind, Paper.id, Paper.slug, Paper.title, func.left(Paper.abstract, BODY_MAX_CHARS), Paper.published_at)
+    return q.where(Paper.verification_status == PaperVerificationStatus.APPROVED), Paper.id
+
+
+class SearchRepository:
+    async def reindex(self, db: AsyncSession, entity_type: SearchEntityType, entity_ids: list[int]) -> None:
+        """Rewrite the documents of entity_ids from their source rows; non-public ones are dropped."""
+        if not entity_ids:
+            return
+        source, id_column = _source(entity_type)
+        await db.execute(
+            delete(SearchDocument).where(
+                SearchDocument.entity_type == entity_type,
+                SearchDocument.entity_id.in_(entity_ids),
+            )
+        )
+        await db.execute(
+            insert(SearchDocument).from_select(_DOCUMENT_COLUMNS, source.where(id_column.in_(entity_ids)))
+        )
+
+    async def rebuild(self, db: AsyncSession) -> dict[SearchEntityType, int]:
+        """Replace every document from the source tables; returns the number indexed per type."""
+        await db.execute(delete(SearchDocument))
+        indexed = {}
+        for entity_type in SearchEntityType:
+            source, _ = _source(entity_type)
+            result = await db.execute(insert(SearchDocument).from_select(_DOCUMENT_COLUMNS, source))
+            indexed[entity_type] = result.rowcount
+        return indexed
+
+    async def search(
+        self,
+        db: AsyncSession,
+        tsquery: str,
+        *,
+        entity_type: SearchEntityType | None,
+        limit: int,
+        cursor: str | None,
+    ) -> Page:
+        """Matching documents, best first, as hits carrying a highlighted excerpt of the body."""
+        query = func.to_tsquery(SEARCH_CONFIG, tsquery)
+        # Normalization 1 divides by 1 + log(document length), so long articles don't outrank
+        # a product whose name matches.
+        rank = func.ts_rank(SearchDocument.search_vector, query, 1, type_=Float)
+        # Postgres evaluates the (costly) headline after the sort and limit, for the page's rows only.
+        headline = func.ts_headline(SEARCH_CONFIG, func.coalesce(SearchDocument.body, ""), query, HEADLINE_OPTIONS)
+        hit = Bundle(
+            "hit",
+            SearchDocument.entity_type.label("type"),
+            SearchDocument.entity_id.label("id"),
+            SearchDocument.slug,
+            SearchDocument.title,
+            headline.label("headline"),
+            SearchDocument.published_at,
+        )
+        keys = [SortKey(rank), SortKey(SearchDocument.id)]
+        q = select(hit).where(SearchDocument.search_vector.bool_op("@@")(query))
+        if entity_type is not None:
+            q = q.where(SearchDocument.entity_type == entity_type)
+        q = q.order_by(*keyset_order(keys))
+        result = await db.execute(keyset_page(q, keys, limit=limit, offset=0, cursor=cursor))
+        return split_page(result.all(), limit)
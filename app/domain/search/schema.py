@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from app.common.schema import CamelModel
+from app.enums.enums import SearchEntityType
+
+
+class SearchHitSchema(CamelModel):
+    type: SearchEntityType
+    id: int
+    slug: str
+    title: str
+    # Excerpt of the body around the matched words, which are wrapped in <mark>…</mark>.
+    headline: str
+    published_at: datetime | None
+
+
+class SearchResultsSchema(CamelModel):
+    items: list[SearchHitSchema]
+    # Opaque; pass back as `cursor` for the next page. None on the last page.
+    next_cursor: str | None = None
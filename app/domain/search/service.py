@@ -0,0 +1,28 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.search.repository import SearchRepository, prefix_tsquery
+from app.domain.search.schema import SearchHitSchema, SearchResultsSchema
+from app.enums.enums import SearchEntityType
+
+
+class SearchService:
+    def __init__(self, repo: SearchRepository):
+        self.repo = repo
+
+    async def search(
+        self,
+        db: AsyncSession,
+        search: str | None,
+        entity_type: SearchEntityType | None,
+        limit: int,
+        cursor: str | None = None,
+    ) -> SearchResultsSchema:
+        """Ranked hits across products, articles, broadcasts and papers; search is already normalized."""
+        tsquery = prefix_tsquery(search) if search else None
+        if tsquery is None:
+            return SearchResultsSchema(items=[])
+        page = await self.repo.search(db, tsquery, entity_type=entity_type, limit=limit, cursor=cursor)
+        return SearchResultsSchema(
+            items=[SearchHitSchema.model_validate(hit, from_attributes=True) for hit in page.items],
+            next_cursor=page.next_cursor,
+        )
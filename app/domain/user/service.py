@@ -1,5 +1,3 @@
-import asyncio
-
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -7,6 +5,8 @@ from app.common.db_utils import sync_categories
 from app.common.schema import normalize_email
 from typing import Any, Type, TypeVar
 
+from app.domain.paper.repository import PaperRepository
+from app.domain.product.repository import ProductRepository
 from app.domain.user.model import User, UserCategory
 from app.domain.user.repository import ProfileRepository
 from app.domain.user.repository import (
@@ -32,6 +32,7 @@ from app.domain.user.schema import (
 )
 from app.enums.enums import TokenType
 from app.core.logger import get_logger
+from app.database.connection import db_manager
 from app.infrastructure.email.service import EmailService, EmailDeliveryError
 from app.utils.oauth2 import (
     hash_password,
@@ -55,6 +56,8 @@ class UserService:
         sponsor_profile_repo: SponsorProfileRepository,
         user_category_repo: UserCategoryRepository,
         category_repo,
+        product_repo: ProductRepository | None = None,
+        paper_repo: PaperRepository | None = None,
     ):
         self.repo = repo
         self.email_service = email_service
@@ -63,6 +66,8 @@ class UserService:
         self.sponsor_profile_repo = sponsor_profile_repo
         self.user_category_repo = user_category_repo
         self.category_repo = category_repo
+        self.product_repo = product_repo or ProductRepository()
+        self.paper_repo = paper_repo or PaperRepository()
 
     async def get_all(self, db: AsyncSession, limit: int, offset: int) -> list[User]:
         return await self.repo.get_all(db, limit=limit, offset=offset)
@@ -80,6 +85,9 @@ class UserService:
     async def delete_by_id(
         self, db: AsyncSession, current_user: UserOutSchema, user_id: int
     ) -> None:
+        # Take the user's interactions off the denormalized counters first: the cascade would just drop the rows.
+        await self.product_repo.remove_user_interactions(db, user_id)
+        await self.paper_repo.remove_user_votes(db, user_id)
         await self.repo.delete_by_id(db, user_id)
         await db.commit()
 
@@ -311,13 +319,13 @@ class UserService:
     async def get_user_with_profile(
         self, db: AsyncSession, user_id: int
     ) -> UserWithProfileOutSchema:
-        # get_by_id provisions the session connection; profile fetches run concurrently after.
-        user = await self.repo.get_by_id(db, user_id)
-        investor, researcher, sponsor, categories = await asyncio.gather(
-            self.investor_profile_repo.get_by_user_id(db, user_id),
-            self.researcher_profile_repo.get_by_user_id(db, user_id),
-            self.sponsor_profile_repo.get_by_user_id(db, user_id),
-            self.user_category_repo.get_by_user_id(db, user_id),
+        user, investor, researcher, sponsor, categories = await db_manager.gather_reads(
+            db,
+            lambda session: self.repo.get_by_id(session, user_id),
+            lambda session: self.investor_profile_repo.get_by_user_id(session, user_id),
+            lambda session: self.researcher_profile_repo.get_by_user_id(session, user_id),
+            lambda session: self.sponsor_profile_repo.get_by_user_id(session, user_id),
+            lambda session: self.user_category_repo.get_by_user_id(session, user_id),
         )
 
         result = UserWithProfileOutSchema.model_validate(user, from_attributes=True)
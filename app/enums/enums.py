@@ -131,3 +131,11 @@ class ContentType(str, Enum):
 
 ArticleType = ContentType
 BroadcastType = ContentType
+
+
+class SearchEntityType(str, Enum):
+    """Kinds of entity served by the cross-entity search endpoint."""
+    PRODUCT   = "product"
+    ARTICLE   = "article"
+    BROADCAST = "broadcast"
+    PAPER     = "paper"
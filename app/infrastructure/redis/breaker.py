@@ -0,0 +1,64 @@
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    closed: calls go through; `threshold` failures in a row trip it open.
+    open: calls fail fast until `cooldown_seconds` have passed.
+    half_open: a single probe call is let through; success closes the breaker, failure re-opens it.
+    """
+
+    def __init__(self, threshold: int, cooldown_seconds: float):
+        self._threshold = threshold
+        self._cooldown = cooldown_seconds
+        self._failures = 0
+        self._opened_at: float | None = None
+        # When the half-open probe was let through; a probe that never reports back (e.g. its
+        # request was cancelled) is given up on after another cooldown.
+        self._probe_started: float | None = None
+        self._trips = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if time.monotonic() - self._opened_at < self._cooldown:
+            return OPEN
+        return HALF_OPEN
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == OPEN:
+            return False
+        now = time.monotonic()
+        if self._probe_started is not None and now - self._probe_started < self._cooldown:
+            return False
+        self._probe_started = now
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._probe_started = None
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns True if this one tripped a closed breaker open."""
+        self._failures += 1
+        if self._opened_at is None and self._failures < self._threshold:
+            return False
+        tripped = self._opened_at is None
+        if tripped:
+            self._trips += 1
+        self._opened_at = time.monotonic()
+        self._probe_started = None
+        return tripped
+
+    def stats(self) -> dict:
+        return {"state": self.state, "consecutive_failures": self._failures, "trips": self._trips}
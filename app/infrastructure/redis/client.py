@@ -1,17 +1,98 @@
+import asyncio
+import json
+import time
+import uuid
+from collections.abc import Sequence
+
 from redis.asyncio import Redis, ConnectionError
 from app.core.config import settings
 from app.core.logger import get_logger
+from app.infrastructure.redis.breaker import OPEN, CircuitBreaker
+from app.infrastructure.redis.codec import PayloadCodec
+from app.infrastructure.redis.local_cache import LocalCache
+from app.infrastructure.redis.pool import InstrumentedConnectionPool
 
 logger = get_logger()
 
+# Compare-and-delete: only the holder of the token may release the lock, so a filler whose
+# lock already expired (and was re-acquired by someone else) never releases the new holder's lock.
+_RELEASE_LOCK_LUA = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+# Bump a namespace generation. A missing counter (never set, or expired) is seeded from the clock
+# so a reset can never hand out a generation whose old entries are still alive.
+_BUMP_GENERATION_LUA = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    redis.call("SET", KEYS[1], ARGV[1])
+end
+local gen = redis.call("INCR", KEYS[1])
+redis.call("EXPIRE", KEYS[1], ARGV[2])
+return gen
+"""
+
+# Every delete/delete_by_pattern/generation bump is broadcast here so each worker drops its
+# local (L1) copies and memoized generations.
+INVALIDATION_CHANNEL = "cache:invalidate"
+INVALIDATION_RETRY_SECONDS = 1.0
+
+GENERATION_KEY_PREFIX = "gen"
+# Must outlive the longest cache TTL; refreshed on every bump.
+GENERATION_TTL_SECONDS = 7 * 24 * 60 * 60
+# Per-slug namespaces make the memo unbounded in principle; start over past this many.
+GENERATION_MEMO_MAX = 10_000
+
 
 class RedisClient:
-    def __init__(self):
-        self._client = Redis.from_url(
+    def __init__(
+        self,
+        local_cache_keys: dict[str, str] | None = None,
+        compression_thresholds: dict[str, int] | None = None,
+    ):
+        # Binary connection: values may be compressed; _codec turns them back into str.
+        # Short socket timeouts so a hung Redis costs a request milliseconds, not seconds.
+        self._pool = InstrumentedConnectionPool.from_url(
             settings.redis.url,
-            decode_responses=True,
-            max_connections=20,
+            decode_responses=False,
+            max_connections=settings.redis.max_connections,
+            timeout=settings.redis.pool_timeout,
+            socket_timeout=settings.redis.socket_timeout,
+            socket_connect_timeout=settings.redis.socket_timeout,
         )
+        self._client = Redis.from_pool(self._pool)
+        # The invalidation subscription idles between messages, so it can't share the read timeout.
+        self._pubsub_client = Redis.from_url(
+            settings.redis.url,
+            decode_responses=False,
+            socket_connect_timeout=settings.redis.socket_timeout,
+        )
+        # While open, every operation takes its fail-soft path without touching the network.
+        self._breaker = CircuitBreaker(
+            threshold=settings.redis.breaker_threshold,
+            cooldown_seconds=settings.redis.breaker_cooldown_seconds,
+        )
+        self._codec = PayloadCodec(compression_thresholds)
+        self._release_lock = self._client.register_script(_RELEASE_LOCK_LUA)
+        self._bump_generation = self._client.register_script(_BUMP_GENERATION_LUA)
+        self._generations: dict[str, str] = {}
+        # Bumped on every generation invalidation so a GET racing with one never memoizes a stale value.
+        self._generation_epoch = 0
+
+        # Optional L1 for the hottest keys: label -> glob pattern of keys to hold in memory.
+        self._local: LocalCache | None = None
+        if settings.redis.l1_enabled and local_cache_keys:
+            self._local = LocalCache(
+                local_cache_keys,
+                max_bytes=settings.redis.l1_max_bytes,
+                ttl_seconds=settings.redis.l1_ttl_seconds,
+            )
+        self._listener: asyncio.Task | None = None
+        # L1 and memoized generations are only trusted while subscribed; otherwise we could miss
+        # another worker's invalidation.
+        self._subscribed = False
 
     async def ping(self) -> None:
         try:
@@ -21,26 +102,88 @@ class RedisClient:
             raise
 
     async def get(self, key: str) -> str | None:
+        label = self._local_label(key)
+        if label is not None:
+            value = self._local.get(key, label)  # type: ignore[union-attr]
+            if value is not None:
+                return value
+        if not self._breaker.allow():
+            return None
         try:
-            return await self._client.get(key)  # type: ignore[return-value]
+            stored = await self._client.get(key)
         except Exception:
+            self._record_failure()
             logger.warning("Redis get failed for key %s", key)
             return None
+        self._breaker.record_success()
+        try:
+            value = self._codec.decode(key, stored) if stored is not None else None
+        except Exception:
+            logger.warning("Redis get could not decode key %s", key)
+            return None
+        if label is not None and value is not None:
+            self._local.set(key, value)  # type: ignore[union-attr]
+        return value
 
     async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        if not self._breaker.allow():
+            return
         try:
-            await self._client.set(key, value, ex=ttl_seconds)  # type: ignore[misc]
+            await self._client.set(key, self._codec.encode(key, value), ex=ttl_seconds)  # type: ignore[misc]
         except Exception:
+            self._record_failure()
             logger.warning("Redis set failed for key %s", key)
+            return
+        self._breaker.record_success()
+        if self._local_label(key) is not None:
+            self._local.set(key, value, ttl_seconds)  # type: ignore[union-attr]
 
     async def delete(self, key: str) -> None:
+        await self.invalidate(keys=[key])
+
+    async def invalidate(self, keys: Sequence[str] = (), namespaces: Sequence[str] = ()) -> None:
+        """Delete keys and bump namespace generations (see get_generation) in a single round trip.
+
+        Skipped while the breaker is open: entries that survive it are bounded by their TTLs.
+        """
+        keys, namespaces = list(keys), list(namespaces)
+        if not keys and not namespaces:
+            return
+        if self._local is not None:
+            for key in keys:
+                self._local.invalidate(key)
+        for namespace in namespaces:
+            self._forget_generation(namespace)
+        if not self._breaker.allow():
+            logger.warning("Redis circuit open; skipped invalidating keys %s, namespaces %s", keys, namespaces)
+            return
         try:
-            await self._client.delete(key)  # type: ignore[misc]
+            async with self._client.pipeline(transaction=False) as pipe:
+                if keys:
+                    pipe.delete(*keys)
+                for namespace in namespaces:
+                    await self._bump_generation(
+                        keys=[f"{GENERATION_KEY_PREFIX}:{namespace}"],
+                        args=[_clock_generation(), GENERATION_TTL_SECONDS],
+                        client=pipe,
+                    )
+                # Key deletes only matter to workers holding an L1; generation bumps always do.
+                message = {"keys": keys if self._local is not None else [], "namespaces": namespaces}
+                if message["keys"] or message["namespaces"]:
+                    pipe.publish(INVALIDATION_CHANNEL, json.dumps(message))
+                await pipe.execute()
         except Exception:
-            logger.warning("Redis delete failed for key %s", key)
+            self._record_failure()
+            logger.warning("Redis invalidate failed for keys %s, namespaces %s", keys, namespaces)
+            return
+        self._breaker.record_success()
 
     async def delete_by_pattern(self, pattern: str) -> None:
         # Finds and deletes all keys matching the pattern (e.g. "article:list:*") in batches, without blocking Redis
+        if self._local is not None:
+            self._local.invalidate_pattern(pattern)
+        if not self._breaker.allow():
+            return
         try:
             cursor = 0
             while True:
@@ -50,8 +193,165 @@ class RedisClient:
                 if cursor == 0:
                     break
         except Exception:
+            self._record_failure()
             logger.warning("Redis delete_by_pattern failed for pattern %s", pattern)
+            return
+        self._breaker.record_success()
+        if self._local is not None:
+            try:
+                await self._client.publish(INVALIDATION_CHANNEL, json.dumps({"patterns": [pattern]}))  # type: ignore[misc]
+            except Exception:
+                logger.warning("Redis publish failed for pattern %s", pattern)
+
+    async def get_generation(self, namespace: str) -> str:
+        """Current generation of a cache namespace; embed it in keys so bump_generation invalidates them all."""
+        if self._subscribed and (gen := self._generations.get(namespace)) is not None:
+            return gen
+        key = f"{GENERATION_KEY_PREFIX}:{namespace}"
+        epoch = self._generation_epoch
+        stored = None
+        if self._breaker.allow():
+            try:
+                # Seed-if-missing and read back in one round trip.
+                async with self._client.pipeline(transaction=False) as pipe:
+                    pipe.set(key, _clock_generation(), nx=True, ex=GENERATION_TTL_SECONDS)
+                    pipe.get(key)
+                    _, stored = await pipe.execute()
+            except Exception:
+                self._record_failure()
+                logger.warning("Redis get_generation failed for namespace %s", namespace)
+            else:
+                self._breaker.record_success()
+        if stored is None:
+            # A throwaway generation: never matches a cached entry, so we can't serve a stale one.
+            return uuid.uuid4().hex
+        gen = stored.decode()
+        if epoch == self._generation_epoch:
+            self._remember_generation(namespace, gen)
+        return gen
+
+    async def bump_generation(self, namespace: str) -> None:
+        """Invalidate every key built on this namespace's generation; old entries age out by TTL."""
+        await self.invalidate(namespaces=[namespace])
+
+    async def try_lock(self, key: str, ttl_ms: int) -> str | None:
+        """Acquire a short-lived lock with SET NX PX. Returns the owner token, or None if it is held.
+
+        Fails open: if Redis errors (or the breaker is open), a token is returned so the caller
+        proceeds as the lock holder.
+        """
+        token = uuid.uuid4().hex
+        if not self._breaker.allow():
+            return token
+        try:
+            acquired = await self._client.set(key, token, nx=True, px=ttl_ms)  # type: ignore[misc]
+        except Exception:
+            self._record_failure()
+            logger.warning("Redis try_lock failed for key %s", key)
+            return token
+        self._breaker.record_success()
+        return token if acquired else None
+
+    async def release_lock(self, key: str, token: str) -> None:
+        if not self._breaker.allow():
+            return
+        try:
+            await self._release_lock(keys=[key], args=[token])
+        except Exception:
+            self._record_failure()
+            logger.warning("Redis release_lock failed for key %s", key)
+            return
+        self._breaker.record_success()
+
+    @property
+    def available(self) -> bool:
+        """False while the circuit breaker is open, i.e. Redis calls are being skipped."""
+        return self._breaker.state != OPEN
+
+    def breaker_stats(self) -> dict:
+        return self._breaker.stats()
+
+    def local_cache_stats(self) -> dict:
+        if self._local is None:
+            return {"enabled": False}
+        return {"enabled": True, "subscribed": self._subscribed, **self._local.stats()}
+
+    def compression_stats(self) -> dict:
+        return self._codec.stats()
+
+    def pool_stats(self) -> dict:
+        return self._pool.stats()
+
+    def start_invalidation_listener(self) -> None:
+        """Start applying other workers' invalidations to the L1 and the generation memo."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen_for_invalidations())
 
     async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        await self._pubsub_client.aclose()
         await self._client.aclose()
 
+    def _record_failure(self) -> None:
+        if self._breaker.record_failure():
+            logger.error(
+                "Redis circuit opened after %d consecutive failures; failing fast for %.0fs",
+                settings.redis.breaker_threshold,
+                settings.redis.breaker_cooldown_seconds,
+            )
+
+    def _local_label(self, key: str) -> str | None:
+        if self._local is None or not self._subscribed:
+            return None
+        return self._local.label_for(key)
+
+    def _forget_generation(self, namespace: str) -> None:
+        self._generation_epoch += 1
+        self._generations.pop(namespace, None)
+
+    def _remember_generation(self, namespace: str, gen: str) -> None:
+        if len(self._generations) >= GENERATION_MEMO_MAX:
+            self._generations.clear()
+        self._generations[namespace] = gen
+
+    def _apply_invalidation(self, data: str) -> None:
+        message = json.loads(data)
+        for namespace in message.get("namespaces", ()):
+            self._forget_generation(namespace)
+        if self._local is not None:
+            for key in message.get("keys", ()):
+                self._local.invalidate(key)
+            for pattern in message.get("patterns", ()):
+                self._local.invalidate_pattern(pattern)
+
+    async def _listen_for_invalidations(self) -> None:
+        while True:
+            pubsub = self._pubsub_client.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Messages published while we were not subscribed are lost, so start from scratch.
+                self._generation_epoch += 1
+                self._generations.clear()
+                if self._local is not None:
+                    self._local.clear()
+                self._subscribed = True
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._apply_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Redis invalidation listener disconnected; retrying")
+            finally:
+                self._subscribed = False
+                await pubsub.aclose()
+            await asyncio.sleep(INVALIDATION_RETRY_SECONDS)
+
+
+def _clock_generation() -> str:
+    return str(time.time_ns() // 1_000_000)
@@ -0,0 +1,68 @@
+import time
+import zlib
+
+# First byte of a compressed value. Plain values are UTF-8 JSON (or an entry header starting
+# with "#"), so they can never start with this byte and old entries keep reading as before.
+COMPRESSED_MARKER = b"\x01"
+COMPRESSION_LEVEL = 6
+
+
+class PayloadCodec:
+    """Encodes cache values to bytes, zlib-compressing those over a per-prefix size threshold.
+
+    thresholds maps a key prefix to the minimum UTF-8 size (bytes) worth compressing; the longest
+    matching prefix wins, and keys matching none are stored as plain UTF-8.
+    """
+
+    def __init__(self, thresholds: dict[str, int] | None = None):
+        # Longest prefix first so "product:detail" beats "product".
+        self._thresholds = sorted((thresholds or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        self._stats: dict[str, dict[str, float]] = {
+            prefix: {"compressed": 0, "raw_bytes": 0, "stored_bytes": 0, "encode_seconds": 0.0, "decode_seconds": 0.0}
+            for prefix, _ in self._thresholds
+        }
+        self._decoded = 0
+
+    def encode(self, key: str, value: str) -> bytes:
+        raw = value.encode()
+        prefix, threshold = self._match(key)
+        if prefix is None or len(raw) < threshold:
+            return raw
+        started = time.perf_counter()
+        stored = COMPRESSED_MARKER + zlib.compress(raw, COMPRESSION_LEVEL)
+        stats = self._stats[prefix]
+        stats["encode_seconds"] += time.perf_counter() - started
+        stats["compressed"] += 1
+        stats["raw_bytes"] += len(raw)
+        stats["stored_bytes"] += len(stored)
+        return stored
+
+    def decode(self, key: str, stored: bytes) -> str:
+        if not stored.startswith(COMPRESSED_MARKER):
+            return stored.decode()
+        started = time.perf_counter()
+        value = zlib.decompress(stored[len(COMPRESSED_MARKER):]).decode()
+        prefix, _ = self._match(key)
+        if prefix is not None:
+            self._stats[prefix]["decode_seconds"] += time.perf_counter() - started
+        self._decoded += 1
+        return value
+
+    def stats(self) -> dict:
+        prefixes = {}
+        for prefix, threshold in self._thresholds:
+            s = self._stats[prefix]
+            prefixes[prefix] = {
+                "threshold_bytes": threshold,
+                "compressed": int(s["compressed"]),
+                "ratio": round(s["raw_bytes"] / s["stored_bytes"], 2) if s["stored_bytes"] else None,
+                "avg_encode_ms": round(s["encode_seconds"] * 1000 / s["compressed"], 3) if s["compressed"] else None,
+                "decode_ms_total": round(s["decode_seconds"] * 1000, 3),
+            }
+        return {"decoded": self._decoded, "prefixes": prefixes}
+
+    def _match(self, key: str) -> tuple[str | None, int]:
+        for prefix, threshold in self._thresholds:
+            if key == prefix or key.startswith(f"{prefix}:"):
+                return prefix, threshold
+        return None, 0
@@ -0,0 +1,75 @@
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+
+
+class LocalCache:
+    """Bounded in-process LRU + TTL cache for raw Redis values.
+
+    Only keys matching one of the configured glob patterns are held; each pattern is also the
+    label its hit/miss counters are reported under. Size is approximated as len(key) + len(value).
+    """
+
+    def __init__(self, patterns: dict[str, str], max_bytes: int, ttl_seconds: float):
+        self._patterns = patterns
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+        self._stats = {label: {"hits": 0, "misses": 0} for label in patterns}
+
+    def label_for(self, key: str) -> str | None:
+        for label, pattern in self._patterns.items():
+            if fnmatchcase(key, pattern):
+                return label
+        return None
+
+    def get(self, key: str, label: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self._stats[label]["hits"] += 1
+            return entry[1]
+        if entry is not None:
+            self._drop(key)
+        self._stats[label]["misses"] += 1
+        return None
+
+    def set(self, key: str, value: str, ttl_seconds: float | None = None) -> None:
+        size = len(key) + len(value)
+        self._drop(key)  # the old value is superseded even when the new one is too big to hold
+        if size > self._max_bytes:
+            return
+        ttl = self._ttl if ttl_seconds is None else min(self._ttl, ttl_seconds)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self._evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        self._drop(key)
+
+    def invalidate_pattern(self, pattern: str) -> None:
+        for key in [k for k in self._entries if fnmatchcase(k, pattern)]:
+            self._drop(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "evictions": self._evictions,
+            "keys": {label: dict(counts) for label, counts in self._stats.items()},
+        }
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(key) + len(entry[1])
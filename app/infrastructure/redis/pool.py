@@ -0,0 +1,43 @@
+from redis.asyncio import BlockingConnectionPool
+from redis.asyncio.connection import AbstractConnection
+
+from app.common.pool_metrics import PoolMetrics
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    """BlockingConnectionPool that times checkouts and tracks when each connection was (re)established."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def make_connection(self) -> AbstractConnection:
+        connection = super().make_connection()
+        # Fires on the initial connect and on every reconnect.
+        connection.register_connect_callback(self._on_connect)
+        return connection
+
+    async def get_connection(self, *args, **kwargs):
+        with self.metrics.checkout(queued=not self.can_get_connection()):
+            return await super().get_connection(*args, **kwargs)
+
+    async def release(self, connection: AbstractConnection) -> None:
+        await super().release(connection)
+        if not connection.is_connected:
+            self.metrics.disconnected(connection)
+
+    async def disconnect(self, inuse_connections: bool = True) -> None:
+        await super().disconnect(inuse_connections)
+        for connection in (*self._available_connections, *self._in_use_connections):
+            if not connection.is_connected:
+                self.metrics.disconnected(connection)
+
+    def stats(self) -> dict:
+        return self.metrics.stats(
+            size=self.max_connections,
+            checked_out=len(self._in_use_connections),
+            idle=len(self._available_connections),
+        )
+
+    def _on_connect(self, connection: AbstractConnection) -> None:
+        self.metrics.connected(connection)
@@ -1,10 +1,12 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from app.middleware.logging import AccessLogMiddleware
+from app.middleware.recent_write import RecentWriteMiddleware
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from app.database.connection import db_manager
 from app.infrastructure.redis.client import RedisClient
+from app.common.cache_keys import COMPRESSION_THRESHOLDS, L1_CACHE_KEYS
 from app.api.v1 import router as api_router
 # Import models so SQLAlchemy metadata knows about every table before create_all().
 from app.domain.product.model import Product, ProductCategory, ProductVote, ProductBookmark, ProductInvestorInterest, ProductComment  # noqa: F401
@@ -13,6 +15,7 @@ from app.domain.lab.model import Lab, LabCategory  # noqa: F401
 from app.domain.paper.model import Paper, PaperCategory, PaperVote  # noqa: F401
 from app.domain.article.model import Article, ArticleTag  # noqa: F401
 from app.domain.tag.model import Tag  # noqa: F401
+from app.domain.search.model import SearchDocument  # noqa: F401
 from app.exceptions.exceptions import add_exception_handlers
 from app.core.logger import (
     get_logger,
@@ -34,9 +37,14 @@ async def lifespan(app: FastAPI):
     try:
         setup_logging()
         db_manager.init_engine()
+        db_manager.start_replica_monitor()
 
-        app.state.redis_client = RedisClient()
+        app.state.redis_client = RedisClient(
+            local_cache_keys=L1_CACHE_KEYS,
+            compression_thresholds=COMPRESSION_THRESHOLDS,
+        )
         await app.state.redis_client.ping()
+        app.state.redis_client.start_invalidation_listener()
         logger.info("Redis initialized")
 
         logger.info("Application startup complete")
@@ -56,6 +64,7 @@ app.state.limiter = limiter
 
 app.add_middleware(AccessLogMiddleware)
 app.add_middleware(SlowAPIMiddleware)
+app.add_middleware(RecentWriteMiddleware)
 
 # CORS added last = registered outermost, handles requests first
 add_cors_middleware(app)
@@ -69,4 +78,7 @@ app.include_router(api_router)
 @app.get("/health")
 @limiter.limit("5/minute")
 async def health_check(request: Request):
-    return {"status": "healthy"}
+    redis_client = getattr(request.app.state, "redis_client", None)
+    # Redis outages degrade the cache, not the app, so they don't fail the health check.
+    redis_state = redis_client.breaker_stats()["state"] if redis_client is not None else None
+    return {"status": "healthy", "redis": redis_state}
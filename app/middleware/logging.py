@@ -2,9 +2,12 @@ import logging
 import time
 import uuid
 from contextvars import ContextVar
+from starlette.datastructures import MutableHeaders
 from starlette.types import ASGIApp
 from starlette.requests import Request
 
+from app.database.query_stats import normalize_sql, track_queries
+
 logger = logging.getLogger("app.access")
 _request_id: ContextVar[str] = ContextVar("request_id", default="-")
 _user_email: ContextVar[str | None] = ContextVar("user_email", default=None)
@@ -57,17 +60,31 @@ class AccessLogMiddleware:
             if message["type"] == "http.response.start":
                 duration_s = time.perf_counter() - start
                 query_string = scope.get("query_string", b"").decode()
+                db_ms = round(queries.total_s * 1000, 1)
+
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", f'db;dur={db_ms};desc="{queries.count} queries"')
+                headers.append("X-DB-Queries", str(queries.count))
+                if queries.count_strategy is not None:
+                    headers.append("X-Count-Strategy", queries.count_strategy)
 
                 logger.info("http_request", extra={
+                    "request_id": get_request_id(),
                     "method": scope["method"],
                     "path": scope["path"],
                     "query_params": query_string if query_string else None,
                     "status_code": message["status"],
                     "latency_s": round(duration_s, 3),
+                    "db_queries": queries.count,
+                    "db_time_ms": db_ms,
+                    "db_slowest_ms": round(queries.slowest_s * 1000, 1),
+                    "db_slowest_sql": normalize_sql(queries.slowest_sql) if queries.slowest_sql else None,
+                    "count_strategy": queries.count_strategy,
                 })
             await send(message)
 
         try:
-            await self.app(scope, receive, send_wrapper)
+            with track_queries(scope) as queries:
+                await self.app(scope, receive, send_wrapper)
         finally:
             _request_id.reset(token)
@@ -29,6 +29,13 @@ limiter = Limiter(
     key_func=rate_limit_key,
     default_limits=["200/minute", "20/second"],
     storage_uri=settings.redis.url,
+    storage_options={
+        "socket_timeout": settings.redis.socket_timeout,
+        "socket_connect_timeout": settings.redis.socket_timeout,
+    },
+    # If Redis is down, rate-limit per worker in memory rather than failing requests.
+    swallow_errors=True,
+    in_memory_fallback_enabled=True,
 )
 
 
@@ -0,0 +1,49 @@
+from http.cookies import SimpleCookie
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+# Set after a successful write so the client's next reads go to the primary instead of a
+# replica that may not have replayed the write yet. Clients that don't keep cookies can send
+# the header instead.
+RECENT_WRITE_COOKIE = "recent_write"
+RECENT_WRITE_HEADER = "x-recent-write"
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def recently_wrote(request: Request) -> bool:
+    return RECENT_WRITE_COOKIE in request.cookies or RECENT_WRITE_HEADER in request.headers
+
+
+def _cookie_header() -> bytes:
+    cookie = SimpleCookie()
+    cookie[RECENT_WRITE_COOKIE] = "1"
+    morsel = cookie[RECENT_WRITE_COOKIE]
+    morsel["max-age"] = settings.db.read_your_writes_seconds
+    morsel["path"] = "/"
+    morsel["httponly"] = True
+    morsel["samesite"] = settings.auth.cookie_samesite
+    if settings.auth.cookie_secure:
+        morsel["secure"] = True
+    return morsel.OutputString().encode()
+
+
+class RecentWriteMiddleware:
+    """Marks clients that just wrote (non-GET requests answered with 2xx/3xx) with RECENT_WRITE_COOKIE."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            return await self.app(scope, receive, send)
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", _cookie_header())]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,80 @@
+"""
+Compare the two cache-hit paths for a 50-item product list page.
+
+  model  — cached_detail: json.loads + PaginatedSchema.model_validate, then FastAPI
+           re-serializes through response_model (dump_python(by_alias) + json.dumps)
+  raw    — cached_response: the stored body goes straight into a Response
+
+No Redis or database needed; the payload is built in memory.
+
+Usage:
+    python scripts/bench_cache_hit.py [--items 50] [--rounds 2000]
+"""
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timezone
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.common.schema import PaginatedSchema
+from app.domain.product.schema import ProductListSchema
+from app.enums.enums import ProductStage, ProductStatus
+
+
+def build_page(items: int) -> PaginatedSchema[ProductListSchema]:
+    now = datetime.now(timezone.utc)
+    return PaginatedSchema[ProductListSchema](
+        items=[
+            ProductListSchema(
+                id=i,
+                slug=f"product-{i}",
+                name=f"Product {i}",
+                short_desc="A short description of the product that fits on a card.",
+                stage=ProductStage.SEED,
+                funding=1_500_000.0,
+                founded=2021,
+                quality_badge=None,
+                logo=f"https://cdn.example.com/logos/{i}.png",
+                status=ProductStatus.APPROVED,
+                categories=[{"id": 1, "name": "AI", "subcategories": [{"id": 2, "name": "Agents", "status": "approved"}]}],
+                created_at=now,
+                updated_at=now,
+                approved_at=now,
+            )
+            for i in range(items)
+        ],
+        total=items * 20,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    schema_class = PaginatedSchema[ProductListSchema]
+    adapter = TypeAdapter(schema_class)
+    page = build_page(args.items)
+    model_payload = json.dumps(page.model_dump(mode="json"))  # what cached_detail stores
+    raw_payload = adapter.dump_json(page, by_alias=True).decode()  # what cached_response stores
+
+    def model_hit() -> bytes:
+        model = schema_class.model_validate(json.loads(model_payload))
+        return json.dumps(adapter.dump_python(model, mode="json", by_alias=True)).encode()
+
+    def raw_hit() -> bytes:
+        return Response(content=raw_payload, media_type="application/json").body
+
+    assert json.loads(model_hit()) == json.loads(raw_hit())
+
+    for name, fn in (("model", model_hit), ("raw", raw_hit)):
+        best = min(timeit.repeat(fn, number=args.rounds, repeat=5)) / args.rounds
+        print(f"{name:>6}: {best * 1e6:9.1f} µs/hit  ({len(raw_payload)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Repair drift in the denormalized interaction counters (products.vote_count, bookmark_count,
+investor_interest_count and papers.vote_count) by recounting their rows, and in
+products.is_listed by re-deriving it from the hidden categories.
+
+The counters are moved in the same statement as each toggle (and taken down before a user is
+deleted), so drift only comes from rows removed around them (e.g. manual SQL) or a toggle
+racing a previous run. is_listed drifts only when categories are hidden or unhidden outside the
+admin API (e.g. manual SQL). Safe to run at any time; meant for a periodic job.
+
+Usage:
+    PYTHONPATH=. python scripts/reconcile_counters.py [--dry-run]
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.database.connection import db_manager
+from app.domain.paper.repository import PaperRepository
+from app.domain.product.repository import ProductRepository
+from app.domain.user.model import User  # noqa: F401 — registers 'users' table in metadata
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+log = logging.getLogger(__name__)
+
+
+async def reconcile_counters(dry_run: bool) -> None:
+    db_manager.init_engine()
+
+    async with db_manager.session_scope() as session:
+        fixed = await ProductRepository().reconcile_counters(session, dry_run=dry_run)
+        fixed["paper vote_count"] = await PaperRepository().reconcile_vote_counts(session, dry_run=dry_run)
+        fixed["product is_listed"] = await ProductRepository().refresh_listed(session, dry_run=dry_run)
+        if not dry_run:
+            await session.commit()
+
+    await db_manager.close()
+
+    verb = "would fix" if dry_run else "fixed"
+    for counter, ids in fixed.items():
+        log.info("%-24s %s %d row(s)%s", counter, verb, len(ids), f": {ids[:20]}" if ids else "")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recount denormalized vote/bookmark/interest counters and listing flags")
+    parser.add_argument("--dry-run", action="store_true", help="Report drifted rows without writing")
+    args = parser.parse_args()
+    asyncio.run(reconcile_counters(dry_run=args.dry_run))
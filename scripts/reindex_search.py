@@ -0,0 +1,45 @@
+"""
+Rebuild the search_documents table from products, articles, broadcasts and papers.
+
+The services reindex an entity whenever they change it, so this is only needed after
+writes that bypass them (seed scripts, manual SQL) or to recover from a bad deploy.
+Cached search responses expire on their own within SEARCH_TTL.
+
+Usage:
+    PYTHONPATH=. python scripts/reindex_search.py [--dry-run]
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.database.connection import db_manager
+from app.domain.search.repository import SearchRepository
+from app.domain.user.model import User  # noqa: F401 — registers 'users' table in metadata
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+log = logging.getLogger(__name__)
+
+
+async def reindex_search(dry_run: bool) -> None:
+    db_manager.init_engine()
+
+    async with db_manager.session_scope() as session:
+        indexed = await SearchRepository().rebuild(session)
+        if dry_run:
+            await session.rollback()
+        else:
+            await session.commit()
+
+    await db_manager.close()
+
+    verb = "would index" if dry_run else "indexed"
+    for entity_type, count in indexed.items():
+        log.info("%-10s %s %d document(s)", entity_type.value, verb, count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the cross-entity search documents")
+    parser.add_argument("--dry-run", action="store_true", help="Report counts without writing")
+    args = parser.parse_args()
+    asyncio.run(reindex_search(dry_run=args.dry_run))
@@ -12,6 +12,8 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import NullPool
 from app.main import app
 from app.database.connection import Base, db_manager
+from app.database.query_stats import instrument_queries
+from app.database.replicas import ReadRoutingSession
 from app.api.dependencies import get_db, get_current_user, get_email_service
 from app.api.dependencies.integrations import get_redis_client
 from app.domain.user.schema import UserOutSchema
@@ -80,6 +82,7 @@ async def test_engine():
     
     async with engine.begin() as conn:
         await conn.execute(text("CREATE EXTENSION IF NOT EXISTS ltree"))
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
     
@@ -105,6 +108,14 @@ def session_factory(test_engine):
     # same test engine so those code paths hit the test DB instead of erroring out.
     db_manager.engine = test_engine
     db_manager.async_session = factory
+    instrument_queries(test_engine)
+    # get_read_db sessions too; with no replicas configured they read from the test engine.
+    db_manager.read_session = async_sessionmaker(
+        test_engine,
+        class_=AsyncSession,
+        sync_session_class=ReadRoutingSession,
+        expire_on_commit=False,
+    )
     return factory
 
 
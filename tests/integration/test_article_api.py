@@ -146,6 +146,33 @@ class TestArticleAPI:
         ids = [a["id"] for a in response.json()["items"]]
         assert draft["id"] in ids
 
+    async def test_list_articles_cursor_walks_every_row_once(self, client: ClientWithEmail):
+        # Drafts have no published_at, so the walk crosses the NULLs-last tail too.
+        for _ in range(3):
+            await self._create_article_as_admin(client)
+        await self._publish_article(client, (await self._create_article_as_admin(client))["id"])
+
+        app.dependency_overrides[get_optional_user] = lambda: build_mock_user(UserRole.ADMIN)
+        try:
+            everything = (await client.get("/api/v1/article?limit=1000")).json()
+            walked, cursor = [], None
+            while True:
+                params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+                page = (await client.get("/api/v1/article", params=params)).json()
+                walked += [a["id"] for a in page["items"]]
+                cursor = page["nextCursor"]
+                if cursor is None:
+                    break
+        finally:
+            del app.dependency_overrides[get_optional_user]
+
+        assert walked == [a["id"] for a in everything["items"]]
+        assert everything["nextCursor"] is None
+
+    async def test_list_articles_rejects_malformed_cursor(self, client: ClientWithEmail):
+        response = await client.get("/api/v1/article?cursor=not-a-cursor")
+        assert response.status_code == 400
+
     async def test_list_articles_filter_by_type(self, client: ClientWithEmail):
         roundtable_payload = {**ARTICLE_PAYLOAD, "articleType": "roundtable", "title": "Roundtable Article", "status": "published"}
         with _override_admin():
@@ -1,10 +1,11 @@
+import json
 import re
 from datetime import datetime
 
 import pytest
 import pytest_asyncio
 from fastapi import HTTPException, status
-from sqlalchemy import insert, select, text
+from sqlalchemy import delete, insert, select, text, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
@@ -12,12 +13,15 @@ from sqlalchemy.pool import NullPool
 from app.api.dependencies import get_current_user
 from app.api.dependencies.auth import get_optional_user
 from app.api.dependencies.services import get_storage_service, get_logo_dev_service
-from app.exceptions.exceptions import ExternalServiceError
+from app.database.query_stats import instrument_queries, track_queries
+from app.exceptions.exceptions import ExternalServiceError, NotFoundError
 from app.domain.category.model import Category
-from app.domain.product.model import ProductCategory
+from app.domain.product.model import Product, ProductCategory, ProductVote
+from app.common.pagination import keyset_page
+from app.domain.product.repository import ProductRepository
 from app.domain.user.model import User
 from app.domain.user.schema import UserOutSchema
-from app.enums.enums import UserRole
+from app.enums.enums import ProductSortBy, ProductStatus, UserRole
 from app.main import app
 from tests.conftest import TEST_DATABASE_URL, ClientWithEmail
 
@@ -343,6 +347,81 @@ class TestProductAPI:
         assert response.status_code == 200
         assert response.json()["name"] == "Admin updated"
 
+    async def test_create_and_update_replace_child_collections(self, client: ClientWithEmail):
+        original = app.dependency_overrides[get_current_user]
+        app.dependency_overrides[get_current_user] = lambda: build_mock_user(UserRole.FOUNDER, user_id=1)
+        try:
+            created = await client.post("/api/v1/product", json={
+                **PRODUCT_PAYLOAD,
+                "name": "Child Collections Product",
+                "links": [
+                    {"linkType": "website", "url": "https://example.com"},
+                    {"linkType": "github", "url": "https://github.com/example"},
+                    {"linkType": "docs", "url": "https://docs.example.com"},
+                ],
+                "backers": ["A16Z", "Sequoia"],
+                "grants": ["NSF"],
+            })
+            product_id = created.json()["id"]
+            updated = await client.patch(f"/api/v1/product/{product_id}", json={
+                "links": [
+                    {"linkType": "website", "url": "https://example.org"},
+                    {"linkType": "demo", "url": "https://demo.example.org"},
+                ],
+                "backers": ["Stripe", "Accel"],
+                "grants": [],
+            })
+            # The public detail is built by a separate single-statement query; it must agree.
+            app.dependency_overrides[get_optional_user] = lambda: build_mock_user(UserRole.ADMIN, user_id=99)
+            detail = await client.get(f"/api/v1/product/slug/{created.json()['slug']}")
+        finally:
+            app.dependency_overrides[get_current_user] = original
+            app.dependency_overrides.pop(get_optional_user, None)
+
+        assert created.status_code == 201
+        assert {(l["linkType"], l["url"]) for l in created.json()["links"]} == {
+            ("website", "https://example.com"),
+            ("github", "https://github.com/example"),
+            ("docs", "https://docs.example.com"),
+        }
+        assert [b["name"] for b in created.json()["backers"]] == ["A16Z", "Sequoia"]
+        assert [g["name"] for g in created.json()["grants"]] == ["NSF"]
+
+        assert updated.status_code == 200
+        assert {(l["linkType"], l["url"]) for l in updated.json()["links"]} == {
+            ("website", "https://example.org"),
+            ("demo", "https://demo.example.org"),
+        }
+        assert [b["name"] for b in updated.json()["backers"]] == ["Stripe", "Accel"]
+        assert updated.json()["grants"] == []
+
+        assert detail.status_code == 200
+        assert [b["name"] for b in detail.json()["backers"]] == ["Stripe", "Accel"]
+        assert detail.json()["grants"] == []
+
+    async def test_update_and_soft_delete_are_single_statements(self, client: ClientWithEmail, db_session):
+        product_id = await self._create_product_as_founder(client)
+        repo = ProductRepository()
+        # Connect (and let the dialect initialize) before counting.
+        await db_session.execute(text("SELECT 1"))
+        instrument_queries(db_session.bind)
+
+        with track_queries({}) as stats:
+            product = await repo.update(db_session, product_id, {"short_desc": "One round trip"}, current_user_id=1)
+        assert stats.count == 1
+        assert (product.short_desc, product.updated_by_id) == ("One round trip", 1)
+
+        with track_queries({}) as stats:
+            await repo.soft_delete(db_session, product_id, deleted_by_id=1)
+        assert stats.count == 1
+        assert product.deleted_at is not None
+
+        with pytest.raises(NotFoundError):
+            await repo.update(db_session, product_id, {"short_desc": "gone"})
+        with pytest.raises(NotFoundError):
+            await repo.soft_delete(db_session, product_id)
+        await db_session.rollback()
+
     async def _create_two_parents_with_subcategories(self, db_session) -> dict[str, int]:
         """Two parent categories, each with one subcategory, for parent/subcategory mismatch tests."""
         parent_a = (
@@ -649,6 +728,76 @@ class TestProductAPI:
         assert response.status_code == 200
         assert response.json()["bookmarkCount"] == 1
 
+    async def test_reconcile_counters_repairs_drift(self, client: ClientWithEmail, db_session):
+        product_id = await self._create_product_as_founder(client)
+        await client.put(f"/api/v1/product/{product_id}/vote", json={"voted": True})
+        # A vote row removed behind the counter's back, as manual SQL would.
+        await db_session.execute(delete(ProductVote).where(ProductVote.product_id == product_id))
+        await db_session.commit()
+
+        fixed = await ProductRepository().reconcile_counters(db_session)
+        await db_session.commit()
+
+        assert product_id in fixed["product vote_count"]
+        response = await client.get(f"/api/v1/product/{product_id}")
+        assert response.json()["voteCount"] == 0
+
+    async def test_deleting_a_user_takes_their_interactions_off_the_counters(
+        self, client: ClientWithEmail, user_payload
+    ):
+        product_id = await self._create_product_as_founder(client)
+        user_id = (await client.post("/api/v1/user/", json=user_payload)).json()["id"]
+        original = app.dependency_overrides[get_current_user]
+        app.dependency_overrides[get_current_user] = lambda: build_mock_user(UserRole.INVESTOR, user_id=user_id)
+        try:
+            await client.put(f"/api/v1/product/{product_id}/vote", json={"voted": True})
+            await client.put(f"/api/v1/product/{product_id}/bookmark", json={"bookmarked": True})
+        finally:
+            app.dependency_overrides[get_current_user] = original
+
+        response = await client.delete(f"/api/v1/user/{user_id}")
+        assert response.status_code == 204
+
+        product = (await client.get(f"/api/v1/product/{product_id}")).json()
+        assert product["voteCount"] == 0
+        assert product["bookmarkCount"] == 0
+
+    async def test_viewer_flags_overlaid_on_shared_payloads(self, client: ClientWithEmail):
+        product_id = await self._create_product_as_founder(client, user_id=1)
+        viewer = build_mock_user(UserRole.INVESTOR, user_id=3)
+        original = app.dependency_overrides[get_current_user]
+        app.dependency_overrides[get_current_user] = lambda: viewer
+        app.dependency_overrides[get_optional_user] = lambda: viewer
+        try:
+            await client.put(f"/api/v1/product/{product_id}/bookmark", json={"bookmarked": True})
+            slug = (await client.get(f"/api/v1/product/{product_id}")).json()["slug"]
+            detail = await client.get(f"/api/v1/product/slug/{slug}")
+            listing = await client.get("/api/v1/product", params={"limit": 200})
+        finally:
+            app.dependency_overrides[get_current_user] = original
+            del app.dependency_overrides[get_optional_user]
+
+        assert detail.status_code == 200
+        assert detail.json()["bookmarked"] is True
+        assert detail.json()["voted"] is False
+        assert detail.json()["interested"] is False
+        item = next(i for i in listing.json()["items"] if i["id"] == product_id)
+        assert item["bookmarked"] is True
+
+    async def test_user_flags_reads_only_the_requested_flags(self, client: ClientWithEmail, db_session):
+        product_id = await self._create_product_as_founder(client, user_id=1)
+        original = app.dependency_overrides[get_current_user]
+        app.dependency_overrides[get_current_user] = lambda: build_mock_user(UserRole.INVESTOR, user_id=3)
+        try:
+            await client.put(f"/api/v1/product/{product_id}/bookmark", json={"bookmarked": True})
+            await client.put(f"/api/v1/product/{product_id}/vote", json={"voted": True})
+        finally:
+            app.dependency_overrides[get_current_user] = original
+
+        flags = await ProductRepository().get_user_flags(db_session, [product_id], 3, only=("bookmarked",))
+
+        assert flags == {"bookmarked": {product_id}}
+
     # ------------------------------------------------------------------
     # Investor Interest
     # ------------------------------------------------------------------
@@ -855,6 +1004,18 @@ class TestProductAPI:
         ids = [p["id"] for p in data["items"]]
         assert product_id not in ids
 
+    async def test_search_matches_stems_and_typos(self, client: ClientWithEmail, db_session):
+        product_id = await self._create_product_as_founder(client)
+        await db_session.execute(
+            update(Product).where(Product.id == product_id).values(name="Quantumleaf Robotics")
+        )
+        await db_session.commit()
+
+        for q in ("robotic", "QUANTUMLEAF  robotics", "quantumlef"):
+            response = await client.get("/api/v1/product", params={"q": q})
+            assert response.status_code == 200
+            assert product_id in [p["id"] for p in response.json()["items"]], q
+
     async def test_list_with_status_pending_returns_pending(self, client: ClientWithEmail):
         product_id = await self._create_product_as_founder(client, approve=False)
 
@@ -967,6 +1128,24 @@ class TestProductAPI:
         oldest_ids = [p["id"] for p in oldest_resp.json()["items"]]
         assert oldest_ids.index(newer_created_id) < oldest_ids.index(older_created_id)
 
+    @pytest.mark.parametrize("sort_by", [None, ProductSortBy.OLDEST, ProductSortBy.TOP])
+    async def test_default_feed_reads_in_index_order(self, db_session, sort_by):
+        q, keys = ProductRepository()._build_status_query(ProductStatus.APPROVED, sort_by=sort_by, listed=True)
+        page = keyset_page(q, keys, limit=20, offset=0, cursor=None)
+        sql = page.compile(dialect=db_session.bind.dialect, compile_kwargs={"literal_binds": True})
+        conn = await db_session.connection()
+        # The test tables are tiny; forbid sorting so the plan shows whether an index can serve the order.
+        await conn.exec_driver_sql("SET LOCAL enable_sort = off")
+        plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()
+        await db_session.rollback()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        node = plan[0]["Plan"]
+        while node["Node Type"] == "Limit":
+            node = node["Plans"][0]
+        assert node["Node Type"] != "Sort", node
+
     async def test_admin_can_reject_product(self, client: ClientWithEmail):
         product_id = await self._create_product_as_founder(client, approve=False)
         original = app.dependency_overrides[get_current_user]
@@ -1038,6 +1217,38 @@ class TestProductAPI:
         ids = [p["id"] for p in data["items"]]
         assert product_id in ids
 
+    async def test_hidden_category_unlists_product_until_unhidden(self, client: ClientWithEmail, db_session):
+        hidden_id = (
+            await db_session.execute(
+                insert(Category).values(name="Hidden Feed Category", is_hidden_from_all=True).returning(Category.id)
+            )
+        ).scalar_one()
+        await db_session.commit()
+        product_id = await self._create_product_as_founder(client)
+        original = app.dependency_overrides[get_current_user]
+        app.dependency_overrides[get_current_user] = lambda: build_mock_user(UserRole.ADMIN, user_id=99)
+        try:
+            await client.patch(f"/api/v1/product/{product_id}", json={"categoryIds": [hidden_id]})
+            hidden_ids = [p["id"] for p in (await client.get("/api/v1/product", params={"limit": 200})).json()["items"]]
+            unlisted = await client.get("/api/v1/product", params={"listed": False, "limit": 200})
+            hidden_hits = await client.get("/api/v1/search", params={"q": "product", "type": "product", "limit": 50})
+
+            response = await client.patch(
+                f"/api/v1/category/{hidden_id}", json={"name": "Hidden Feed Category", "isHiddenFromAll": False}
+            )
+            listed_ids = [p["id"] for p in (await client.get("/api/v1/product", params={"limit": 200})).json()["items"]]
+            listed_hits = await client.get("/api/v1/search", params={"q": "product", "type": "product", "limit": 50})
+        finally:
+            app.dependency_overrides[get_current_user] = original
+
+        assert product_id not in hidden_ids
+        assert product_id in [p["id"] for p in unlisted.json()["items"]]
+        assert product_id not in [hit["id"] for hit in hidden_hits.json()["items"]]
+        assert response.status_code == 200
+        assert response.json()["isHiddenFromAll"] is False
+        assert product_id in listed_ids
+        assert product_id in [hit["id"] for hit in listed_hits.json()["items"]]
+
     # ------------------------------------------------------------------
     # Comment — pin
     # ------------------------------------------------------------------
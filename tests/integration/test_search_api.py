@@ -0,0 +1,42 @@
+import pytest
+
+from tests.conftest import ClientWithEmail
+from tests.integration.test_article_api import ARTICLE_PAYLOAD, _override_admin
+
+
+@pytest.mark.asyncio
+class TestSearchAPI:
+
+    async def _search(self, client: ClientWithEmail, **params) -> dict:
+        response = await client.get("/api/v1/search", params=params)
+        assert response.status_code == 200
+        return response.json()
+
+    async def test_search_follows_article_visibility(self, client: ClientWithEmail):
+        payload = {**ARTICLE_PAYLOAD, "title": "Quokkaquest launch notes", "content": "How the quokkaquest team shipped."}
+        with _override_admin():
+            article = (await client.post("/api/v1/article", json=payload)).json()
+
+        # Drafts aren't indexed.
+        assert (await self._search(client, q="quokkaquest"))["items"] == []
+
+        with _override_admin():
+            await client.patch(f"/api/v1/article/{article['id']}", json={"status": "published"})
+
+        # Every word matches as a prefix, so partial input already finds it.
+        body = await self._search(client, q="quokka launch", type="article")
+        assert [(hit["type"], hit["id"]) for hit in body["items"]] == [("article", article["id"])]
+        assert body["items"][0]["slug"] == article["slug"]
+        assert "<mark>" in body["items"][0]["headline"]
+
+        with _override_admin():
+            await client.delete(f"/api/v1/article/{article['id']}")
+
+        assert (await self._search(client, q="quokkaquest"))["items"] == []
+
+    async def test_search_without_words_returns_nothing(self, client: ClientWithEmail):
+        assert await self._search(client, q="  !! ") == {"items": [], "nextCursor": None}
+
+    async def test_search_rejects_unknown_type(self, client: ClientWithEmail):
+        response = await client.get("/api/v1/search", params={"q": "x", "type": "user"})
+        assert response.status_code == 422
@@ -44,9 +44,9 @@ class AnonymousVisitor(HttpUser):
             params["q"] = random.choice(SEARCH_TERMS)
         elif roll < 0.80:
             params["dateFilter"] = random.choice(["today", "this_week", "this_month", "this_year"])
-        with self.client.get(
-            "/api/v1/product/", params=params, catch_response=True, name="GET /product/ (list)"
-        ) as r:
+        # Searches reported on their own, so their latency isn't averaged into browsing.
+        name = "GET /product/ (search)" if "q" in params else "GET /product/ (list)"
+        with self.client.get("/api/v1/product/", params=params, catch_response=True, name=name) as r:
             handle(r, "product list")
 
     @tag("read")
@@ -0,0 +1,61 @@
+from app.infrastructure.redis import breaker as breaker_module
+from app.infrastructure.redis.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _breaker(monkeypatch) -> tuple[CircuitBreaker, FakeClock]:
+    clock = FakeClock()
+    monkeypatch.setattr(breaker_module, "time", clock)
+    return CircuitBreaker(threshold=3, cooldown_seconds=10), clock
+
+
+def test_trips_after_consecutive_failures(monkeypatch):
+    breaker, _ = _breaker(monkeypatch)
+
+    assert breaker.record_failure() is False
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    assert breaker.record_failure() is True
+
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+
+def test_half_open_lets_one_probe_through_and_closes_on_success(monkeypatch):
+    breaker, clock = _breaker(monkeypatch)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 10
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens_for_another_cooldown(monkeypatch):
+    breaker, clock = _breaker(monkeypatch)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow()
+
+    assert breaker.record_failure() is False
+    assert breaker.state == OPEN
+    clock.now += 9
+    assert not breaker.allow()
+    clock.now += 1
+    assert breaker.allow()
+    assert breaker.stats()["trips"] == 1
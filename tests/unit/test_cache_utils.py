@@ -0,0 +1,244 @@
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.requests import Request
+
+from app.common import cache_utils
+from app.common.cache_utils import PUBLIC_CACHE_CONTROL, cached_detail, cached_response
+from app.core.config import settings
+from app.database.replicas import PRIMARY_INFO, REPLICA_BIND, ReadRoutingSession
+from app.domain.product.model import Product
+from app.domain.product.schema import ProductReleaseStatsSchema, ReleasePeriodSchema
+
+
+class FakeRedis:
+    """In-memory stand-in for RedisClient covering the calls the cache helpers make."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.locks: dict[str, str] = {}
+        self.available = True
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self.store[key] = value
+
+    async def try_lock(self, key: str, ttl_ms: int) -> str | None:
+        if key in self.locks:
+            return None
+        self.locks[key] = "token"
+        return "token"
+
+    async def release_lock(self, key: str, token: str) -> None:
+        if self.locks.get(key) == token:
+            del self.locks[key]
+
+
+def _stats(total: int) -> ProductReleaseStatsSchema:
+    return ProductReleaseStatsSchema(
+        releases=ReleasePeriodSchema(total=total, today=0, this_week=0, this_month=0, recent=0)
+    )
+
+
+async def test_single_flight_coalesces_concurrent_misses():
+    redis = FakeRedis()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return _stats(7)
+
+    results = await asyncio.gather(*[
+        cached_detail(redis, key="k", ttl=60, schema_class=ProductReleaseStatsSchema, fetch_fn=fetch, single_flight=True)
+        for _ in range(10)
+    ])
+
+    assert calls == 1
+    assert all(r.releases.total == 7 for r in results)
+    assert "k" in redis.store
+    assert not redis.locks
+
+
+async def test_single_flight_waits_for_filler_in_another_worker(monkeypatch):
+    monkeypatch.setattr(cache_utils, "FILL_POLL_SECONDS", 0.001)
+    redis = FakeRedis()
+    redis.locks[f"{cache_utils.FILL_LOCK_PREFIX}:k"] = "other-worker"
+
+    async def fetch():
+        raise AssertionError("should have been served by the other worker's fill")
+
+    async def other_worker_fills():
+        await asyncio.sleep(0.01)
+        redis.store["k"] = _stats(3).model_dump_json()
+
+    task = asyncio.create_task(other_worker_fills())
+    result = await cached_detail(
+        redis, key="k", ttl=60, schema_class=ProductReleaseStatsSchema, fetch_fn=fetch, single_flight=True
+    )
+    await task
+
+    assert result.releases.total == 3
+
+
+async def test_single_flight_propagates_fetch_errors():
+    redis = FakeRedis()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise LookupError("boom")
+
+    results = await asyncio.gather(*[
+        cached_detail(redis, key="k", ttl=60, schema_class=ProductReleaseStatsSchema, fetch_fn=fetch, single_flight=True)
+        for _ in range(3)
+    ], return_exceptions=True)
+
+    assert all(isinstance(r, LookupError) for r in results)
+    assert not cache_utils._inflight
+
+
+async def test_stale_entry_is_served_and_refreshed_in_background():
+    redis = FakeRedis()
+    redis.store["k"] = cache_utils.pack_entry(_stats(1).model_dump_json(), {"soft": 0})
+    refreshes = 0
+
+    async def fetch():
+        raise AssertionError("a stale hit must not block on the DB")
+
+    async def refresh():
+        nonlocal refreshes
+        refreshes += 1
+        await asyncio.sleep(0.01)
+        return _stats(2)
+
+    results = await asyncio.gather(*[
+        cached_detail(
+            redis, key="k", ttl=60, schema_class=ProductReleaseStatsSchema, fetch_fn=fetch,
+            soft_ttl=30, refresh_fn=refresh,
+        )
+        for _ in range(5)
+    ])
+    await asyncio.gather(*cache_utils._background_tasks)
+
+    assert all(r.releases.total == 1 for r in results)
+    assert refreshes == 1
+    meta, payload = cache_utils.unpack_entry(redis.store["k"])
+    assert meta["soft"] > 0
+    assert ProductReleaseStatsSchema.model_validate_json(payload).releases.total == 2
+    assert not cache_utils._revalidating
+    assert not redis.locks
+
+
+async def test_fresh_entry_does_not_refresh():
+    redis = FakeRedis()
+    redis.store["k"] = _stats(1).model_dump_json()  # plain entries written before soft TTLs existed
+
+    async def refresh():
+        raise AssertionError("fresh entries must not be refreshed")
+
+    result = await cached_detail(
+        redis, key="k", ttl=60, schema_class=ProductReleaseStatsSchema, fetch_fn=refresh,
+        soft_ttl=30, refresh_fn=refresh,
+    )
+
+    assert result.releases.total == 1
+    assert not cache_utils._background_tasks
+
+
+async def test_cached_response_serves_hits_as_raw_camel_case_body():
+    redis = FakeRedis()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return _stats(4)
+
+    miss = await cached_response(redis, key="k", ttl=60, response_type=ProductReleaseStatsSchema, fetch_fn=fetch)
+    hit = await cached_response(redis, key="k", ttl=60, response_type=ProductReleaseStatsSchema, fetch_fn=fetch)
+
+    assert calls == 1
+    assert hit.media_type == "application/json"
+    assert hit.body == miss.body
+    assert b'"thisWeek":0' in hit.body
+
+
+async def test_cached_response_ignores_entries_written_by_cached_detail():
+    redis = FakeRedis()
+    redis.store["k"] = _stats(1).model_dump_json()
+
+    async def fetch():
+        return _stats(2)
+
+    result = await cached_response(redis, key="k", ttl=60, response_type=ProductReleaseStatsSchema, fetch_fn=fetch)
+
+    assert b'"total":2' in result.body
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+async def test_cached_response_answers_matching_if_none_match_with_304():
+    redis = FakeRedis()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return _stats(4)
+
+    def get(request: Request):
+        return cached_response(
+            redis, key="k", ttl=60, response_type=ProductReleaseStatsSchema, fetch_fn=fetch,
+            request=request, cache_control=PUBLIC_CACHE_CONTROL,
+        )
+
+    first = await get(_request())
+    etag = first.headers["etag"]
+    not_modified = await get(_request(f"W/{etag}"))
+    changed = await get(_request('"stale"'))
+
+    assert calls == 1
+    assert first.status_code == 200 and first.headers["cache-control"] == PUBLIC_CACHE_CONTROL
+    assert not_modified.status_code == 304 and not_modified.body == b""
+    assert not_modified.headers["etag"] == etag
+    assert changed.status_code == 200 and changed.body == first.body
+
+
+async def test_open_circuit_skips_the_cache_entirely():
+    redis = FakeRedis()
+    redis.available = False
+    redis.store["k"] = '{"releases": {"total": 1, "today": 0, "this_week": 0, "this_month": 0, "recent": 0}}'
+
+    async def fetch():
+        return _stats(7)
+
+    result = await cached_detail(redis, key="k", ttl=60, schema_class=ProductReleaseStatsSchema, fetch_fn=fetch)
+
+    assert result.releases.total == 7
+    assert redis.store["k"].startswith('{"releases": {"total": 1')
+    assert not redis.locks
+
+
+async def test_fill_after_a_write_reads_the_primary_not_a_lagging_replica():
+    primary = create_async_engine(settings.db.url).sync_engine
+    replica = create_async_engine(settings.db.url).sync_engine
+    session = ReadRoutingSession(bind=primary, info={REPLICA_BIND: replica, PRIMARY_INFO: {}})
+    redis = FakeRedis()
+
+    async def fetch():
+        # The replica hasn't replayed the write that invalidated "k" yet.
+        return _stats(2 if session.get_bind(clause=select(Product)) is primary else 1)
+
+    result = await cached_detail(redis, key="k", ttl=60, schema_class=ProductReleaseStatsSchema, fetch_fn=fetch)
+
+    assert result.releases.total == 2
+    assert ProductReleaseStatsSchema.model_validate_json(redis.store["k"]).releases.total == 2
+    # Uncached reads on the request session still go to the replica.
+    assert session.get_bind(clause=select(Product)) is replica
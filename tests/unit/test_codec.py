@@ -0,0 +1,42 @@
+import json
+
+from app.infrastructure.redis.codec import COMPRESSED_MARKER, PayloadCodec
+
+
+def _codec() -> PayloadCodec:
+    return PayloadCodec({"product:detail": 100, "product": 10_000})
+
+
+def test_small_and_unconfigured_values_are_stored_plain():
+    codec = _codec()
+
+    assert codec.encode("product:detail:x", "{}") == b"{}"
+    assert codec.encode("category:list:g1:50:0", "[" + "1," * 500 + "1]").startswith(b"[")
+
+
+def test_large_values_round_trip_compressed():
+    codec = _codec()
+    value = json.dumps({"description": "lorem ipsum " * 200})
+
+    stored = codec.encode("product:detail:x:g1:anon", value)
+
+    assert stored.startswith(COMPRESSED_MARKER)
+    assert len(stored) < len(value)
+    assert codec.decode("product:detail:x:g1:anon", stored) == value
+
+
+def test_longest_prefix_wins_and_stats_report_ratio():
+    codec = _codec()
+    value = json.dumps({"description": "lorem ipsum " * 200})
+
+    codec.encode("product:detail:x:g1:anon", value)
+    codec.encode("product:list:g1:page", value)  # under the 10k "product" threshold
+
+    stats = codec.stats()["prefixes"]
+    assert stats["product:detail"]["compressed"] == 1
+    assert stats["product:detail"]["ratio"] > 1
+    assert stats["product"]["compressed"] == 0
+
+
+def test_plain_entries_written_before_compression_still_decode():
+    assert _codec().decode("product:detail:x", b'#{"soft": 1}\n{}') == '#{"soft": 1}\n{}'
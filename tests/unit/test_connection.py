@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.config import settings
+from app.database.connection import db_manager
+
+
+def _session() -> AsyncSession:
+    # Never connects: the reads below don't touch their sessions.
+    return AsyncSession(bind=create_async_engine(settings.db.url))
+
+
+async def test_reads_get_their_own_sessions_and_keep_order():
+    db = _session()
+    seen: list[AsyncSession] = []
+
+    def read(value: int):
+        async def run(session: AsyncSession) -> int:
+            seen.append(session)
+            await asyncio.sleep(0.01 * (3 - value))
+            return value
+        return run
+
+    assert await db_manager.gather_reads(db, read(0), read(1), read(2)) == [0, 1, 2]
+    assert db not in seen
+    assert len(set(map(id, seen))) == 3
+
+
+async def test_concurrency_is_bounded_per_request_session_across_nested_calls():
+    db = _session()
+    running = peak = 0
+
+    async def read(session: AsyncSession) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    await asyncio.gather(
+        db_manager.gather_reads(db, *[read] * 6),
+        db_manager.gather_reads(db, *[read] * 6),
+    )
+
+    assert peak == settings.db.parallel_reads
+
+
+async def test_failure_cancels_the_other_reads():
+    db = _session()
+    finished = []
+
+    async def slow(session: AsyncSession) -> None:
+        await asyncio.sleep(1)
+        finished.append(True)
+
+    async def broken(session: AsyncSession) -> None:
+        raise LookupError("boom")
+
+    with pytest.raises(LookupError):
+        await db_manager.gather_reads(db, slow, broken)
+    await asyncio.sleep(0)
+
+    assert not finished
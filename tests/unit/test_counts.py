@@ -0,0 +1,73 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.counts import CACHED, ESTIMATE, EXACT, WINDOW, ListTotal
+from app.common.pagination import Page
+from app.core.config import settings
+from app.database.query_stats import track_queries
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    async def get_generation(self, namespace: str) -> str:
+        return "1"
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self.store[key] = value
+
+
+class FakeList:
+    """Page and count callables over a list of 5 rows, recording which queries ran."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def page(self, session: AsyncSession, with_total: bool) -> Page:
+        self.calls.append("page+window" if with_total else "page")
+        return Page([1, 2], "next", 5 if with_total else None)
+
+    async def count(self, session: AsyncSession) -> int:
+        self.calls.append("count")
+        return 5
+
+
+async def _fetch(list_total: ListTotal, rows: FakeList, cursor: str | None = None) -> tuple[int, str | None]:
+    with track_queries({}) as stats:
+        _, total = await list_total.fetch(AsyncSession(), rows.page, rows.count, offset=0, cursor=cursor)
+    return total, stats.count_strategy
+
+
+async def test_first_page_folds_the_count_into_the_page_query_then_caches_it():
+    redis, rows = FakeRedis(), FakeList()
+    list_total = ListTotal(redis, "product:list", 60, filters=("approved", None))
+
+    assert await _fetch(list_total, rows) == (5, WINDOW)
+    assert await _fetch(list_total, rows, cursor="abc") == (5, CACHED)
+    assert rows.calls == ["page+window", "page"]
+
+
+async def test_cursor_pages_count_separately_and_uncacheable_filters_skip_redis():
+    redis, rows = FakeRedis(), FakeList()
+    list_total = ListTotal(redis, "product:list", 60, filters=None)
+
+    assert await _fetch(list_total, rows, cursor="abc") == (5, EXACT)
+    assert rows.calls == ["page", "count"]
+    assert redis.store == {}
+
+
+async def test_unfiltered_views_report_the_estimate_without_counting(monkeypatch):
+    monkeypatch.setattr(settings.db, "count_estimates", True)
+    rows = FakeList()
+
+    async def estimate(session: AsyncSession) -> int:
+        rows.calls.append("estimate")
+        return 4
+
+    list_total = ListTotal(None, "product:list", 60, filters=None, estimate=estimate)
+
+    assert await _fetch(list_total, rows) == (4, ESTIMATE)
+    assert sorted(rows.calls) == ["estimate", "page"]
@@ -0,0 +1,80 @@
+import time
+
+from app.common.cache_keys import L1_CACHE_KEYS, PRODUCT_LIST_PREFIX
+from app.infrastructure.redis.local_cache import LocalCache
+
+
+def _cache(max_bytes: int = 1024, ttl_seconds: float = 60) -> LocalCache:
+    return LocalCache({"category:list": "category:list:*", "stats": "stats"}, max_bytes=max_bytes, ttl_seconds=ttl_seconds)
+
+
+def test_only_allowlisted_keys_have_a_label():
+    cache = _cache()
+
+    assert cache.label_for("category:list:20:0") == "category:list"
+    assert cache.label_for("stats") == "stats"
+    assert cache.label_for("product:detail:x") is None
+
+
+def test_hits_and_misses_are_counted_per_label():
+    cache = _cache()
+
+    assert cache.get("stats", "stats") is None
+    cache.set("stats", "v")
+    assert cache.get("stats", "stats") == "v"
+
+    assert cache.stats()["keys"]["stats"] == {"hits": 1, "misses": 1}
+    assert cache.stats()["keys"]["category:list"] == {"hits": 0, "misses": 0}
+
+
+def test_expired_entries_are_dropped(monkeypatch):
+    cache = _cache(ttl_seconds=1)
+    cache.set("stats", "v")
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 2)
+
+    assert cache.get("stats", "stats") is None
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["bytes"] == 0
+
+
+def test_least_recently_used_entry_is_evicted_over_budget():
+    cache = _cache(max_bytes=60)
+    cache.set("category:list:a", "x" * 10)
+    cache.set("category:list:b", "x" * 10)
+    cache.get("category:list:a", "category:list")
+    cache.set("category:list:c", "x" * 20)
+
+    assert cache.get("category:list:b", "category:list") is None
+    assert cache.get("category:list:a", "category:list") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_pattern_invalidation():
+    cache = _cache()
+    cache.set("category:list:20:0", "a")
+    cache.set("stats", "b")
+
+    cache.invalidate_pattern("category:list:*")
+
+    assert cache.get("category:list:20:0", "category:list") is None
+    assert cache.get("stats", "stats") == "b"
+
+
+def test_oversized_value_drops_the_superseded_one():
+    cache = _cache(max_bytes=60)
+    cache.set("stats", "old")
+
+    cache.set("stats", "x" * 100)
+
+    assert cache.get("stats", "stats") is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_only_the_all_categories_first_product_page_is_held():
+    cache = LocalCache(L1_CACHE_KEYS, max_bytes=1024, ttl_seconds=60)
+
+    assert cache.label_for("product:list:g5:None:None:new:None:20:0:None") == PRODUCT_LIST_PREFIX
+    assert cache.label_for("product:list:g5:3:None:new:None:20:0:None") is None
+    assert cache.label_for("product:list:g5:None:None:new:None:20:20:None") is None
+    assert cache.label_for("product:list:g5:None:None:new:None:20:0:None:q=ai") is None
@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import Float, func, select
+from sqlalchemy.dialects import postgresql
+
+from app.common.pagination import SortKey, _after, decode_cursor, encode_cursor, keyset_page, split_page
+from app.domain.article.model import Article
+from app.exceptions.exceptions import ValidationError
+
+KEYS = [SortKey(Article.published_at, nullable=True), SortKey(Article.id)]
+
+
+def _sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_cursor_round_trips_typed_values():
+    published = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+    assert decode_cursor(encode_cursor([published, 42]), KEYS) == [published, 42]
+    assert decode_cursor(encode_cursor([None, 7]), KEYS) == [None, 7]
+
+
+def test_score_keys_round_trip_floats_exactly():
+    keys = [SortKey(func.similarity(Article.title, "robot", type_=Float)), SortKey(Article.id)]
+    score = 0.060792710632085800  # a float4 score, as Postgres returns it
+
+    assert decode_cursor(encode_cursor([score, 3]), keys) == [score, 3]
+    with pytest.raises(ValidationError):
+        decode_cursor(encode_cursor(["0.5", 3]), keys)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor([1]), encode_cursor(["x", None]), encode_cursor([None, 1.5])])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor, KEYS)
+
+
+def test_uniform_keys_use_a_row_comparison():
+    keys = [SortKey(Article.created_at), SortKey(Article.id)]
+
+    assert "(articles.created_at, articles.id) < (" in _sql(_after(keys, [datetime(2026, 1, 1), 5]))
+
+
+def test_nullable_keys_continue_into_the_nulls_last_tail():
+    sql = _sql(_after(KEYS, [datetime(2026, 1, 1), 5]))
+    assert "articles.published_at IS NULL" in sql
+
+    # Past the last non-NULL value only the tie-breaker advances.
+    assert _sql(_after(KEYS, [None, 5])) == "articles.published_at IS NULL AND articles.id < 5"
+
+
+def test_page_fetches_one_extra_row_to_detect_the_next_page():
+    q = keyset_page(select(Article.id), KEYS, limit=2, offset=0, cursor=None)
+    assert q._limit_clause.value == 3
+
+    items, next_cursor, _ = split_page([(1, None, 1), (2, None, 2), (3, None, 3)], limit=2)
+    assert items == [1, 2]
+    assert decode_cursor(next_cursor, KEYS) == [None, 2]
+    assert split_page([(1, None, 1)], limit=2) == ([1], None, None)
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.common.pool_metrics import PoolMetrics
+from app.core.config import settings
+from app.database.pool import InstrumentedQueuePool, instrument_pool, pool_stats
+
+
+async def test_queued_checkouts_count_as_waiters_until_they_get_a_connection():
+    metrics = PoolMetrics()
+    freed = asyncio.Event()
+
+    async def checkout() -> None:
+        with metrics.checkout(queued=True):
+            await freed.wait()
+
+    tasks = [asyncio.create_task(checkout()) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert metrics.waiters == 3
+
+    freed.set()
+    await asyncio.gather(*tasks)
+    stats = metrics.stats()
+    assert stats["waiters"] == 0
+    assert stats["peak_waiters"] == 3
+    assert stats["checkout_wait_ms"]["count"] == 3
+
+
+def test_wait_histogram_is_cumulative_and_failures_are_not_timed():
+    metrics = PoolMetrics()
+    metrics._observe_wait(0.0005)
+    metrics._observe_wait(0.02)
+    metrics._observe_wait(10)
+    with pytest.raises(TimeoutError), metrics.checkout(queued=True):
+        raise TimeoutError
+
+    stats = metrics.stats()
+    buckets = stats["checkout_wait_ms"]["buckets"]
+    assert (buckets["1"], buckets["25"], buckets["5000"], buckets["+Inf"]) == (1, 2, 2, 3)
+    assert stats["checkout_wait_ms"]["count"] == 3
+    assert stats["failed_checkouts"] == 1
+    assert stats["waiters"] == 0
+
+
+def test_connection_ages_follow_connects_and_disconnects():
+    metrics = PoolMetrics()
+    assert metrics.stats()["connection_age_seconds"]["max"] is None
+
+    first, second = object(), object()
+    metrics.connected(first)
+    metrics.connected(second)
+    metrics.disconnected(first)
+
+    assert metrics.stats()["connection_age_seconds"]["connections"] == 1
+
+
+def test_engine_pool_is_sized_from_settings():
+    engine = create_async_engine(
+        settings.db.url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.db.pool_size,
+        max_overflow=settings.db.max_overflow,
+    )
+    instrument_pool(engine)
+
+    stats = pool_stats(engine)
+    assert stats["size"] == settings.db.pool_size
+    assert (stats["checked_out"], stats["overflow"], stats["waiters"]) == (0, 0, 0)
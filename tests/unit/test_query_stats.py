@@ -0,0 +1,40 @@
+from httpx import ASGITransport, AsyncClient
+
+from app.database.query_stats import _query_stats, normalize_sql
+from app.middleware.logging import AccessLogMiddleware
+
+
+def test_normalize_sql_groups_statements_that_differ_only_in_values():
+    first = normalize_sql("SELECT p.id FROM products p\n  WHERE p.id IN ($1, $2, $3) AND p.name = 'a''b' LIMIT 10")
+    second = normalize_sql("SELECT p.id FROM products p WHERE p.id IN ($1, $2) AND p.name = 'c' LIMIT 20")
+
+    assert first == second == "SELECT p.id FROM products p WHERE p.id IN (?, ...) AND p.name = ? LIMIT ?"
+
+
+async def test_request_query_stats_are_sent_as_response_headers():
+    async def app(scope, receive, send):
+        stats = _query_stats.get()
+        stats.count, stats.total_s = 3, 0.0125
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    transport = ASGITransport(app=AccessLogMiddleware(app))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/v1/product")
+
+    assert response.headers["x-db-queries"] == "3"
+    assert response.headers["server-timing"] == 'db;dur=12.5;desc="3 queries"'
+
+
+async def test_access_log_carries_the_request_id(caplog):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    transport = ASGITransport(app=AccessLogMiddleware(app))
+    with caplog.at_level("INFO", logger="app.access"):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/api/v1/product", headers={"X-Request-ID": "req-123"})
+
+    record = next(r for r in caplog.records if r.getMessage() == "http_request")
+    assert record.request_id == "req-123"
@@ -0,0 +1,162 @@
+import asyncio
+import json
+
+from app.core.config import settings
+from app.infrastructure.redis.client import RedisClient
+
+
+class FakePipeline:
+    def __init__(self, conn: "FakeConnection") -> None:
+        self.conn = conn
+        self.queued: list = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        pass
+
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> None:
+        self.queued.append(lambda: self.conn.set(key, value, nx=nx, ex=ex))
+
+    def get(self, key: str) -> None:
+        self.queued.append(lambda: self.conn.get(key))
+
+    def delete(self, *keys: str) -> None:
+        self.queued.append(lambda: self.conn.delete(*keys))
+
+    def publish(self, channel: str, message: str) -> None:
+        self.queued.append(lambda: self.conn.publish(channel, message))
+
+    async def execute(self) -> list:
+        self.conn.round_trips += 1
+        results = []
+        for command in self.queued:
+            results.append(command())
+        await self.conn.release.wait()
+        return results
+
+
+class FakeConnection:
+    """Stands in for redis.asyncio.Redis behind RedisClient; round trips can be paused mid-flight."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.published: list[tuple[str, str]] = []
+        self.round_trips = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def get(self, key: str) -> bytes | None:
+        value = self.store.get(key)
+        return value.encode() if value is not None else None
+
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.store:
+            return False
+        self.store[key] = value
+        return True
+
+    def delete(self, *keys: str) -> int:
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    def publish(self, channel: str, message: str) -> int:
+        self.published.append((channel, message))
+        return 0
+
+
+def _client() -> tuple[RedisClient, FakeConnection]:
+    client = RedisClient()
+    conn = FakeConnection()
+    client._client = conn  # type: ignore[assignment]
+    client._subscribed = True
+    return client, conn
+
+
+async def test_missing_generation_is_seeded_and_memoized():
+    client, conn = _client()
+
+    gen = await client.get_generation("product:list")
+    conn.store["gen:product:list"] = "other"
+
+    assert conn.store["gen:product:list"] != gen
+    assert await client.get_generation("product:list") == gen
+
+
+async def test_invalidation_message_drops_memoized_generation():
+    client, conn = _client()
+    conn.store["gen:product:list"] = "1"
+    await client.get_generation("product:list")
+    conn.store["gen:product:list"] = "2"
+
+    client._apply_invalidation('{"namespaces": ["product:list"]}')
+
+    assert await client.get_generation("product:list") == "2"
+
+
+async def test_read_racing_an_invalidation_is_not_memoized():
+    client, conn = _client()
+    conn.store["gen:product:list"] = "1"
+    conn.release.clear()
+
+    read = asyncio.create_task(client.get_generation("product:list"))
+    await asyncio.sleep(0)
+    client._apply_invalidation('{"namespaces": ["product:list"]}')
+    conn.store["gen:product:list"] = "2"
+    conn.release.set()
+
+    assert await read == "1"
+    assert await client.get_generation("product:list") == "2"
+
+
+async def test_invalidate_deletes_and_bumps_in_one_round_trip():
+    client, conn = _client()
+
+    async def bump(keys, args, client):
+        client.queued.append(lambda: conn.store.__setitem__(keys[0], "2"))
+
+    client._bump_generation = bump  # type: ignore[assignment]
+    conn.store.update({"product:release_stats": "x", "gen:product:list": "1"})
+
+    await client.invalidate(keys=["product:release_stats"], namespaces=["product:list"])
+
+    assert conn.round_trips == 1
+    assert "product:release_stats" not in conn.store
+    assert conn.store["gen:product:list"] == "2"
+    assert json.loads(conn.published[0][1]) == {"keys": [], "namespaces": ["product:list"]}
+
+
+async def test_breaker_trips_and_fails_fast(monkeypatch):
+    client, conn = _client()
+    calls = 0
+
+    async def broken_get(key):
+        nonlocal calls
+        calls += 1
+        raise TimeoutError
+
+    monkeypatch.setattr(conn, "get", broken_get, raising=False)
+
+    for _ in range(settings.redis.breaker_threshold):
+        assert await client.get("product:release_stats") is None
+
+    assert not client.available
+    assert await client.get("product:release_stats") is None
+    assert calls == settings.redis.breaker_threshold
+    assert client.breaker_stats()["trips"] == 1
+
+
+async def test_undecodable_value_reads_as_a_miss(monkeypatch):
+    client, conn = _client()
+
+    async def corrupt_get(key):
+        return b"\x01not zlib"
+
+    monkeypatch.setattr(conn, "get", corrupt_get, raising=False)
+
+    assert await client.get("product:detail:x") is None
+    # The server answered, so a bad payload doesn't count against the breaker.
+    assert client.available
@@ -0,0 +1,48 @@
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.database.replicas import COMMITTED, PRIMARY_INFO, REPLICA_BIND, ReadRoutingSession, ReplicaSet
+from app.domain.product.model import Product
+
+# Engines never connect here: only routing decisions are exercised.
+primary = create_async_engine(settings.db.url).sync_engine
+replica = create_async_engine(settings.db.url).sync_engine
+
+
+def _session(primary_info: dict | None = None) -> ReadRoutingSession:
+    return ReadRoutingSession(bind=primary, info={REPLICA_BIND: replica, PRIMARY_INFO: {} if primary_info is None else primary_info})
+
+
+def test_reads_go_to_the_replica():
+    session = _session()
+
+    assert session.get_bind(clause=select(Product)) is replica
+
+
+def test_a_write_pins_the_session_to_the_primary():
+    session = _session()
+
+    assert session.get_bind(clause=insert(Product)) is primary
+    assert session.get_bind(clause=select(Product)) is primary
+
+
+def test_a_commit_on_the_request_primary_session_pins_reads_to_the_primary():
+    primary_info: dict = {}
+    session = _session(primary_info)
+    primary_info[COMMITTED] = True
+
+    assert session.get_bind(clause=select(Product)) is primary
+
+
+def test_lagging_and_unchecked_replicas_are_skipped():
+    engines = [create_async_engine(settings.db.url) for _ in range(3)]
+    replicas = ReplicaSet(engines, max_lag_seconds=5, check_seconds=1)
+    assert replicas.pick() is None
+
+    lagging, caught_up, unreachable = replicas._replicas
+    lagging.lag_seconds = 30.0
+    caught_up.lag_seconds = 0.2
+
+    assert {replicas.pick().engine for _ in range(4)} == {caught_up.engine}
+    assert [r["usable"] for r in replicas.stats()] == [False, True, False]